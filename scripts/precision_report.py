@@ -0,0 +1,9 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from censor_engine.censor_engine.tools.precision_report import main  # noqa: E402
+
+if __name__ == "__main__":
+    main()
@@ -3,11 +3,16 @@ from pathlib import Path
 from typing import Any
 
 import __main__
+from censor_engine.libs.detectors import (
+    configure_detectors,
+    warmup_detectors,
+)
 from censor_engine.models.config import Config
 from censor_engine.models.lib_models.detectors import DetectedPartSchema
 from censor_engine.paths import PathManager
 from censor_engine.typing import Image
 
+from .detection import DetectionService
 from .mixin_arguments import MixinArguments
 from .mixin_pipeline_image import MixinImagePipeline
 from .mixin_pipeline_video import MixinVideoPipeline
@@ -40,7 +45,7 @@ class CensorEngine(
     uncensored_folder: str | Path | None = None
     censored_folder: str | Path | None = None
     base_folder: Path | str = Path(__main__.__file__).resolve().parent
-    censor_mode: str = "auto"  # "preview", "image", "video", "auto"
+    censor_mode: str = "auto"  # "preview", "image", "video", "detect", "auto"
     config_data: str | dict[str, Any] = "00_default.yml"
 
     # Test Stuff
@@ -63,6 +68,10 @@ class CensorEngine(
     _config: Config = field(init=False)
     _durations: list[str] = field(default_factory=list, init=False)
     _path_manager: PathManager = field(init=False)
+    _detection_service: DetectionService = field(
+        init=False,
+        default_factory=DetectionService,
+    )
 
     def __post_init__(self):
         # Conversions
@@ -101,6 +110,10 @@ class CensorEngine(
             self._config.file_settings.uncensored_folder = Path()
             self._config.file_settings.censored_folder = Path()
 
+        # Detect Only (Fills the Cache, No Censored Output)
+        elif self._flags["detect_only"]:
+            self.censor_mode = "detect"
+
         # Finalise PathManager
         self._path_manager = PathManager(
             self.base_folder,  # type: ignore
@@ -124,6 +137,45 @@ class CensorEngine(
         if self._flags["show_stat_metrics"] and len(self._time_durations) != 0:
             self.display_bulk_stats(self._time_durations)
 
+    def warmup(self) -> None:
+        """
+        This loads the detectors' models ahead of time.
+
+        The models are otherwise loaded on the first detection, this is for
+        long running processes that want to pay for it upfront.
+
+        """
+        configure_detectors(self._config)
+        warmup_detectors(self._config)
+
+    def detect(self) -> None:
+        """
+        This runs the detectors over every image and video and fills their
+        caches, without censoring anything. Runs afterwards (with any
+        censoring config using the same AI settings) then read the cache
+        rather than loading the models.
+
+        Used by the detect only mode (`--detect-only`).
+
+        """
+        indexed_files = self._find_files(self._path_manager)
+        try:
+            self._image_detection_pipeline(
+                indexed_files,
+                self._config,
+                self._path_manager,
+                self._detection_service,
+            )
+            self.run_video_detection_pipeline(
+                indexed_files,
+                self._config,
+                self._get_index_text,
+                self._path_manager,
+                self._detection_service,
+            )
+        finally:
+            self._detection_service.close()
+
     def start(self) -> list[Image]:
         """
         This is the main entrypoint for censorengine.
@@ -134,6 +186,10 @@ class CensorEngine(
 
         :return list[Image]: List of censored images.
         """
+        if self.censor_mode == "detect":
+            self.detect()
+            return []
+
         # Find Files
         args: dict[str, Any] = {
             "main_files_path": self.base_folder,
@@ -143,6 +199,7 @@ class CensorEngine(
             "function_get_index": self._get_index_text,
             "flags": self._flags,
             "path_manager": self._path_manager,
+            "detection_service": self._detection_service,
             "inline_mode": self._test_mode,
             "_test_detection_output": self._test_detection_output,
         }
@@ -152,13 +209,16 @@ class CensorEngine(
 
         # What to Censor
         memory_files: list[Image] = []
-        if self.censor_mode in {"image", "preview"}:
-            memory_files.extend(self._image_pipeline(**args))
-        elif self.censor_mode == "video":
-            memory_files.extend(self.run_video_pipeline(**video_args))
-        else:
-            memory_files.extend(self._image_pipeline(**args))
-            memory_files.extend(self.run_video_pipeline(**video_args))
+        try:
+            if self.censor_mode in {"image", "preview"}:
+                memory_files.extend(self._image_pipeline(**args))
+            elif self.censor_mode == "video":
+                memory_files.extend(self.run_video_pipeline(**video_args))
+            else:
+                memory_files.extend(self._image_pipeline(**args))
+                memory_files.extend(self.run_video_pipeline(**video_args))
+        finally:
+            self._detection_service.close()
         self.display_times()
 
         return memory_files
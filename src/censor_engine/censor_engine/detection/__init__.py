@@ -0,0 +1,9 @@
+from .base import DetectionRequest, detect_parts, order_detected_parts
+from .service import DetectionService
+
+__all__ = [
+    "DetectionRequest",
+    "DetectionService",
+    "detect_parts",
+    "order_detected_parts",
+]
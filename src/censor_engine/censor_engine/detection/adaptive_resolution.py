@@ -0,0 +1,111 @@
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from censor_engine.models.lib_models.detectors import DetectedPartSchema
+
+"""
+This is used for `video_settings.adaptive_resolution`, the first frames of a
+video are detected at the models' full input size to measure how big the
+parts are as the models see them, then the rest are detected at the smallest
+input size (the models' size divided by a factor) that keeps those parts
+above `adaptive_minimum_part_size`. Close-ups are detected at a small input
+size, wide shots at the full one.
+
+"""
+
+SAMPLE_FRAMES = 5  # Frames Detected at the Full Input Size per Check
+PART_SIZE_PERCENTILE = 10  # Smaller Parts Count, but Not Single Outliers
+
+
+@dataclass(slots=True)
+class AdaptiveResolution:
+    """
+    This picks the input factor of each detection batch of a video, what
+    the models' input size is divided by (see `InputForm.scaled()`).
+
+    The video starts out sampling (`SAMPLE_FRAMES` detected frames at the
+    full input size), after which the factor is raised as far as the
+    measured part sizes allow. Every `recheck_interval` detected frames it
+    samples again, or straight away when a part is found below the minimum
+    size (e.g., the shot zoomed out).
+
+    A planner is kept per video and used in frame order, on the detection
+    thread.
+
+    :param int maximum_factor: Highest input factor allowed
+    :param int minimum_part_size: Smallest side (in pixels) the parts should
+        keep at the models' input
+    :param int recheck_interval: Detected frames between checks
+    """
+
+    maximum_factor: int
+    minimum_part_size: int
+    recheck_interval: int
+
+    factor: int = field(init=False, default=1)
+    _sampling_left: int = field(init=False, default=SAMPLE_FRAMES)
+    _since_check: int = field(init=False, default=0)
+    _part_sizes: list[float] = field(init=False, default_factory=list)
+
+    def observe(
+        self,
+        detected_parts: list[list[DetectedPartSchema]],
+        factor: int,
+        model_scale: float,
+    ) -> None:
+        """
+        Measures the parts of a detected batch and moves the factor for the
+        next batch. The batch is judged as one sample, at the factor it was
+        detected at.
+
+        :param list[list[DetectedPartSchema]] detected_parts: Parts of each
+            detected frame, at full resolution
+        :param int factor: Input factor the batch was detected at
+        :param float model_scale: Scale from the full resolution frame to the
+            models' full input size
+        """
+        sizes = [
+            min(part.relative_box[2:]) * model_scale
+            for parts in detected_parts
+            for part in parts
+        ]  # At the Full Input Size
+
+        # Sampling (Only at the Full Input Size)
+        if self._sampling_left > 0:
+            if factor == 1:
+                self._part_sizes.extend(sizes)
+                self._sampling_left -= len(detected_parts)
+                if self._sampling_left <= 0:
+                    self._sampling_left = 0
+                    self.factor = self.__pick_factor()
+                    self._since_check = 0
+            return
+
+        # Recheck (Periodically, or When Parts Get Too Small)
+        self._since_check += len(detected_parts)
+        if self._since_check >= self.recheck_interval or any(
+            size / factor < self.minimum_part_size for size in sizes
+        ):
+            self.__start_sampling()
+
+    def __start_sampling(self) -> None:
+        self.factor = 1
+        self._sampling_left = SAMPLE_FRAMES
+        self._part_sizes.clear()
+
+    def __pick_factor(self) -> int:
+        """
+        Picks the highest factor that keeps the sampled parts above the
+        minimum size, with no parts found the full input size is kept.
+
+        :return int: Input factor
+        """
+        if not self._part_sizes:
+            return 1
+
+        part_size = float(
+            np.percentile(self._part_sizes, PART_SIZE_PERCENTILE)
+        )
+        factor = int(part_size // self.minimum_part_size)
+        return min(max(factor, 1), self.maximum_factor)
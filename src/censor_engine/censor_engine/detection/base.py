@@ -0,0 +1,577 @@
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from censor_engine.libs.detectors import (
+    configure_detectors,
+    get_enabled_detectors,
+)
+from censor_engine.libs.detectors.preprocessing import SharedPreprocessing
+from censor_engine.models.caching import Cache
+from censor_engine.models.caching.caching_schemas import (
+    AIOutputData,
+    InferenceSettings,
+)
+from censor_engine.models.config import Config
+from censor_engine.models.lib_models.detectors import (
+    DetectedPartSchema,
+    Detector,
+)
+from censor_engine.typing import Image
+
+from .crops import CropRedetector, Region
+from .mapping import downscale_image, map_parts_to_image
+from .scene_gate import PREVIOUS_PARTS, SceneGate
+from .tiling import merge_duplicate_parts, tile_regions
+from .video_state import VideoDetectionState
+
+
+@dataclass(slots=True)
+class DetectionRequest:
+    """
+    This is a single image (or frame) waiting to go through the detectors.
+
+    :param Image image: Decoded image or frame
+    :param Cache | None cache: Cache of the file, checked before detecting
+    :param int | None frame: Frame number for videos, None for images
+    :param tuple[int, ...] | None original_shape: Shape of the full
+        resolution image when `image` is already at the detection resolution
+        (see `ai_settings.ai_model_downscale_factor`), defaults to None
+    """
+
+    image: Image
+    cache: Cache | None = None
+    frame: int | None = None
+    original_shape: tuple[int, ...] | None = None
+
+
+@dataclass(slots=True)
+class DetectorSetup:
+    """
+    This keeps the detectors configured for a config, so they're configured
+    once per config rather than once per batch (configuring them with other
+    AI settings unloads their models).
+
+    """
+
+    _config: Config | None = field(init=False, default=None)
+    _detectors: list[Detector] = field(init=False, default_factory=list)
+
+    def get(self, config: Config) -> list[Detector]:
+        """
+        Gets the detectors for the config, configuring them if the config
+        changed since the last call.
+
+        :param Config config: Config, used for the enabled detectors and AI
+            settings
+        :return list[Detector]: Configured detectors
+        """
+        if config is not self._config:
+            self._detectors = configure_detectors(config)
+            self._config = config
+        return self._detectors
+
+
+def order_detected_parts(
+    parts: list[DetectedPartSchema],
+) -> list[DetectedPartSchema]:
+    """
+    Sorts the parts by their position (top to bottom, left to right) and
+    labels their ID based on it.
+
+    :param list[DetectedPartSchema] parts: Found parts
+    :return list[DetectedPartSchema]: Sorted and labelled parts
+    """
+    parts.sort(
+        key=lambda part: (part.relative_box[1], part.relative_box[0]),
+    )
+
+    for index, part in enumerate(parts, start=1):
+        part.set_part_id(index)
+
+    return parts
+
+
+def run_detectors(
+    detectors: list[Detector],
+    images: list[Image],
+    batch_size: int,
+    executor: ThreadPoolExecutor | None = None,
+    *,
+    scale_up: list[bool] | None = None,
+    input_factor: int = 1,
+) -> list[list[DetectedPartSchema]]:
+    """
+    Runs the detectors over the images, the images are sent in
+    groups of `batch_size` so the model is called once per group rather than
+    once per image.
+
+    Multiple detectors are run at once on the executor (the detection
+    service's long lived one), in theory it should only work marginally do
+    to the bottleneck of using the GPU (or CPU), however it's still a minor
+    improvement. A single detector is just run on the calling thread.
+
+    The preprocessing (letterboxing, tensor layout) is shared, each distinct
+    input form the detectors ask for is only computed once for the images.
+
+    :param list[Detector] detectors: Detectors to run
+    :param list[Image] images: Images to detect
+    :param int batch_size: Amount of images per model call
+    :param ThreadPoolExecutor | None executor: Executor for running the
+        detectors at once, defaults to None (one is made if needed)
+    :param list[bool] | None scale_up: Whether each image is enlarged to the
+        models' input size, defaults to None (every image)
+    :param int input_factor: Factor the models' input size is divided by,
+        defaults to 1
+    :return list[list[DetectedPartSchema]]: Found parts, per image
+    """
+    preprocessed = SharedPreprocessing(images, scale_up, input_factor)
+
+    def detect(detector: Detector) -> dict[int, list[DetectedPartSchema]]:
+        return detector.detect_batch(images, batch_size, preprocessed)
+
+    if len(detectors) <= 1:
+        detector_outputs = [detect(detector) for detector in detectors]
+    elif executor is not None:
+        detector_outputs = list(executor.map(detect, detectors))
+    else:
+        with ThreadPoolExecutor() as temporary_executor:
+            detector_outputs = list(temporary_executor.map(detect, detectors))
+
+    return [
+        list(
+            itertools.chain.from_iterable(
+                output.get(index, []) for output in detector_outputs
+            )
+        )
+        for index in range(len(images))
+    ]
+
+
+def detect_images(
+    detectors: list[Detector],
+    images: list[Image],
+    config: Config,
+    executor: ThreadPoolExecutor | None = None,
+    crops: list[list[Region] | None] | None = None,
+    *,
+    input_factor: int = 1,
+) -> list[list[DetectedPartSchema]]:
+    """
+    Runs the detectors over the images, when `ai_settings.tiled_detection`
+    is on, images larger than a tile are also split into overlapping tiles.
+    Images can also be detected through crops (see `CropRedetector`) rather
+    than whole, crops aren't enlarged to the models' input size, so they
+    cost the models a fraction of a full frame. Every tile, crop, and image
+    is sent through the detectors together, then their parts are mapped back
+    onto their image and merged.
+
+    :param list[Detector] detectors: Detectors to run
+    :param list[Image] images: Images to detect
+    :param Config config: Config, used for the batch size and AI settings
+    :param ThreadPoolExecutor | None executor: Executor for running the
+        detectors at once, defaults to None
+    :param list[list[Region] | None] | None crops: Crops of each image (None
+        for the whole image), defaults to None (every image is whole)
+    :param int input_factor: Factor the models' input size is divided by
+        (see `video_settings.adaptive_resolution`), defaults to 1
+    :return list[list[DetectedPartSchema]]: Found parts, per image
+    """
+    ai_settings = config.ai_settings
+    batch_size = config.rendering_settings.batch_size
+    if crops is None and not ai_settings.tiled_detection:
+        return run_detectors(
+            detectors, images, batch_size, executor, input_factor=input_factor
+        )
+
+    # Split Into Crops or Tiles (Crops Are Detected at Their Own Size)
+    regions: list[tuple[int, Region]] = []
+    scale_up: list[bool] = []
+    for position, image in enumerate(images):
+        if crops is not None and (image_crops := crops[position]) is not None:
+            regions.extend((position, crop) for crop in image_crops)
+            scale_up.extend(False for _ in image_crops)
+            continue
+
+        height, width = image.shape[:2]
+        image_regions = [(0, 0, width, height)]  # Whole Image
+        if (
+            ai_settings.tiled_detection
+            and max(height, width) > ai_settings.tile_size
+        ):
+            image_regions.extend(
+                tile_regions(
+                    image.shape,
+                    ai_settings.tile_size,
+                    ai_settings.tile_overlap,
+                )
+            )
+        regions.extend((position, region) for region in image_regions)
+        scale_up.extend(True for _ in image_regions)
+
+    # Detect and Map Back
+    found_parts: list[list[DetectedPartSchema]] = [[] for _ in images]
+    detected_parts = run_detectors(
+        detectors,
+        [
+            images[position][y : y + height, x : x + width]
+            for position, (x, y, width, height) in regions
+        ],
+        batch_size,
+        executor,
+        scale_up=scale_up,
+        input_factor=input_factor,
+    )
+    for (position, (x, y, _, _)), parts in zip(
+        regions, detected_parts, strict=True
+    ):
+        found_parts[position].extend(
+            map_parts_to_image(
+                parts, (1.0, 1.0), images[position].shape, (x, y)
+            )
+        )
+
+    return [merge_duplicate_parts(parts) for parts in found_parts]
+
+
+def _detect_requests(
+    requests: list[DetectionRequest],
+    detectors: list[Detector],
+    config: Config,
+    executor: ThreadPoolExecutor | None,
+    *,
+    crop_redetector: CropRedetector | None,
+    downscale_factor: int,
+    input_factor: int,
+) -> tuple[list[list[DetectedPartSchema]], list[bool]]:
+    """
+    Sends the requests through the detectors (downscaled, and cropped when
+    re-detecting crops) and maps the parts back to full resolution.
+
+    :param list[DetectionRequest] requests: Images (or frames) to detect
+    :param list[Detector] detectors: Configured detectors
+    :param Config config: Config, used for the batch size and AI settings
+    :param ThreadPoolExecutor | None executor: Executor for running the
+        detectors at once
+    :param CropRedetector | None crop_redetector: Crop re-detector of the
+        video, None to detect the whole images
+    :param int downscale_factor: Factor the images are shrunk by
+    :param int input_factor: Factor the models' input size is divided by
+    :return tuple[list[list[DetectedPartSchema]], list[bool]]: Found parts,
+        and whether only crops were detected, per request
+    """
+    detection_images = [
+        downscale_image(
+            request.image, downscale_factor, request.original_shape
+        )
+        for request in requests
+    ]
+
+    crops = None
+    if crop_redetector is not None:
+        crops = crop_redetector.plan(detection_images)
+    detected_parts = detect_images(
+        detectors,
+        detection_images,
+        config,
+        executor,
+        crops,
+        input_factor=input_factor,
+    )
+    if crop_redetector is not None:
+        crop_redetector.update(detected_parts[-1])
+
+    # Map to Full Resolution
+    full_parts = []
+    for request, detection_image, parts in zip(
+        requests, detection_images, detected_parts, strict=True
+    ):
+        full_shape = request.original_shape or request.image.shape
+        if detection_image.shape[:2] != full_shape[:2]:
+            full_height, full_width = full_shape[:2]
+            height, width = detection_image.shape[:2]
+            parts = map_parts_to_image(  # noqa: PLW2901
+                parts,
+                (full_width / width, full_height / height),
+                full_shape,
+            )
+        full_parts.append(parts)
+
+    cropped = [crop is not None for crop in crops or [None] * len(requests)]
+    return full_parts, cropped
+
+
+def _get_model_scale(
+    detectors: list[Detector],
+    request: DetectionRequest,
+    downscale_factor: int,
+) -> float:
+    """
+    Gets the scale from a full resolution frame to the smallest input of the
+    detectors (at its full size), i.e., how big the parts are to the models.
+    Without a letterboxing detector, the detection resolution is used.
+
+    :param list[Detector] detectors: Detectors that were run
+    :param DetectionRequest request: A frame of the video
+    :param int downscale_factor: Factor the frames are shrunk by
+    :return float: Scale from the frame to the models' input
+    """
+    full_shape = request.original_shape or request.image.shape
+    full_height, full_width = full_shape[:2]
+    input_size = min(
+        (
+            size
+            for detector in detectors
+            if (size := detector.input_size) is not None
+        ),
+        default=None,
+    )
+    if input_size is None:
+        return 1 / max(downscale_factor, 1)
+    return input_size / max(full_height, full_width)
+
+
+def _get_detection_setup(config: Config) -> tuple[str, InferenceSettings]:
+    """
+    Gets what the cache entries of a run are made with, the enabled
+    detectors (without loading them) and how they're run.
+
+    :param Config config: Config of the run
+    :return tuple[str, InferenceSettings]: Model name and inference settings
+    """
+    ai_settings = config.ai_settings
+    model_name = "+".join(
+        detector.model_name for detector in get_enabled_detectors(config)
+    )
+    return model_name, InferenceSettings(
+        inference_backend=ai_settings.inference_backend,
+        inference_precision=ai_settings.inference_precision,
+        cascade_band=(
+            ai_settings.cascade_uncertainty_band
+            if ai_settings.cascade_models
+            else None
+        ),
+    )
+
+
+def _cache_matches(
+    cached_output: AIOutputData,
+    config: Config,
+    detection_setup: tuple[str, InferenceSettings] | None = None,
+) -> bool:
+    """
+    Checks if a cache entry was made with the same detectors, inference
+    settings (backend, precision, cascade), and detection settings. With
+    `video_settings.adaptive_resolution`, entries at any input factor it
+    could pick are used (as are entries at the full input size). Entries of
+    frames only detected around their tracked parts are only used when
+    re-detecting crops, and entries of frames that reused the parts of an
+    earlier frame only with the scene gate on.
+
+    :param AIOutputData cached_output: Cache entry
+    :param Config config: Config of the run
+    :param tuple[str, InferenceSettings] | None detection_setup: Setup of
+        the run (see `_get_detection_setup()`), defaults to None (got from
+        the config)
+    :return bool: True if the entry can be used
+    """
+    model_name, inference = detection_setup or _get_detection_setup(config)
+    if (
+        cached_output.model_name != model_name
+        or cached_output.inference != inference
+        or cached_output.tiled != config.ai_settings.tiled_detection
+    ):
+        return False
+
+    # Crops Can Miss New Parts, Only Used when Re-Detecting Crops
+    if (
+        cached_output.crop_redetected
+        and not config.video_settings.crop_redetection
+    ):
+        return False
+
+    # Reused Parts Can Miss Changes, Only Used with the Scene Gate
+    if (
+        cached_output.scene_reused
+        and config.video_settings.frame_difference_threshold <= 0
+    ):
+        return False
+
+    if (
+        cached_output.downscale_factor
+        != config.ai_settings.ai_model_downscale_factor
+    ):
+        return False
+
+    # Smaller Inputs, Only Used by the Adaptive Resolution
+    maximum_factor = (
+        config.video_settings.adaptive_maximum_downscale_factor
+        if config.video_settings.adaptive_resolution
+        else 1
+    )
+    return cached_output.input_factor <= maximum_factor
+
+
+def _reuse_parts(
+    scene_gate: SceneGate,
+    sources: list[int],
+    missing_indices: list[int],
+    found_parts: list[list[DetectedPartSchema]],
+    cropped: dict[int, bool],
+) -> None:
+    """
+    Fills in the frames the scene gate skipped with copies of their source's
+    parts (see `SceneGate.plan()`), then keeps the last frame's parts for
+    the next call.
+
+    :param SceneGate scene_gate: Scene gate of the video
+    :param list[int] sources: Source of each missing frame
+    :param list[int] missing_indices: Requests not found in the cache
+    :param list[list[DetectedPartSchema]] found_parts: Parts of every
+        request, filled in place
+    :param dict[int, bool] cropped: If each request was detected around
+        crops, filled in place
+    """
+    for position, index in enumerate(missing_indices):
+        source = sources[position]
+        if source == position:
+            continue
+
+        if source == PREVIOUS_PARTS:
+            source_parts = scene_gate.parts
+            cropped[index] = scene_gate.parts_cropped
+        else:
+            source_parts = found_parts[missing_indices[source]]
+            cropped[index] = cropped[missing_indices[source]]
+        found_parts[index] = [part.model_copy() for part in source_parts]
+
+    scene_gate.parts = found_parts[missing_indices[-1]]
+    scene_gate.parts_cropped = cropped[missing_indices[-1]]
+
+
+def detect_parts(
+    requests: list[DetectionRequest],
+    config: Config,
+    executor: ThreadPoolExecutor | None = None,
+    video_state: VideoDetectionState | None = None,
+    detector_setup: DetectorSetup | None = None,
+) -> list[list[DetectedPartSchema]]:
+    """
+    This is the detection stage, it checks the cache for every request and
+    sends the rest through the detectors together.
+
+    Videos keep a detection state between batches, with its scene gate
+    (`video_settings.frame_difference_threshold`) the requests that barely
+    differ from the last detected frame reuse its parts instead, and with its
+    crop re-detector (`video_settings.crop_redetection`) most frames are
+    only detected around the parts found last.
+
+    When `ai_settings.ai_model_downscale_factor` is above 1, the detectors
+    receive a shrunk copy of the image and the found boxes are mapped back to
+    full resolution before being cached. With its adaptive resolution
+    (`video_settings.adaptive_resolution`), the models' input size is picked
+    per batch of a video. The cache entries remember the detectors,
+    inference settings, factors, and tiling, so entries made with different
+    settings are detected again.
+
+    :param list[DetectionRequest] requests: Images (or frames) to detect
+    :param Config config: Config, used for the batch size and AI settings
+    :param ThreadPoolExecutor | None executor: Executor for running the
+        detectors at once, defaults to None
+    :param VideoDetectionState | None video_state: Detection state of the
+        video, defaults to None (every request is detected whole)
+    :param DetectorSetup | None detector_setup: Detectors kept between
+        calls, only configured when something has to be detected, defaults
+        to None (configured for this call)
+    :return list[list[DetectedPartSchema]]: Found parts in the same order as
+        the requests
+    """
+    tiled = config.ai_settings.tiled_detection
+    video_state = video_state or VideoDetectionState()
+    scene_gate = video_state.scene_gate
+    resolution = video_state.resolution
+    downscale_factor = config.ai_settings.ai_model_downscale_factor
+    input_factor = resolution.factor if resolution is not None else 1
+
+    found_parts: list[list[DetectedPartSchema]] = [[] for _ in requests]
+
+    # Check Cache
+    detection_setup = _get_detection_setup(config)
+    missing_indices: list[int] = []
+    for index, request in enumerate(requests):
+        cached_output = request.cache and request.cache.find_frame(
+            request.frame
+        )
+        if cached_output and _cache_matches(
+            cached_output, config, detection_setup
+        ):
+            found_parts[index] = cached_output.output_data
+            continue
+        missing_indices.append(index)
+
+    # Skip Unchanged Frames
+    sources = list(range(len(missing_indices)))
+    if scene_gate is not None:
+        sources = scene_gate.plan(
+            [requests[index].image for index in missing_indices]
+        )
+    detect_indices = [
+        index
+        for position, index in enumerate(missing_indices)
+        if sources[position] == position
+    ]
+
+    # Detect Missing
+    cropped: dict[int, bool] = {}
+    if detect_indices:
+        detector_setup = detector_setup or DetectorSetup()
+        detectors = detector_setup.get(config)
+        detected_parts, detected_cropped = _detect_requests(
+            [requests[index] for index in detect_indices],
+            detectors,
+            config,
+            executor,
+            crop_redetector=video_state.crop_redetector,
+            downscale_factor=downscale_factor,
+            input_factor=input_factor,
+        )
+        for index, parts, is_cropped in zip(
+            detect_indices, detected_parts, detected_cropped, strict=True
+        ):
+            found_parts[index] = parts
+            cropped[index] = is_cropped
+
+        if resolution is not None:
+            resolution.observe(
+                detected_parts,
+                input_factor,
+                _get_model_scale(
+                    detectors, requests[detect_indices[0]], downscale_factor
+                ),
+            )
+
+    # Reuse the Parts of Unchanged Frames
+    if scene_gate is not None and missing_indices:
+        _reuse_parts(
+            scene_gate, sources, missing_indices, found_parts, cropped
+        )
+
+    # Save to Cache (Reused Parts are Flagged, see `_cache_matches()`)
+    for index in missing_indices:
+        request = requests[index]
+        if request.cache:
+            request.cache.save_frame(
+                request.frame,
+                AIOutputData(
+                    model_name=detection_setup[0],
+                    output_data=found_parts[index],
+                    downscale_factor=downscale_factor,
+                    tiled=tiled,
+                    input_factor=input_factor,
+                    crop_redetected=cropped[index],
+                    scene_reused=index not in detect_indices,
+                    inference=detection_setup[1],
+                ),
+            )
+
+    return [order_detected_parts(parts) for parts in found_parts]
@@ -0,0 +1,123 @@
+from dataclasses import dataclass, field
+
+from censor_engine.models.lib_models.detectors import DetectedPartSchema
+from censor_engine.typing import Image
+
+"""
+This is used for `video_settings.crop_redetection`, between full frame
+detections the detectors only look at padded crops around the parts found
+last, which is a lot cheaper for high resolution videos where the parts are
+small compared to the frame.
+
+"""
+
+Region = tuple[int, int, int, int]  # X, Y, Width, Height
+
+
+def _overlaps(region_a: Region, region_b: Region) -> bool:
+    ax, ay, aw, ah = region_a
+    bx, by, bw, bh = region_b
+    return ax < bx + bw and bx < ax + aw and ay < by + bh and by < ay + ah
+
+
+def _union(region_a: Region, region_b: Region) -> Region:
+    ax, ay, aw, ah = region_a
+    bx, by, bw, bh = region_b
+    x, y = min(ax, bx), min(ay, by)
+    return (x, y, max(ax + aw, bx + bw) - x, max(ay + ah, by + bh) - y)
+
+
+def crop_regions(
+    boxes: list[Region],
+    image_shape: tuple[int, ...],
+    padding: float,
+) -> list[Region]:
+    """
+    Pads the boxes (by a share of their size on each side) and keeps them
+    inside the image, overlapping crops are joined so nothing is detected
+    twice.
+
+    :param list[Region] boxes: Boxes to crop around (X, Y, Width, Height)
+    :param tuple[int, ...] image_shape: Shape of the image
+    :param float padding: Share of a box's size added on each side
+    :return list[Region]: Crops (X, Y, Width, Height)
+    """
+    height, width = image_shape[:2]
+
+    regions: list[Region] = []
+    for x, y, box_width, box_height in boxes:
+        pad_x, pad_y = round(box_width * padding), round(box_height * padding)
+        left, top = max(x - pad_x, 0), max(y - pad_y, 0)
+        right = min(x + box_width + pad_x, width)
+        bottom = min(y + box_height + pad_y, height)
+        if right <= left or bottom <= top:
+            continue
+
+        # Join Overlapping Crops (Until None Overlap)
+        region = (left, top, right - left, bottom - top)
+        while overlapping := [r for r in regions if _overlaps(r, region)]:
+            for other in overlapping:
+                regions.remove(other)
+                region = _union(region, other)
+        regions.append(region)
+
+    return regions
+
+
+@dataclass(slots=True)
+class CropRedetector:
+    """
+    This picks what the detectors look at for each frame of a video, the
+    full frame every `full_frame_interval` detected frames (or when nothing
+    is being tracked), otherwise crops around the parts of the last detected
+    frame.
+
+    A re-detector is kept per video and used in frame order, on the
+    detection thread (so it tracks the detections rather than the
+    render-side `Tracker`, which is a batch behind).
+
+    :param int full_frame_interval: Detected frames per full frame detection
+    :param float padding: Share of a part's size added to each side of its
+        crop
+    """
+
+    full_frame_interval: int
+    padding: float
+
+    _tracked_boxes: list[Region] = field(init=False, default_factory=list)
+    _since_full_frame: int | None = field(init=False, default=None)
+
+    def plan(self, images: list[Image]) -> list[list[Region] | None]:
+        """
+        Picks the crops of each frame, the crops are around the parts known
+        before these frames.
+
+        :param list[Image] images: Frames to detect, in order
+        :return list[list[Region] | None]: Crops of each frame, None for the
+            full frame
+        """
+        plans: list[list[Region] | None] = []
+        for image in images:
+            if (
+                not self._tracked_boxes
+                or self._since_full_frame is None
+                or self._since_full_frame + 1 >= self.full_frame_interval
+            ):
+                self._since_full_frame = 0
+                plans.append(None)
+                continue
+
+            self._since_full_frame += 1
+            plans.append(
+                crop_regions(self._tracked_boxes, image.shape, self.padding)
+            )
+        return plans
+
+    def update(self, parts: list[DetectedPartSchema]) -> None:
+        """
+        Tracks the parts of the last detected frame.
+
+        :param list[DetectedPartSchema] parts: Parts of the frame, in the
+            coordinates of the detected image
+        """
+        self._tracked_boxes = [part.relative_box for part in parts]
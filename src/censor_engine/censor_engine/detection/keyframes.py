@@ -0,0 +1,111 @@
+import numpy as np
+
+from censor_engine.models.enums import KeyframeInterpolation
+from censor_engine.models.lib_models.detectors import DetectedPartSchema
+from censor_engine.models.structs.boxes import (
+    assign_pairs,
+    iou_matrix,
+    xywh_to_xyxy,
+)
+
+from .base import order_detected_parts
+
+"""
+This is used for `video_settings.censoring_fps`, the detectors only run on
+every Nth frame (the keyframes) and the frames in between get their parts
+from the surrounding keyframes.
+
+"""
+
+
+def keyframe_interval(source_fps: float, censoring_fps: int) -> int:
+    """
+    Works out how many frames there are per keyframe.
+
+    :param float source_fps: FPS of the video
+    :param int censoring_fps: Detections per second, -1 (or 0) for every
+        frame
+    :return int: Frames per keyframe, 1 means every frame is detected
+    """
+    if censoring_fps <= 0 or source_fps <= censoring_fps:
+        return 1
+    return max(round(source_fps / censoring_fps), 1)
+
+
+def match_parts(
+    start_parts: list[DetectedPartSchema],
+    end_parts: list[DetectedPartSchema],
+) -> list[tuple[int, int]]:
+    """
+    Pairs the parts of two keyframes, a pair has the same label and
+    overlapping boxes. The most overlapping pairs are picked first.
+
+    :param list[DetectedPartSchema] start_parts: Parts of the first keyframe
+    :param list[DetectedPartSchema] end_parts: Parts of the second keyframe
+    :return list[tuple[int, int]]: Indices of the paired parts
+    """
+    if not start_parts or not end_parts:
+        return []
+
+    ious = iou_matrix(
+        xywh_to_xyxy([part.relative_box for part in start_parts]),
+        xywh_to_xyxy([part.relative_box for part in end_parts]),
+    )
+    same_label = np.array(
+        [[a.label == b.label for b in end_parts] for a in start_parts]
+    )
+    return assign_pairs(ious, same_label & (ious > 0))
+
+
+def interpolate_parts(
+    start_parts: list[DetectedPartSchema],
+    end_parts: list[DetectedPartSchema],
+    position: float,
+    method: KeyframeInterpolation = KeyframeInterpolation.LINEAR,
+) -> list[DetectedPartSchema]:
+    """
+    Gets the parts of a frame in between two keyframes.
+
+    With linear interpolation, the paired parts move (and fade their score)
+    from one keyframe to the other, parts only found in one of them are kept
+    for the half of the gap closest to it. Hold just keeps the start parts.
+
+    :param list[DetectedPartSchema] start_parts: Parts of the keyframe before
+    :param list[DetectedPartSchema] end_parts: Parts of the keyframe after
+    :param float position: Where the frame sits between them (0 to 1)
+    :param KeyframeInterpolation method: How to fill the frame, defaults to
+        linear
+    :return list[DetectedPartSchema]: Parts of the frame
+    """
+    if method == KeyframeInterpolation.HOLD:
+        return order_detected_parts(
+            [part.model_copy() for part in start_parts]
+        )
+
+    pairs = match_parts(start_parts, end_parts)
+    parts = []
+    for start_index, end_index in pairs:
+        start_part, end_part = start_parts[start_index], end_parts[end_index]
+        box = np.round(
+            np.multiply(start_part.relative_box, 1 - position)
+            + np.multiply(end_part.relative_box, position)
+        ).astype(int)
+        parts.append(
+            DetectedPartSchema(
+                label=start_part.label,
+                score=start_part.score * (1 - position)
+                + end_part.score * position,
+                relative_box=tuple(box.tolist()),
+            )
+        )
+
+    # Unpaired Parts Stay Until the Halfway Point
+    if position < 0.5:  # noqa: PLR2004
+        paired = {start_index for start_index, _ in pairs}
+        unpaired = [p for i, p in enumerate(start_parts) if i not in paired]
+    else:
+        paired = {end_index for _, end_index in pairs}
+        unpaired = [p for i, p in enumerate(end_parts) if i not in paired]
+    parts.extend(part.model_copy() for part in unpaired)
+
+    return order_detected_parts(parts)
@@ -0,0 +1,85 @@
+import cv2
+
+from censor_engine.models.lib_models.detectors import DetectedPartSchema
+from censor_engine.typing import Image
+
+
+def downscale_image(
+    image: Image,
+    downscale_factor: int,
+    original_shape: tuple[int, ...] | None = None,
+) -> Image:
+    """
+    Shrinks the image by the downscale factor before it's sent to the
+    detectors.
+
+    :param Image image: Full resolution image, or an already shrunk copy of
+        it (with `original_shape`)
+    :param int downscale_factor: Factor to divide the full dimensions by
+    :param tuple[int, ...] | None original_shape: Shape of the full
+        resolution image, defaults to None (the image is full resolution)
+    :return Image: Downscaled image (or the same image if it's already that
+        size or smaller)
+    """
+    height, width = (original_shape or image.shape)[:2]
+    size = (
+        max(width // max(downscale_factor, 1), 1),
+        max(height // max(downscale_factor, 1), 1),
+    )
+    if size[0] >= image.shape[1] and size[1] >= image.shape[0]:
+        return image  # Never Enlarged
+
+    return cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+
+
+def map_parts_to_image(
+    parts: list[DetectedPartSchema],
+    scale: tuple[float, float],
+    image_shape: tuple[int, ...],
+    offset: tuple[int, int] = (0, 0),
+) -> list[DetectedPartSchema]:
+    """
+    Maps the boxes found on a resized (or cropped) copy of an image back to
+    the coordinates of the original image.
+
+    :param list[DetectedPartSchema] parts: Parts found on the copy
+    :param tuple[float, float] scale: X and Y scale from the copy to the
+        original
+    :param tuple[int, ...] image_shape: Shape of the original image, used to
+        keep the boxes inside of it
+    :param tuple[int, int] offset: Position of the copy's top left in the
+        original, defaults to (0, 0)
+    :return list[DetectedPartSchema]: Parts in the original's coordinates
+    """
+    scale_x, scale_y = scale
+    offset_x, offset_y = offset
+    height, width = image_shape[:2]
+
+    mapped_parts = []
+    for part in parts:
+        x, y, box_width, box_height = part.relative_box
+
+        # Scale and Offset
+        top_left_x = min(max(round(x * scale_x) + offset_x, 0), width)
+        top_left_y = min(max(round(y * scale_y) + offset_y, 0), height)
+        bot_right_x = min(
+            max(round((x + box_width) * scale_x) + offset_x, 0), width
+        )
+        bot_right_y = min(
+            max(round((y + box_height) * scale_y) + offset_y, 0), height
+        )
+
+        mapped_parts.append(
+            part.model_copy(
+                update={
+                    "relative_box": (
+                        top_left_x,
+                        top_left_y,
+                        bot_right_x - top_left_x,
+                        bot_right_y - top_left_y,
+                    ),
+                },
+            )
+        )
+
+    return mapped_parts
@@ -0,0 +1,103 @@
+from dataclasses import dataclass, field
+
+import cv2
+import numpy as np
+
+from censor_engine.models.lib_models.detectors import DetectedPartSchema
+from censor_engine.typing import Image
+
+"""
+This is used for `video_settings.frame_difference_threshold`, frames that
+barely differ from the last detected frame reuse its parts rather than going
+through the detectors.
+
+"""
+
+THUMBNAIL_WIDTH = 64
+PREVIOUS_PARTS = -1  # Source of a Frame Reusing the Last Call's Parts
+
+
+def make_thumbnail(image: Image) -> np.ndarray:
+    """
+    Shrinks the image into a small greyscale thumbnail, which is cheap to
+    compare and ignores most of the noise.
+
+    :param Image image: BGR image
+    :return np.ndarray: Float32 greyscale thumbnail
+    """
+    height, width = image.shape[:2]
+    size = (THUMBNAIL_WIDTH, max(round(height * THUMBNAIL_WIDTH / width), 1))
+    grey = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    return cv2.resize(grey, size, interpolation=cv2.INTER_AREA).astype(
+        np.float32
+    )
+
+
+def frame_difference(
+    thumbnail_a: np.ndarray, thumbnail_b: np.ndarray
+) -> float:
+    """
+    Works out how different two thumbnails are.
+
+    :param np.ndarray thumbnail_a: Thumbnail of the first frame
+    :param np.ndarray thumbnail_b: Thumbnail of the second frame
+    :return float: Mean absolute difference, from 0 (same) to 1
+    """
+    if thumbnail_a.shape != thumbnail_b.shape:
+        return 1.0
+    return float(np.abs(thumbnail_a - thumbnail_b).mean() / 255.0)
+
+
+@dataclass(slots=True)
+class SceneGate:
+    """
+    This decides which frames of a video need detecting, a frame that's
+    within `threshold` of the last detected frame (the anchor) reuses its
+    parts. The frames are compared to the anchor rather than to the frame
+    before them, so a slow change still adds up to a detection, and every
+    `redetect_interval` reused frames the next one is detected regardless.
+
+    A gate is kept per video and used in frame order.
+
+    :param float threshold: Max frame difference (0 to 1) to reuse the parts
+    :param int redetect_interval: Max frames in a row reusing the parts
+    """
+
+    threshold: float
+    redetect_interval: int
+
+    parts: list[DetectedPartSchema] = field(default_factory=list)
+    parts_cropped: bool = False  # If `parts` were Detected Around Crops
+    _thumbnail: np.ndarray | None = field(init=False, default=None)
+    _reused: int = field(init=False, default=0)
+
+    def plan(self, images: list[Image]) -> list[int]:
+        """
+        Picks the frames to detect, in order. Each frame gets its source, its
+        own position if it needs detecting, the position of an earlier frame
+        whose parts it reuses, or `PREVIOUS_PARTS` to reuse `parts` (the
+        anchor of the last call).
+
+        :param list[Image] images: Frames to check, in order
+        :return list[int]: Source of each frame's parts
+        """
+        source = PREVIOUS_PARTS
+        sources = []
+        for position, image in enumerate(images):
+            thumbnail = make_thumbnail(image)
+            if (
+                self._thumbnail is not None
+                and self._reused < self.redetect_interval
+                and frame_difference(thumbnail, self._thumbnail)
+                < self.threshold
+            ):
+                self._reused += 1
+                sources.append(source)
+                continue
+
+            # New Anchor
+            source = position
+            self._thumbnail = thumbnail
+            self._reused = 0
+            sources.append(position)
+        return sources
@@ -0,0 +1,157 @@
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from censor_engine.libs.registries import DetectorRegistry
+from censor_engine.models.config import Config
+from censor_engine.models.lib_models.detectors import DetectedPartSchema
+
+from .base import DetectionRequest, DetectorSetup, detect_parts
+from .video_state import VideoDetectionState
+
+
+@dataclass(slots=True)
+class DetectionJob:
+    """
+    This is a group of requests waiting in the service's queue.
+
+    :param list[DetectionRequest] requests: Images (or frames) to detect
+    :param Config config: Config used for the detection
+    :param Future future: Resolved with the found parts once detected
+    :param VideoDetectionState | None video_state: Detection state of the
+        video the frames are from, defaults to None
+    """
+
+    requests: list[DetectionRequest]
+    config: Config
+    future: Future[list[list[DetectedPartSchema]]]
+    video_state: VideoDetectionState | None = None
+
+
+@dataclass(slots=True)
+class DetectionService:
+    """
+    This is a long lived detection worker owned by CensorEngine.
+
+    Requests are queued and detected on a single background thread (which
+    keeps the models and the cache on one thread), the caller gets a future
+    back. This lets the video pipeline detect the next batch of frames while
+    it's still censoring the current one.
+
+    The worker (and the executor used to run several detectors at once) is
+    started on the first request and lives until `close()`, rather than being
+    made for every image or frame. The detectors are configured once per
+    config, when its first frames have to be detected.
+
+    :param int max_pending: Max jobs waiting before `submit()` blocks,
+        defaults to 2
+    """
+
+    max_pending: int = 2
+
+    _queue: "queue.Queue[DetectionJob | None]" = field(init=False)
+    _thread: threading.Thread | None = field(init=False, default=None)
+    _executor: ThreadPoolExecutor | None = field(init=False, default=None)
+    _detector_setup: DetectorSetup = field(
+        init=False, default_factory=DetectorSetup
+    )
+
+    def __post_init__(self):
+        self._queue = queue.Queue(maxsize=self.max_pending)
+
+    def is_running(self) -> bool:
+        return self._thread is not None
+
+    def start(self) -> None:
+        """Starts the worker, does nothing if it's already running."""
+        if self._thread is not None:
+            return
+
+        if (detector_amount := len(DetectorRegistry.get_all())) > 1:
+            self._executor = ThreadPoolExecutor(
+                max_workers=detector_amount,
+                thread_name_prefix="censor_engine_detector",
+            )
+        self._thread = threading.Thread(
+            target=self.__run,
+            name="censor_engine_detection",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def __run(self) -> None:
+        while (job := self._queue.get()) is not None:
+            if not job.future.set_running_or_notify_cancel():
+                continue
+
+            try:
+                job.future.set_result(
+                    detect_parts(
+                        job.requests,
+                        job.config,
+                        self._executor,
+                        job.video_state,
+                        self._detector_setup,
+                    )
+                )
+            except BaseException as error:  # noqa: BLE001 # Sent to the caller
+                job.future.set_exception(error)
+
+    def submit(
+        self,
+        requests: list[DetectionRequest],
+        config: Config,
+        video_state: VideoDetectionState | None = None,
+    ) -> Future[list[list[DetectedPartSchema]]]:
+        """
+        Queues the requests for detection, blocks if `max_pending` jobs are
+        already waiting.
+
+        The jobs are detected in order on one thread, so a video's detection
+        state sees its frames in order.
+
+        :param list[DetectionRequest] requests: Images (or frames) to detect
+        :param Config config: Config used for the detection
+        :param VideoDetectionState | None video_state: Detection state of the
+            video the frames are from, defaults to None
+        :return Future[list[list[DetectedPartSchema]]]: Found parts, in the
+            same order as the requests
+        """
+        self.start()
+
+        future: Future[list[list[DetectedPartSchema]]] = Future()
+        self._queue.put(DetectionJob(requests, config, future, video_state))
+        return future
+
+    def detect(
+        self,
+        requests: list[DetectionRequest],
+        config: Config,
+    ) -> list[list[DetectedPartSchema]]:
+        """
+        Detects the requests and waits for the result.
+
+        :param list[DetectionRequest] requests: Images (or frames) to detect
+        :param Config config: Config used for the detection
+        :return list[list[DetectedPartSchema]]: Found parts, in the same
+            order as the requests
+        """
+        return self.submit(requests, config).result()
+
+    def close(self) -> None:
+        """
+        Finishes the queued jobs and stops the worker, it's started again on
+        the next request.
+
+        """
+        if self._thread is None:
+            return
+
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
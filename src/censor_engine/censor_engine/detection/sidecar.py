@@ -0,0 +1,173 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO
+
+from pydantic import BaseModel, Field
+
+from censor_engine.detected_part import Part
+from censor_engine.models.lib_models.detectors import DetectedPartSchema
+
+"""
+This handles the sidecar detection files (see `docs/sidecar_format.md`),
+JSON Lines files holding the parts of each image or frame, such that the
+detection can be run somewhere else and the render side never loads a model,
+or the parts of a run can be used by other tools.
+
+"""
+
+
+class SidecarPart(BaseModel):
+    """
+    This is a part as it was censored, i.e., its box after the margin, and
+    its track (for videos with persistence).
+
+    """
+
+    label: str
+    score: float
+    relative_box: tuple[int, int, int, int]  # X, Y, Width, Height
+    track_id: int | None = None
+
+
+class SidecarRecord(BaseModel):
+    """
+    This is a single line of a sidecar file, the parts of an image or a
+    frame. Only `parts` is read back, `censored_parts` is written by the
+    export for other tools.
+
+    """
+
+    frame: int | None = None  # None for Images
+    parts: list[DetectedPartSchema] = Field(default_factory=list)
+    censored_parts: list[SidecarPart] = Field(default_factory=list)
+
+    @classmethod
+    def from_parts(
+        cls,
+        frame: int | None,
+        detected_parts: list[DetectedPartSchema],
+        image_parts: list[Part],
+        track_ids: list[int] | None = None,
+    ) -> "SidecarRecord":
+        """
+        Makes the record of an image or frame being censored.
+
+        :param int | None frame: Frame number, None for an image
+        :param list[DetectedPartSchema] detected_parts: Parts given to the
+            image processor
+        :param list[Part] image_parts: Parts being censored
+        :param list[int] | None track_ids: Track of each image part, defaults
+            to None (not tracked)
+        :return SidecarRecord: Record of the image or frame
+        """
+        return cls(
+            frame=frame,
+            parts=detected_parts,
+            censored_parts=[
+                SidecarPart(
+                    label=part.part_name,
+                    score=part.score,
+                    relative_box=part.part_area.relative_box,
+                    track_id=track_ids[index] if track_ids else None,
+                )
+                for index, part in enumerate(image_parts)
+            ],
+        )
+
+
+@dataclass(slots=True)
+class SidecarReader:
+    """
+    This reads the parts of a media file from its sidecar file.
+
+    The file is streamed rather than loaded whole, so the frames have to be
+    read in order (as the video pipeline does), frames missing from the file
+    have no parts.
+
+    :param Path path: Path of the sidecar file
+    :raises FileNotFoundError: The sidecar file doesn't exist
+    """
+
+    path: Path
+
+    _file: IO[str] = field(init=False)
+    _next_record: SidecarRecord | None = field(init=False, default=None)
+
+    def __post_init__(self):
+        if not self.path.exists():
+            msg = f"Missing sidecar detection file: {self.path}"
+            raise FileNotFoundError(msg)
+
+        self._file = self.path.open()
+        self.__read_record()
+
+    def __read_record(self) -> None:
+        self._next_record = None
+        while line := self._file.readline():
+            if line.strip():
+                self._next_record = SidecarRecord.model_validate_json(line)
+                return
+
+    def get_parts(self, frame: int | None = None) -> list[DetectedPartSchema]:
+        """
+        Gets the parts of a frame, the records of earlier frames are skipped.
+
+        :param int | None frame: Frame number, None for an image (the first
+            record is used)
+        :return list[DetectedPartSchema]: Parts of the frame
+        """
+        if frame is None:
+            return self._next_record.parts if self._next_record else []
+
+        while (
+            self._next_record is not None
+            and (self._next_record.frame or 0) < frame
+        ):
+            self.__read_record()
+
+        record = self._next_record
+        if record is None or (record.frame or 0) != frame:
+            return []
+        return record.parts
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def read_sidecar_parts(path: Path) -> list[DetectedPartSchema]:
+    """
+    Reads the parts of an image from its sidecar file.
+
+    :param Path path: Path of the sidecar file
+    :return list[DetectedPartSchema]: Parts of the image
+    """
+    reader = SidecarReader(path)
+    try:
+        return reader.get_parts()
+    finally:
+        reader.close()
+
+
+@dataclass(slots=True)
+class SidecarWriter:
+    """
+    This writes the sidecar file of a media file, a line at a time (the
+    file is line buffered), so a video's records are never held in memory
+    and can be read while it's still being censored.
+
+    :param Path path: Path of the sidecar file, replaced if it exists
+    """
+
+    path: Path
+
+    _file: IO[str] = field(init=False)
+
+    def __post_init__(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.path.open("w", buffering=1)
+
+    def write(self, record: SidecarRecord) -> None:
+        self._file.write(record.model_dump_json() + "\n")
+
+    def close(self) -> None:
+        self._file.close()
@@ -0,0 +1,114 @@
+import numpy as np
+
+from censor_engine.models.lib_models.detectors import DetectedPartSchema
+from censor_engine.models.structs.boxes import ios_matrix
+
+"""
+This is used for tiled detection (`ai_settings.tiled_detection`).
+
+Very large images (8K scans, long webtoon strips) are squashed down to the
+model's input size, so small parts get lost. Tiling splits the image into
+overlapping tiles which are detected separately (and the whole image, so big
+parts aren't cut up), then the duplicates found in several tiles are merged.
+
+"""
+
+
+def _tile_starts(length: int, tile_size: int, step: int) -> list[int]:
+    if length <= tile_size:
+        return [0]
+
+    starts = list(range(0, length - tile_size, step))
+    starts.append(length - tile_size)  # Last Tile Touches the Edge
+    return starts
+
+
+def tile_regions(
+    image_shape: tuple[int, ...],
+    tile_size: int,
+    overlap: float,
+) -> list[tuple[int, int, int, int]]:
+    """
+    Splits the image into overlapping tiles that cover all of it, the tiles
+    at the edges are moved inwards rather than made smaller.
+
+    :param tuple[int, ...] image_shape: Shape of the image
+    :param int tile_size: Width and height of the tiles
+    :param float overlap: Share of a tile overlapping its neighbour
+    :return list[tuple[int, int, int, int]]: Tiles as X, Y, Width, Height
+    """
+    height, width = image_shape[:2]
+    step = max(round(tile_size * (1 - overlap)), 1)
+
+    return [
+        (x, y, min(tile_size, width), min(tile_size, height))
+        for y in _tile_starts(height, tile_size, step)
+        for x in _tile_starts(width, tile_size, step)
+    ]
+
+
+def merge_duplicate_parts(
+    parts: list[DetectedPartSchema],
+    ios_threshold: float = 0.6,
+) -> list[DetectedPartSchema]:
+    """
+    Merges the parts found more than once (i.e., in overlapping tiles).
+
+    The best scoring part absorbs every part of the same label overlapping
+    it by more than the threshold, its box grows to cover them. IoS is used
+    rather than IoU since a part cut by a tile's edge is much smaller than
+    the full part.
+
+    :param list[DetectedPartSchema] parts: Parts from every tile
+    :param float ios_threshold: IoS above which parts are merged, defaults
+        to 0.6
+    :return list[DetectedPartSchema]: Parts without duplicates
+    """
+    if len(parts) < 2:  # noqa: PLR2004
+        return parts
+
+    # Labels Never Merge, so Each Is Done Separately (Smaller Matrices)
+    labels = sorted({part.label for part in parts})
+    if len(labels) > 1:
+        return [
+            merged_part
+            for label in labels
+            for merged_part in merge_duplicate_parts(
+                [part for part in parts if part.label == label],
+                ios_threshold,
+            )
+        ]
+
+    boxes = np.array(
+        [
+            (x, y, x + width, y + height)
+            for x, y, width, height in (part.relative_box for part in parts)
+        ],
+        dtype=np.float64,
+    )
+    overlaps = ios_matrix(boxes, boxes)
+
+    merged_parts = []
+    remaining = np.argsort([-part.score for part in parts], kind="stable")
+    while remaining.size > 0:
+        index = int(remaining[0])
+        duplicates = remaining[overlaps[index, remaining] > ios_threshold]
+        duplicates = np.union1d(duplicates, [index]).astype(int)
+
+        top_left = boxes[duplicates, :2].min(axis=0)
+        bot_right = boxes[duplicates, 2:].max(axis=0)
+        merged_parts.append(
+            parts[index].model_copy(
+                update={
+                    "relative_box": (
+                        int(top_left[0]),
+                        int(top_left[1]),
+                        int(bot_right[0] - top_left[0]),
+                        int(bot_right[1] - top_left[1]),
+                    ),
+                },
+            )
+        )
+        remaining = remaining[~np.isin(remaining, duplicates)]
+
+    return merged_parts
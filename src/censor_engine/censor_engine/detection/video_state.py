@@ -0,0 +1,61 @@
+from dataclasses import dataclass
+
+from censor_engine.models.config import Config
+
+from .adaptive_resolution import AdaptiveResolution
+from .crops import CropRedetector
+from .scene_gate import SceneGate
+
+
+@dataclass(slots=True)
+class VideoDetectionState:
+    """
+    This is the detection state kept between the batches of a video, it's
+    only used on the detection thread, in frame order.
+
+    :param SceneGate | None scene_gate: Skips unchanged frames, see
+        `video_settings.frame_difference_threshold`
+    :param CropRedetector | None crop_redetector: Detects crops around the
+        found parts, see `video_settings.crop_redetection`
+    :param AdaptiveResolution | None resolution: Picks the input size of
+        each batch, see `video_settings.adaptive_resolution`
+    """
+
+    scene_gate: SceneGate | None = None
+    crop_redetector: CropRedetector | None = None
+    resolution: AdaptiveResolution | None = None
+
+    @classmethod
+    def from_config(cls, config: Config) -> "VideoDetectionState":
+        """
+        Makes the state of a new video with the features enabled in the
+        config.
+
+        :param Config config: Config of the run
+        :return VideoDetectionState: State for the video
+        """
+        video_settings = config.video_settings
+
+        scene_gate = None
+        if video_settings.frame_difference_threshold > 0:
+            scene_gate = SceneGate(
+                video_settings.frame_difference_threshold,
+                video_settings.forced_redetect_frames,
+            )
+
+        crop_redetector = None
+        if video_settings.crop_redetection:
+            crop_redetector = CropRedetector(
+                video_settings.crop_full_frame_interval,
+                video_settings.crop_padding,
+            )
+
+        resolution = None
+        if video_settings.adaptive_resolution:
+            resolution = AdaptiveResolution(
+                video_settings.adaptive_maximum_downscale_factor,
+                video_settings.adaptive_minimum_part_size,
+                video_settings.adaptive_recheck_frames,
+            )
+
+        return cls(scene_gate, crop_redetector, resolution)
@@ -1,16 +1,16 @@
-import itertools
-from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from uuid import UUID, uuid4
 
+from censor_engine.censor_engine.detection import (
+    DetectionRequest,
+    detect_parts,
+)
 from censor_engine.censor_engine.tools.debugger import (
     DebugLevels,
 )
 from censor_engine.censor_engine.tools.dev_tools import DevTools
 from censor_engine.detected_part import Part
-from censor_engine.libs.detectors import enabled_detectors
 from censor_engine.models.caching import Cache
-from censor_engine.models.caching.caching_schemas import AIOutputData
 from censor_engine.models.config import Config
 from censor_engine.models.lib_models.detectors import DetectedPartSchema
 from censor_engine.paths import PathManager
@@ -42,6 +42,8 @@ class ImageProcessor(
     :param debug_level debug_level: Debugging levels, used to quickly utilise
         different grades of debugging
     :param DevTools dev_tools: Debugging tools class
+    :param list[DetectedPartSchema] | None detection_output: Parts already
+        found by the (batched) detection stage, skips running the detectors
     :param list[DetectedPartSchema] | None _test_detection_output: Private
         method used by tests to inject mock data that would be from the AI
         model(s)
@@ -65,6 +67,7 @@ class ImageProcessor(
     debug_level: DebugLevels = DebugLevels.NONE
     dev_tools: DevTools | None = None
 
+    detection_output: list[DetectedPartSchema] | None = None
     _test_detection_output: list[DetectedPartSchema] | None = None
 
     # Internals
@@ -96,6 +99,8 @@ class ImageProcessor(
         # Detect Parts for Image
         if self._test_detection_output:
             self._detected_parts = self._test_detection_output
+        elif self.detection_output is not None:
+            self._detected_parts = self.detection_output
         else:
             self.__detect_parts()
 
@@ -103,40 +108,20 @@ class ImageProcessor(
 
     def __detect_parts(self) -> None:
         """
-        This function detects the parts using the detector dataclass.
-
-        It utilises multi-threading to speed up when multiple detectors are
-        used. In theory it should only work marginally do to the bottleneck of
-        using the GPU (or CPU), however it's still a minor improvement.
+        This function detects the parts using the detection stage, used when
+        the processor is made without a batched detection output.
 
         """
-        if self.cache and self.cache.check_for_frame(self.frame_counter):
-            all_parts = self.cache.get_frame(self.frame_counter).output_data
-        else:
-            with ThreadPoolExecutor() as executor:
-                detected_parts = list(
-                    executor.map(
-                        lambda detector: detector.detect_image(
-                            self.file_image
-                        ),
-                        enabled_detectors,
-                    ),
+        self._detected_parts = detect_parts(
+            [
+                DetectionRequest(
+                    self.file_image,
+                    self.cache,
+                    self.frame_counter,
                 )
-
-            all_parts = list(itertools.chain(*detected_parts))
-            output = AIOutputData(model_name="nude_net", output_data=all_parts)
-            if self.cache:
-                self.cache.save_frame(self.frame_counter, output)
-
-        # Sort and Label ID Based on Position
-        all_parts.sort(
-            key=lambda part: (part.relative_box[1], part.relative_box[0]),
-        )
-
-        for index, part in enumerate(all_parts, start=1):
-            part.set_part_id(index)
-
-        self._detected_parts = all_parts
+            ],
+            self.config,
+        )[0]
 
     # Dev Tools
     def _decompile_masks(
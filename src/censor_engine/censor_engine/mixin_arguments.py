@@ -44,6 +44,7 @@ class MixinArguments(Mixin):
             "show_full_output_path": "fo",
             "using_test_data": "td",
             "example_preview": "example",
+            "detect_only": "do",
         }
 
         # Add Args
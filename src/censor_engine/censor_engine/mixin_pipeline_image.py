@@ -1,12 +1,26 @@
+import itertools
 from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import dataclass
 from pathlib import Path
 
 import cv2
 
+from censor_engine.censor_engine.detection import (
+    DetectionRequest,
+    DetectionService,
+    order_detected_parts,
+)
+from censor_engine.censor_engine.detection.sidecar import (
+    SidecarRecord,
+    SidecarWriter,
+    read_sidecar_parts,
+)
 from censor_engine.censor_engine.tools.config_previewer.base import (
     get_config_preview,
 )
 from censor_engine.models.caching.base import Cache
+from censor_engine.models.caching.manifest import RebuildManifest
 from censor_engine.models.config import Config
 from censor_engine.models.lib_models.detectors import DetectedPartSchema
 from censor_engine.models.structs import IndexedFile, Mixin
@@ -14,16 +28,40 @@ from censor_engine.paths import PathManager
 from censor_engine.typing import Image
 
 from .image import ImageProcessor
+from .mixin_utils import open_rebuild_manifest, skip_up_to_date_files
 from .tools.debugger import DebugLevels
 from .tools.dev_tools import DevTools
 
 
+@dataclass(slots=True)
+class LoadedImageFile:
+    """
+    This holds an image file between being loaded and being censored, such
+    that the files can be detected in batches.
+
+    """
+
+    index_file: IndexedFile
+    image: Image
+    cache: Cache | None = None
+    dev_tools: DevTools | None = None
+    detection_output: list[DetectedPartSchema] | None = None
+    test_detection_output: list[DetectedPartSchema] | None = None
+
+    def needs_detection(self) -> bool:
+        return (
+            self.detection_output is None
+            and self.test_detection_output is None
+        )
+
+
 class MixinImagePipeline(Mixin):
     def __print_output(
         self,
         file_name: str,
         index: int,
         max_index: int,
+        action: str = "Censored",
     ) -> str:
         # Index Component
         max_index_length = len(str(max_index))
@@ -38,11 +76,167 @@ class MixinImagePipeline(Mixin):
         percent_component = f"{spacing}{percent:3.1%}"
 
         # Text Output
-        text_file = f"Censored: {file_name}"
+        text_file = f"{action}: {file_name}"
 
         final_output = [indexing_component, percent_component, text_file]
         return " | ".join(final_output)
 
+    def __load_image_file(
+        self,
+        index_file: IndexedFile,
+        *,
+        main_files_path: Path,
+        config: Config,
+        flags: dict[str, bool],
+        path_manager: PathManager,
+        test_detection_output: list[DetectedPartSchema] | None,
+    ) -> LoadedImageFile:
+        file_path = index_file.path
+
+        # Handle Preview
+        if index_file.file_type == "preview":
+            config_info = get_config_preview(
+                config.censor_settings.enabled_parts
+            )
+            return LoadedImageFile(
+                index_file=index_file,
+                image=config_info["preview"],
+                test_detection_output=config_info["detection_data"],
+            )
+
+        # Dev Tools
+        dev_tools = None
+        if flags["dev_tools"]:
+            dev_tools = DevTools(
+                output_folder=Path(file_path),
+                main_files_path=Path(main_files_path),
+                using_full_output_path=flags["show_full_output_path"],
+            )
+
+        # Read the File
+        file_image: Image = cv2.imread(file_path)  # type: ignore
+
+        # Sidecar Detections (Replace the Detectors)
+        detection_output = None
+        if detections_folder := config.file_settings.detections_folder:
+            detection_output = order_detected_parts(
+                read_sidecar_parts(
+                    path_manager.get_sidecar_path(file_path, detections_folder)
+                )
+            )
+
+        # Caching
+        cache = Cache(
+            path_manager.get_cache_folder(),
+            path_manager.base_directory,
+            file_path,
+            is_video=False,
+            full_hash=config.file_settings.cache_full_hash,
+        )
+
+        return LoadedImageFile(
+            index_file=index_file,
+            image=file_image,
+            cache=cache,
+            dev_tools=dev_tools,
+            detection_output=detection_output,
+            test_detection_output=test_detection_output or None,
+        )
+
+    def __censor_image_file(
+        self,
+        loaded_file: LoadedImageFile,
+        *,
+        main_files_path: Path,
+        config: Config,
+        debug_level: DebugLevels,
+        flags: dict[str, bool],
+        path_manager: PathManager,
+        max_index: int,
+        manifest: RebuildManifest | None,
+    ) -> Image:
+        file_path = loaded_file.index_file.path
+        dev_tools = loaded_file.dev_tools
+
+        # Run the Censor Manager
+        image_processor = ImageProcessor(
+            file_image=loaded_file.image,
+            file_name=file_path,
+            path_manager=path_manager,
+            cache=loaded_file.cache,
+            config=config,
+            debug_level=debug_level,
+            dev_tools=dev_tools,
+            detection_output=loaded_file.detection_output,
+            _test_detection_output=loaded_file.test_detection_output,
+        )
+        image_processor.generate_parts()
+
+        # Export Detections
+        if export_folder := config.file_settings.detections_export_folder:
+            sidecar_writer = SidecarWriter(
+                path_manager.get_sidecar_path(file_path, export_folder)
+            )
+            sidecar_writer.write(
+                SidecarRecord.from_parts(
+                    None,
+                    loaded_file.detection_output
+                    or loaded_file.test_detection_output
+                    or [],
+                    image_processor.get_image_parts(),
+                )
+            )
+            sidecar_writer.close()
+
+        image_processor.generate_mask_shapes()
+        image_processor.compile_masks()
+        image_processor.apply_censors()
+
+        # Dev Tools
+        if dev_tools:
+            dev_tools.dev_decompile_masks(
+                image_processor.get_image_parts(),
+                subfolder="zz_complete",
+            )
+
+        # Output File Handling
+        file_output = image_processor.return_output()
+        new_file_name = path_manager.get_save_file_path(
+            file_path,
+            force_png=image_processor.force_png,
+        )
+
+        # File Save
+        msg = self.__print_output(
+            path_manager.get_relative_path(file_path),
+            loaded_file.index_file.index,
+            max_index,
+        )
+        print(msg)  # noqa: T201
+        cv2.imwrite(new_file_name, file_output)
+
+        # Record for Incremental Rebuilds
+        if manifest is not None:
+            manifest.record(
+                path_manager.get_relative_path(file_path),
+                Path(file_path),
+                Path(new_file_name),
+            )
+
+        # Print Out
+        if not flags["show_full_output_path"]:
+            new_file_name = new_file_name.replace(
+                str(main_files_path),
+                "",
+                1,
+            )[1:]
+
+        # Save Duration
+        if flags["pad_individual_items"]:
+            pass
+
+        return file_output
+
     def _image_pipeline(
         self,
         main_files_path: Path,
@@ -52,6 +246,7 @@ class MixinImagePipeline(Mixin):
         function_get_index: Callable[[int, int], str],
         flags: dict[str, bool],
         path_manager: PathManager,
+        detection_service: DetectionService,
         *,
         frame: int = 0,
         inline_mode: bool = False,
@@ -63,101 +258,158 @@ class MixinImagePipeline(Mixin):
         if not path_manager.test_mode and not filter_for_imaged:
             return []
 
-        # Re-index Files
-        re_indexed_files = [
-            IndexedFile(index, index_file.path, index_file.file_type)
-            for index, index_file in enumerate(filter_for_imaged)
-        ]
+        # Skip Up to Date Files
+        with open_rebuild_manifest(config, path_manager) as manifest:
+            filter_for_imaged = skip_up_to_date_files(
+                filter_for_imaged, manifest, path_manager
+            )
+            if manifest is not None and not filter_for_imaged:
+                return []
+
+            # Re-index Files
+            re_indexed_files = [
+                IndexedFile(index, index_file.path, index_file.file_type)
+                for index, index_file in enumerate(filter_for_imaged)
+            ]
+
+            if not re_indexed_files:
+                msg = "No Files Found:"
+                raise ValueError(msg, indexed_files)
+
+            in_memory_files: list[Image] = []  # Currently Only Test Mode
+            max_index = len(re_indexed_files) - 1
+            batch_size = config.rendering_settings.batch_size
+
+            def censor_batch(
+                loaded_files: list[LoadedImageFile],
+                detections: Future[list[list[DetectedPartSchema]]],
+            ) -> None:
+                # Collect the Detections
+                detection_indices = [
+                    index
+                    for index, loaded_file in enumerate(loaded_files)
+                    if loaded_file.needs_detection()
+                ]
+                for index, detection_output in zip(
+                    detection_indices, detections.result(), strict=True
+                ):
+                    loaded_files[index].detection_output = detection_output
 
-        if not re_indexed_files:
-            msg = "No Files Found:"
-            raise ValueError(msg, indexed_files)
-
-        in_memory_files: list[Image] = []  # Currently Only Test Mode
-        max_index = len(re_indexed_files) - 1
-        for index_file in re_indexed_files:
-            index = index_file.index
-            file_path = index_file.path
-            file_type = index_file.file_type
-
-            # Dev Tools
-            dev_tools = None
-
-            if file_type != "preview":
-                if flags["dev_tools"]:
-                    dev_tools = DevTools(
-                        output_folder=Path(file_path),
-                        main_files_path=Path(main_files_path),
-                        using_full_output_path=flags["show_full_output_path"],
+                # Censor the Batch
+                for loaded_file in loaded_files:
+                    file_output = self.__censor_image_file(
+                        loaded_file,
+                        main_files_path=main_files_path,
+                        config=config,
+                        debug_level=debug_level,
+                        flags=flags,
+                        path_manager=path_manager,
+                        max_index=max_index,
+                        manifest=manifest,
                     )
+                    if inline_mode:
+                        in_memory_files.append(file_output)
 
-                # Read the File
-                file_image: Image = cv2.imread(file_path)  # type: ignore
+            # The Next Batch Is Detected While the Current One Is Censored
+            pending_batch = None
+            for batch_files in itertools.batched(
+                re_indexed_files, batch_size, strict=False
+            ):
+                # Load the Files
+                loaded_files = [
+                    self.__load_image_file(
+                        index_file,
+                        main_files_path=main_files_path,
+                        config=config,
+                        flags=flags,
+                        path_manager=path_manager,
+                        test_detection_output=_test_detection_output,
+                    )
+                    for index_file in batch_files
+                ]
 
-                # Caching
-                cache = Cache(
-                    path_manager.get_cache_folder(),
-                    path_manager.base_directory,
-                    file_path,
-                    is_video=False,
-                )
-            else:
-                config_info = get_config_preview(
-                    config.censor_settings.enabled_parts
+                # Detect the Batch
+                detections = detection_service.submit(
+                    [
+                        DetectionRequest(loaded_file.image, loaded_file.cache)
+                        for loaded_file in loaded_files
+                        if loaded_file.needs_detection()
+                    ],
+                    config,
                 )
 
-                file_image = config_info["preview"]
-                _test_detection_output = config_info["detection_data"]
-                cache = None
-
-            # Run the Censor Manager
-            image_processor = ImageProcessor(
-                file_image=file_image,
-                file_name=file_path,
-                path_manager=path_manager,
-                cache=cache,
-                config=config,
-                debug_level=debug_level,
-                dev_tools=dev_tools,
-                _test_detection_output=_test_detection_output,
-            )
-            image_processor.start()
+                if pending_batch is not None:
+                    censor_batch(*pending_batch)
+                pending_batch = (loaded_files, detections)
 
-            # Dev Tools
-            if dev_tools:
-                dev_tools.dev_decompile_masks(
-                    image_processor.get_image_parts(),
-                    subfolder="zz_complete",
+            if pending_batch is not None:
+                censor_batch(*pending_batch)
+
+            return in_memory_files
+
+    def _image_detection_pipeline(
+        self,
+        indexed_files: list[IndexedFile],
+        config: Config,
+        path_manager: PathManager,
+        detection_service: DetectionService,
+    ) -> None:
+        """
+        This is the image half of the detect only mode, it fills the cache of
+        every image without censoring them (nothing is written to the
+        censored folder).
+
+        :param list[IndexedFile] indexed_files: Found files
+        :param Config config: Config of the run
+        :param PathManager path_manager: Path manager of the run
+        :param DetectionService detection_service: Service used to detect
+        """
+        image_files = [f for f in indexed_files if f.file_type == "image"]
+        max_index = len(image_files) - 1
+
+        # The Next Batch Is Loaded While the Current One Is Detected
+        pending_batch = None
+        for batch_files in itertools.batched(
+            enumerate(image_files),
+            config.rendering_settings.batch_size,
+            strict=False,
+        ):
+            requests = [
+                DetectionRequest(
+                    cv2.imread(index_file.path),  # type: ignore
+                    Cache(
+                        path_manager.get_cache_folder(),
+                        path_manager.base_directory,
+                        index_file.path,
+                        is_video=False,
+                        full_hash=config.file_settings.cache_full_hash,
+                    ),
                 )
+                for _, index_file in batch_files
+            ]
+            detections = detection_service.submit(requests, config)
 
-            # Output File Handling
-            file_output = image_processor.return_output()
-            new_file_name = path_manager.get_save_file_path(
-                file_path,
-                force_png=image_processor.force_png,
-            )
+            if pending_batch is not None:
+                self.__print_detected_batch(*pending_batch)
+            pending_batch = (batch_files, detections, path_manager, max_index)
 
-            # File Save
-            msg = self.__print_output(
-                path_manager.get_relative_path(file_path),
-                index,
-                max_index,
+        if pending_batch is not None:
+            self.__print_detected_batch(*pending_batch)
+
+    def __print_detected_batch(
+        self,
+        batch_files: tuple[tuple[int, IndexedFile], ...],
+        detections: Future[list[list[DetectedPartSchema]]],
+        path_manager: PathManager,
+        max_index: int,
+    ) -> None:
+        detections.result()
+        for index, index_file in batch_files:
+            print(  # noqa: T201
+                self.__print_output(
+                    path_manager.get_relative_path(index_file.path),
+                    index,
+                    max_index,
+                    action="Detected",
+                )
             )
-            print(msg)  # noqa: T201
-            cv2.imwrite(new_file_name, file_output)
-            if inline_mode:
-                in_memory_files.append(file_output)
-
-            # Print Out
-            if not flags["show_full_output_path"]:
-                new_file_name = new_file_name.replace(
-                    str(main_files_path),
-                    "",
-                    1,
-                )[1:]
-
-            # Save Duration
-            if flags["pad_individual_items"]:
-                pass
-
-        return in_memory_files
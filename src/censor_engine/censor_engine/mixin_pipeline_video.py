@@ -1,33 +1,138 @@
 import os
+from collections import deque
 from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import dataclass, field
 from pathlib import Path
 
+import cv2
 import progressbar
 
+from censor_engine.censor_engine.detection import (
+    DetectionRequest,
+    DetectionService,
+    order_detected_parts,
+)
+from censor_engine.censor_engine.detection.keyframes import (
+    interpolate_parts,
+    keyframe_interval,
+)
+from censor_engine.censor_engine.detection.mapping import downscale_image
+from censor_engine.censor_engine.detection.sidecar import (
+    SidecarReader,
+    SidecarRecord,
+    SidecarWriter,
+)
+from censor_engine.censor_engine.detection.video_state import (
+    VideoDetectionState,
+)
 from censor_engine.models.caching.base import Cache
+from censor_engine.models.caching.manifest import RebuildManifest
 from censor_engine.models.config import Config
+from censor_engine.models.enums import KeyframeInterpolation
 from censor_engine.models.lib_models.detectors import DetectedPartSchema
 from censor_engine.models.structs import IndexedFile, Mixin
 from censor_engine.paths import PathManager
 from censor_engine.typing import Image
 
 from .mixin_pipeline_image import ImageProcessor
+from .mixin_utils import open_rebuild_manifest, skip_up_to_date_files
 from .tools.debugger import DebugLevels
 from .tools.dev_tools import DevTools
 from .tools.video_tools import VideoInfo
 from .video import FrameProcessor, VideoProcessor
 
 
+@dataclass(slots=True)
+class VideoContext:
+    """
+    This holds the state of the video currently being censored, such that
+    the frame methods don't need to pass everything around.
+
+    With `censoring_fps`, only every `keyframe_interval` frame is detected,
+    the frames after the last keyframe wait in `lookahead` until the next
+    keyframe is detected, so their parts can be interpolated. With
+    `predict_between_keyframes`, they're instead rendered straight away with
+    the tracker's predicted parts.
+
+    With a `sidecar`, the keyframes' parts are read from it rather than
+    detected. With a `sidecar_writer`, every frame's parts are exported as
+    it's censored.
+
+    """
+
+    file_path: str
+    main_files_path: str
+    config: Config
+    debug_level: DebugLevels
+    flags: dict[str, bool]
+    path_manager: PathManager
+    cache: Cache
+    video_processor: VideoProcessor
+    frame_processor: FrameProcessor
+    use_persistence: bool
+    detection_service: DetectionService
+    test_detection_output: list[list[DetectedPartSchema]] | None = None
+    detection_state: VideoDetectionState | None = None
+    sidecar: SidecarReader | None = None
+    sidecar_writer: SidecarWriter | None = None
+
+    # Keyframes
+    keyframe_interval: int = 1
+    predict_between_keyframes: bool = False
+    last_keyframe: tuple[int, list[DetectedPartSchema]] | None = None
+    lookahead: list[tuple[int, Image]] = field(default_factory=list)
+
+    def is_keyframe(self, frame_counter: int) -> bool:
+        return frame_counter % self.keyframe_interval == 0
+
+
+@dataclass(slots=True)
+class PendingFrameBatch:
+    """
+    This is a batch of frames that's been sent for detection but not yet
+    censored.
+
+    :param list[tuple[int, Image]] frames: Frame numbers and frames
+    :param Future | None detections: Found parts per keyframe, None when
+        using the test detection output or there's no keyframe
+    """
+
+    frames: list[tuple[int, Image]]
+    detections: Future[list[list[DetectedPartSchema]]] | None = None
+
+
+def make_detection_pass_config(config: Config) -> Config:
+    """
+    Copies the config with the batch size and thread count of the detection
+    pass (see `video_settings.two_pass`).
+
+    :param Config config: Config of the run
+    :return Config: Config used by the detection pass
+    """
+    video_settings = config.video_settings
+    detection_config = config.model_copy(deep=True)
+    detection_config.rendering_settings.batch_size = (
+        video_settings.detection_batch_size
+    )
+    if video_settings.detection_threads:
+        detection_config.ai_settings.inference_threads = (
+            video_settings.detection_threads
+        )
+    return detection_config
+
+
 class MixinVideoPipeline(Mixin):
     def _make_progress_bar_widgets(
         self,
         index_text: str,
         file_name: str,
         total_amount: int,
+        action: str = "Censoring",
     ) -> list:
         return [
             f"{index_text} ",
-            f'Censoring "{file_name}" > ',
+            f'{action} "{file_name}" > ',
             progressbar.Counter(),
             "/",
             f"{total_amount} |",
@@ -41,6 +146,419 @@ class MixinVideoPipeline(Mixin):
             progressbar.GranularBar(),
         ]
 
+    def _detect_video(
+        self,
+        file_path: str,
+        video_processor: VideoProcessor | None,
+        *,
+        config: Config,
+        path_manager: PathManager,
+        detection_service: DetectionService,
+        index_text: str,
+        file_name: str,
+    ) -> None:
+        """
+        This is the detection pass of `video_settings.two_pass`, it fills the
+        cache of a video without censoring it.
+
+        The keyframes are shrunk to the detection resolution as they're
+        decoded (the other frames are skipped without decoding), and sent to
+        the detectors in batches of `detection_batch_size`. There's no video
+        writer, masks, or styles, so the render pass afterwards only reads the
+        cache.
+
+        :param str file_path: Path of the video
+        :param VideoProcessor | None video_processor: Processor of the render
+            pass, checked for a stop request, None without a render pass
+        :param Config config: Config of the run
+        :param PathManager path_manager: Path manager of the run
+        :param DetectionService detection_service: Service used to detect
+        :param str index_text: Index of the file, for the progress bar
+        :param str file_name: Name of the file, for the progress bar
+        """
+        detection_config = make_detection_pass_config(config)
+        batch_size = detection_config.rendering_settings.batch_size
+        downscale_factor = config.ai_settings.ai_model_downscale_factor
+
+        video_capture = cv2.VideoCapture(file_path)
+        total_frames = int(video_capture.get(cv2.CAP_PROP_FRAME_COUNT))
+        interval = keyframe_interval(
+            int(video_capture.get(cv2.CAP_PROP_FPS)),  # Same as VideoProcessor
+            config.video_settings.censoring_fps,
+        )
+        cache = Cache(
+            path_manager.get_cache_folder(),
+            path_manager.base_directory,
+            file_path,
+            is_video=True,
+            full_hash=config.file_settings.cache_full_hash,
+        )
+        detection_state = VideoDetectionState.from_config(config)
+
+        progress_bar = progressbar.progressbar(
+            range(total_frames),
+            widgets=self._make_progress_bar_widgets(
+                index_text=index_text,
+                file_name=file_name,
+                total_amount=total_frames,
+                action="Detecting",
+            ),
+        )
+
+        # NOTE: Batch N+1 is decoded while batch N is being detected
+        requests: list[DetectionRequest] = []
+        pending: Future[list[list[DetectedPartSchema]]] | None = None
+        for frame_counter, _ in enumerate(progress_bar):
+            if video_processor is not None and video_processor.force_stop:
+                break
+            if frame_counter % interval:
+                if not video_capture.grab():
+                    break
+                continue
+
+            ret, frame = video_capture.read()
+            if not ret:
+                break
+
+            requests.append(
+                DetectionRequest(
+                    downscale_image(frame, downscale_factor),
+                    cache,
+                    frame_counter,
+                    original_shape=frame.shape,
+                )
+            )
+            if len(requests) < batch_size:
+                continue
+
+            if pending is not None:
+                pending.result()
+            pending = detection_service.submit(
+                requests, detection_config, detection_state
+            )
+            requests = []
+
+        if pending is not None:
+            pending.result()
+        if requests:
+            detection_service.submit(
+                requests, detection_config, detection_state
+            ).result()
+
+        video_capture.release()
+        cache.close()
+
+    def _open_sidecars(
+        self,
+        file_path: str,
+        config: Config,
+        path_manager: PathManager,
+    ) -> tuple[SidecarReader | None, SidecarWriter | None]:
+        """
+        This opens the sidecar detection files of a video, the one read in
+        place of the detectors (`file_settings.detections_folder`) and the
+        one exported to (`file_settings.detections_export_folder`).
+
+        :param str file_path: Path of the video
+        :param Config config: Config of the run
+        :param PathManager path_manager: Path manager of the run
+        :return tuple[SidecarReader | None, SidecarWriter | None]: Reader and
+            writer, None when not used
+        """
+        file_settings = config.file_settings
+
+        sidecar = None
+        if detections_folder := file_settings.detections_folder:
+            sidecar = SidecarReader(
+                path_manager.get_sidecar_path(file_path, detections_folder)
+            )
+
+        sidecar_writer = None
+        if export_folder := file_settings.detections_export_folder:
+            sidecar_writer = SidecarWriter(
+                path_manager.get_sidecar_path(file_path, export_folder)
+            )
+
+        return sidecar, sidecar_writer
+
+    def _close_video(
+        self,
+        context: VideoContext,
+        manifest: RebuildManifest | None,
+    ) -> None:
+        """
+        This closes the files of a censored video, and records it in the
+        rebuild manifest unless it was stopped part way.
+
+        :param VideoContext context: State of the current video
+        :param RebuildManifest | None manifest: Rebuild manifest, None if not
+            rebuilding incrementally
+        """
+        video_processor = context.video_processor
+        video_processor.close_video()
+        context.cache.close()
+        if context.sidecar is not None:
+            context.sidecar.close()
+        if context.sidecar_writer is not None:
+            context.sidecar_writer.close()
+
+        if manifest is not None and not video_processor.force_stop:
+            manifest.record(
+                context.path_manager.get_relative_path(context.file_path),
+                Path(context.file_path),
+                Path(video_processor.new_file_name),
+            )
+
+    def _submit_frame_batch(
+        self,
+        context: VideoContext,
+        frames: list[tuple[int, Image]],
+    ) -> PendingFrameBatch:
+        """
+        This sends the keyframes of a batch to the detection service, the
+        batch is detected in the background while the previous one is
+        censored.
+
+        :param VideoContext context: State of the current video
+        :param list[tuple[int, Image]] frames: Frame numbers and frames
+        :return PendingFrameBatch: Frames and their pending detections
+        """
+        requests = [
+            DetectionRequest(frame, context.cache, frame_counter)
+            for frame_counter, frame in frames
+            if context.is_keyframe(frame_counter)
+        ]
+        if context.test_detection_output or context.sidecar or not requests:
+            return PendingFrameBatch(frames)
+
+        return PendingFrameBatch(
+            frames,
+            context.detection_service.submit(
+                requests,
+                context.config,
+                context.detection_state,
+            ),
+        )
+
+    def _render_frame_batch(
+        self,
+        context: VideoContext,
+        pending_batch: PendingFrameBatch,
+    ) -> None:
+        """
+        This waits for a batch's detections and then censors and writes its
+        frames in order. Frames after the last keyframe are held back until
+        the next keyframe is detected.
+
+        :param VideoContext context: State of the current video
+        :param PendingFrameBatch pending_batch: Frames and their detections
+        """
+        keyframes = [
+            frame_counter
+            for frame_counter, _ in pending_batch.frames
+            if context.is_keyframe(frame_counter)
+        ]
+
+        # Detected Parts for the Keyframes
+        if pending_batch.detections is not None:
+            batch_detections = pending_batch.detections.result()
+        elif context.test_detection_output:
+            batch_detections = [
+                context.test_detection_output[frame_counter]
+                for frame_counter in keyframes
+            ]
+        elif context.sidecar:
+            batch_detections = [
+                order_detected_parts(context.sidecar.get_parts(frame_counter))
+                for frame_counter in keyframes
+            ]
+        else:
+            batch_detections = []
+        keyframe_detections = dict(
+            zip(keyframes, batch_detections, strict=True)
+        )
+
+        for frame_counter, frame in pending_batch.frames:
+            if frame_counter not in keyframe_detections:
+                if context.predict_between_keyframes:
+                    self._render_frame(context, frame, frame_counter, None)
+                else:
+                    context.lookahead.append((frame_counter, frame))
+                continue
+
+            detection_output = keyframe_detections[frame_counter]
+            self._render_lookahead(context, (frame_counter, detection_output))
+            self._render_frame(
+                context,
+                frame,
+                frame_counter,
+                detection_output,
+            )
+            context.last_keyframe = (frame_counter, detection_output)
+
+    def _render_lookahead(
+        self,
+        context: VideoContext,
+        next_keyframe: tuple[int, list[DetectedPartSchema]] | None = None,
+    ) -> None:
+        """
+        This censors the frames held back since the last keyframe, their
+        parts are interpolated between the last and next keyframes. Without
+        a next keyframe (the end of the video), the last keyframe's parts
+        are held.
+
+        :param VideoContext context: State of the current video
+        :param tuple[int, list[DetectedPartSchema]] | None next_keyframe:
+            Frame number and parts of the next keyframe, defaults to None
+        """
+        method = context.config.video_settings.keyframe_interpolation
+        for frame_counter, frame in context.lookahead:
+            if context.last_keyframe is None:
+                detection_output = []
+            elif next_keyframe is None:
+                detection_output = interpolate_parts(
+                    context.last_keyframe[1],
+                    [],
+                    0.0,
+                    KeyframeInterpolation.HOLD,
+                )
+            else:
+                (start, start_parts), (end, end_parts) = (
+                    context.last_keyframe,
+                    next_keyframe,
+                )
+                detection_output = interpolate_parts(
+                    start_parts,
+                    end_parts,
+                    (frame_counter - start) / (end - start),
+                    method,
+                )
+
+            self._render_frame(context, frame, frame_counter, detection_output)
+        context.lookahead.clear()
+
+    def _render_frame(
+        self,
+        context: VideoContext,
+        frame: Image,
+        frame_counter: int,
+        detection_output: list[DetectedPartSchema] | None,
+    ) -> None:
+        """
+        This censors and writes a single frame.
+
+        :param VideoContext context: State of the current video
+        :param Image frame: Frame to censor
+        :param int frame_counter: Frame number
+        :param list[DetectedPartSchema] | None detection_output: Found parts,
+            None for a frame that isn't detected, whose parts are predicted
+            by the tracker
+        """
+        path_manager = context.path_manager
+        fp = context.frame_processor
+
+        dev_tools = None
+        if context.flags["dev_tools"]:
+            dev_tools = DevTools(
+                output_folder=Path(context.file_path),
+                main_files_path=Path(context.main_files_path),
+                using_full_output_path=path_manager.get_flag_is_using_full_path(),
+            )
+
+        # Run Censor Manager
+        ip = ImageProcessor(
+            file_image=frame,
+            file_name=context.file_path,
+            path_manager=path_manager,
+            cache=context.cache,
+            frame_counter=frame_counter,
+            config=context.config,
+            debug_level=context.debug_level,
+            dev_tools=dev_tools,
+            detection_output=detection_output or [],
+        )
+        ip.generate_parts()
+
+        # # Apply Stability Stuff
+        """
+        NOTE:   This section is used to make videos more stable,
+                currently the processing effects performed are:
+
+                    -   Holding frames for a certain number of frames
+                        to avoid issues where a part doesn't get
+                        detected, thus causing a flickering effect.
+
+                    -   Maintaining the last frame instead of the
+                        current if the difference is negligible, this
+                        avoids issues where the the detected areas are
+                        slightly different thus causes the censors to
+                        "spasm".
+
+        """
+        if context.use_persistence:
+            if detection_output is None:
+                fp.tracker.predict_frame()
+            else:
+                fp.tracker.update_tracker(ip.get_image_parts())
+            ip.set_image_parts(fp.tracker.get_parts())
+
+        # Export Detections
+        if context.sidecar_writer is not None:
+            context.sidecar_writer.write(
+                SidecarRecord.from_parts(
+                    frame_counter,
+                    detection_output or [],
+                    ip.get_image_parts(),
+                    fp.tracker.get_track_ids()
+                    if context.use_persistence
+                    else None,
+                )
+            )
+        """
+        -   Keep parts (hold them, if -1, always hold)
+        -   check sizes for parts, flag any bad ones
+        -   replace them with the held part
+        -   if the held part is bad, update it to a better one
+            (biggest?)
+
+        """
+
+        # Apply Quality Filters
+        # FIXME: This is losing identical parts, and I reckon that's
+        #        what causes the persistence memory to be lost
+        # frame_processor.run()
+
+        # Update the Parts
+        # image_processor.set_image_parts(
+        #     frame_processor.retrieve_parts(),
+        # )
+
+        # Apply Censors
+        ip.generate_mask_shapes()
+        ip.compile_masks()
+        ip.apply_censors()
+
+        # Save Output
+        file_output: Image = ip.return_output()
+
+        # # Apply Debug Effects
+        if context.debug_level > DebugLevels.NONE:
+            video_info = VideoInfo(
+                frame,
+                frame_counter,
+                ip.get_image_parts(),
+                context.video_processor,
+                fp,
+                context.debug_level,
+            )
+            file_output = video_info.get_debug_info(
+                file_output,
+                fp,
+            )
+
+        # Write Frame
+        context.video_processor.write_frame(file_output)
+
     def run_video_pipeline(
         self,
         main_files_path: str,
@@ -50,166 +568,197 @@ class MixinVideoPipeline(Mixin):
         function_get_index: Callable[[int, int], str],
         flags: dict[str, bool],
         path_manager: PathManager,
+        detection_service: DetectionService,
         inline_mode: bool,  # TODO: Utilise  # noqa: FBT001
         _test_detection_output: list[list[DetectedPartSchema]],
     ) -> list[Image]:
-        dev_tools = None
         max_index = max(f.index for f in indexed_files)
 
-        for index_file in indexed_files:
-            index = index_file.index
-            file_path = index_file.path
-            file_type = index_file.file_type
-
-            # Check it's an Image
-            if file_type != "video":
-                continue
-
-            # Get Video Capture
-            full_file_path = path_manager.get_save_file_path(file_path)
-            video_processor = VideoProcessor(
-                file_path,
-                full_file_path,
-                flags,
+        # Skip Up to Date Files
+        with open_rebuild_manifest(config, path_manager) as manifest:
+            video_files = skip_up_to_date_files(
+                [f for f in indexed_files if f.file_type == "video"],
+                manifest,
+                path_manager,
             )
 
-            # Build Progress Bar
-            file_name = (
-                full_file_path
-                if path_manager.get_flag_is_using_full_path()
-                else file_path.split(os.sep)[-1]  # noqa: PTH206 # TODO: Fix
-            )
+            for index_file in video_files:
+                index = index_file.index
+                file_path = index_file.path
 
-            progress_bar = progressbar.progressbar(
-                range(video_processor.total_frames),
-                widgets=self._make_progress_bar_widgets(
-                    index_text=function_get_index(index, max_index),
-                    file_name=file_name,
-                    total_amount=video_processor.total_frames,
-                ),
-            )
+                # Get Video Capture
+                full_file_path = path_manager.get_save_file_path(file_path)
+                video_processor = VideoProcessor(
+                    file_path,
+                    full_file_path,
+                    flags,
+                )
 
-            # Get Frame Capture
-            frame_hold = int(
-                config.video_settings.part_frame_hold_seconds
-                * video_processor.get_fps(),
-            )
-            use_persistence = frame_hold > 0
-            fp = FrameProcessor(
-                maximum_miss_frame=frame_hold,
-            )
+                # Build Progress Bar
+                file_name = (
+                    full_file_path
+                    if path_manager.get_flag_is_using_full_path()
+                    else file_path.split(os.sep)[-1]  # noqa: PTH206 # TODO: Fix
+                )
 
-            # Caching
-            cache = Cache(
-                path_manager.get_cache_folder(),
-                path_manager.base_directory,
-                file_path,
-                is_video=True,
-            )
+                index_text = function_get_index(index, max_index)
 
-            # Iterate through Frames
-            for frame_counter, _ in enumerate(progress_bar):
-                # Check Frames
-                ret, frame = video_processor.video_capture.read()
-                if not ret:
-                    break
+                # Sidecar Detections
+                sidecar, sidecar_writer = self._open_sidecars(
+                    file_path, config, path_manager
+                )
 
-                if flags["dev_tools"]:
-                    dev_tools = DevTools(
-                        output_folder=Path(file_path),
-                        main_files_path=Path(main_files_path),
-                        using_full_output_path=path_manager.get_flag_is_using_full_path(),
+                # Detection Pass
+                if (
+                    config.video_settings.two_pass
+                    and not _test_detection_output
+                    and sidecar is None
+                ):
+                    self._detect_video(
+                        file_path,
+                        video_processor,
+                        config=config,
+                        path_manager=path_manager,
+                        detection_service=detection_service,
+                        index_text=index_text,
+                        file_name=file_name,
                     )
 
-                # Handle missing Test Data
-                if _test_detection_output:
-                    test_frame_data = _test_detection_output[frame_counter]
-                else:
-                    test_frame_data = []
+                progress_bar = progressbar.progressbar(
+                    range(video_processor.total_frames),
+                    widgets=self._make_progress_bar_widgets(
+                        index_text=index_text,
+                        file_name=file_name,
+                        total_amount=video_processor.total_frames,
+                    ),
+                )
 
-                # Run Censor Manager
-                ip = ImageProcessor(
-                    file_image=frame,
-                    file_name=file_path,
-                    path_manager=path_manager,
-                    cache=cache,
-                    frame_counter=frame_counter,
+                # Get Frame Capture
+                frame_hold = int(
+                    config.video_settings.part_frame_hold_seconds
+                    * video_processor.get_fps(),
+                )
+                fp = FrameProcessor(
+                    maximum_miss_frame=frame_hold,
+                    use_motion_prediction=(
+                        config.video_settings.part_motion_prediction
+                    ),
+                )
+
+                # Caching
+                cache = Cache(
+                    path_manager.get_cache_folder(),
+                    path_manager.base_directory,
+                    file_path,
+                    is_video=True,
+                    full_hash=config.file_settings.cache_full_hash,
+                )
+
+                context = VideoContext(
+                    file_path=file_path,
+                    main_files_path=main_files_path,
                     config=config,
                     debug_level=debug_level,
-                    dev_tools=dev_tools,
-                    _test_detection_output=test_frame_data,
+                    flags=flags,
+                    path_manager=path_manager,
+                    cache=cache,
+                    video_processor=video_processor,
+                    frame_processor=fp,
+                    use_persistence=frame_hold > 0,
+                    detection_service=detection_service,
+                    test_detection_output=_test_detection_output,
+                    detection_state=VideoDetectionState.from_config(config),
+                    sidecar=sidecar,
+                    sidecar_writer=sidecar_writer,
+                    keyframe_interval=keyframe_interval(
+                        video_processor.get_fps(),
+                        config.video_settings.censoring_fps,
+                    ),
+                    predict_between_keyframes=(
+                        config.video_settings.part_motion_prediction
+                        and frame_hold > 0
+                    ),
                 )
-                ip.generate_parts()
-
-                # # Apply Stability Stuff
-                """
-                NOTE:   This section is used to make videos more stable,
-                        currently the processing effects performed are:
-
-                            -   Holding frames for a certain number of frames
-                                to avoid issues where a part doesn't get
-                                detected, thus causing a flickering effect.
-
-                            -   Maintaining the last frame instead of the
-                                current if the difference is negligible, this
-                                avoids issues where the the detected areas are
-                                slightly different thus causes the censors to
-                                "spasm".
-
-                """
-                if use_persistence:
-                    found_parts = ip.get_image_parts()
-                    fp.tracker.update_tracker(found_parts)
-                    ip.set_image_parts(fp.tracker.get_parts())
-                """
-                -   Keep parts (hold them, if -1, always hold)
-                -   check sizes for parts, flag any bad ones
-                -   replace them with the held part
-                -   if the held part is bad, update it to a better one
-                    (biggest?)
-
-                """
-
-                # Apply Quality Filters
-                # FIXME: This is losing identical parts, and I reckon that's
-                #        what causes the persistence memory to be lost
-                # frame_processor.run()
-
-                # Update the Parts
-                # image_processor.set_image_parts(
-                #     frame_processor.retrieve_parts(),
-                # )
-
-                # Apply Censors
-                ip.generate_mask_shapes()
-                ip.compile_masks()
-                ip.apply_censors()
-
-                # Save Output
-                file_output: Image = ip.return_output()
-
-                # # Apply Debug Effects
-                if debug_level > DebugLevels.NONE:
-                    video_info = VideoInfo(
-                        frame,
-                        frame_counter,
-                        ip.get_image_parts(),
-                        video_processor,
-                        fp,
-                        debug_level,
-                    )
-                    file_output = video_info.get_debug_info(
-                        file_output,
-                        fp,
+
+                # Iterate through Frames
+                # NOTE: Batch N+1 is detected while batch N is being censored
+                batch_size = config.rendering_settings.batch_size
+                frame_buffer: list[tuple[int, Image]] = []
+                pending_batches: deque[PendingFrameBatch] = deque()
+                for frame_counter, _ in enumerate(progress_bar):
+                    # Check Frames
+                    ret, frame = video_processor.video_capture.read()
+                    if not ret:
+                        break
+
+                    # Fill the Batch
+                    frame_buffer.append((frame_counter, frame))
+                    if (
+                        len(frame_buffer) < batch_size
+                        and not video_processor.force_stop
+                    ):
+                        continue
+
+                    pending_batches.append(
+                        self._submit_frame_batch(context, frame_buffer)
                     )
+                    frame_buffer = []
 
-                # Write Frame
-                video_processor.write_frame(file_output)
+                    # Censor the Previous Batch
+                    if len(pending_batches) > 1:
+                        self._render_frame_batch(
+                            context, pending_batches.popleft()
+                        )
 
-                if video_processor.force_stop:
-                    break
+                    if video_processor.force_stop:
+                        break
 
-            video_processor.close_video()
-            cache.close()
+                # Flush Remaining Frames
+                if frame_buffer:
+                    pending_batches.append(
+                        self._submit_frame_batch(context, frame_buffer)
+                    )
+                while pending_batches:
+                    self._render_frame_batch(
+                        context, pending_batches.popleft()
+                    )
+                self._render_lookahead(context)
+
+                self._close_video(context, manifest)
 
         return []  # TODO: Figure a way to implement me
+
+    def run_video_detection_pipeline(
+        self,
+        indexed_files: list[IndexedFile],
+        config: Config,
+        function_get_index: Callable[[int, int], str],
+        path_manager: PathManager,
+        detection_service: DetectionService,
+    ) -> None:
+        """
+        This is the video half of the detect only mode, it runs the
+        detection pass of `video_settings.two_pass` on every video, filling
+        their caches without censoring them.
+
+        :param list[IndexedFile] indexed_files: Found files
+        :param Config config: Config of the run
+        :param Callable[[int, int], str] function_get_index: Makes the index
+            text of the progress bar
+        :param PathManager path_manager: Path manager of the run
+        :param DetectionService detection_service: Service used to detect
+        """
+        max_index = max(f.index for f in indexed_files)
+        for index_file in indexed_files:
+            if index_file.file_type != "video":
+                continue
+
+            self._detect_video(
+                index_file.path,
+                None,
+                config=config,
+                path_manager=path_manager,
+                detection_service=detection_service,
+                index_text=function_get_index(index_file.index, max_index),
+                file_name=path_manager.get_relative_path(index_file.path),
+            )
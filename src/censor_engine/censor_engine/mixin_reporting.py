@@ -1,17 +1,26 @@
 import statistics
 
 from censor_engine.libs.detectors import (
-    enabled_detectors,
     enabled_determiners,
+    get_detector_classes,
+)
+from censor_engine.libs.registries import (
+    DetectorRegistry,
+    ShapeRegistry,
+    StyleRegistry,
 )
-from censor_engine.libs.registries import ShapeRegistry, StyleRegistry
 from censor_engine.models.structs import Mixin
 
 
 class MixinReporting(Mixin):
     # Reporting
     def get_detectors(self) -> list[str]:
-        return [detector.model_name for detector in enabled_detectors]
+        return [
+            detector.model_name
+            for detector in get_detector_classes(
+                list(DetectorRegistry.get_all())
+            )
+        ]
 
     def get_determiners(self) -> list[str]:
         return [detector.model_name for detector in enabled_determiners]
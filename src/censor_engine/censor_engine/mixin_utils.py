@@ -1,5 +1,11 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
 from natsort import natsorted
 
+from censor_engine.models.caching.manifest import RebuildManifest
+from censor_engine.models.config import Config
 from censor_engine.models.structs import IndexedFile, Mixin
 from censor_engine.paths import PathManager
 
@@ -7,6 +13,62 @@ APPROVED_FORMATS_IMAGE = [".jpg", ".jpeg", ".png", ".webp"]
 APPROVED_FORMATS_VIDEO = [".mp4", ".webm", ".mov"]
 
 
+@contextmanager
+def open_rebuild_manifest(
+    config: Config,
+    path_manager: PathManager,
+) -> Iterator[RebuildManifest | None]:
+    """
+    Opens the rebuild manifest of the censored folder, for
+    `file_settings.incremental_rebuild`, it's closed when the block exits
+    (also on errors).
+
+    :param Config config: Config of the run
+    :param PathManager path_manager: Path manager of the run
+    :return Iterator[RebuildManifest | None]: Manifest, None if not
+        rebuilding incrementally (or in test mode)
+    """
+    if not config.file_settings.incremental_rebuild or path_manager.test_mode:
+        yield None
+        return
+
+    manifest = RebuildManifest(path_manager.get_censored_folder(), config)
+    try:
+        yield manifest
+    finally:
+        manifest.close()
+
+
+def skip_up_to_date_files(
+    indexed_files: list[IndexedFile],
+    manifest: RebuildManifest | None,
+    path_manager: PathManager,
+) -> list[IndexedFile]:
+    """
+    Removes the files whose censored file is up to date.
+
+    :param list[IndexedFile] indexed_files: Files to censor
+    :param RebuildManifest | None manifest: Rebuild manifest, None keeps
+        every file
+    :param PathManager path_manager: Path manager of the run
+    :return list[IndexedFile]: Files to censor
+    """
+    if manifest is None:
+        return indexed_files
+
+    remaining_files = [
+        index_file
+        for index_file in indexed_files
+        if not manifest.is_up_to_date(
+            path_manager.get_relative_path(index_file.path),
+            Path(index_file.path),
+        )
+    ]
+    if skipped := len(indexed_files) - len(remaining_files):
+        print(f"Skipped {skipped} Up to Date File(s)")  # noqa: T201
+    return remaining_files
+
+
 class MixinUtils(Mixin):
     """
     This Mixin is used to hold the misc/utils functions.
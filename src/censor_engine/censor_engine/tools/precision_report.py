@@ -0,0 +1,271 @@
+import argparse
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from censor_engine.censor_engine.tools.config_previewer.example_image import (
+    ImageGenerator,
+)
+from censor_engine.libs.detectors.box_based_detectors.yolo_backends import (
+    OnnxYoloBackend,
+    RawDetections,
+    TorchYoloBackend,
+    YoloBackend,
+)
+from censor_engine.models.enums import InferenceBackend, InferencePrecision
+from censor_engine.models.structs.boxes import iou_matrix
+from censor_engine.typing import Image
+
+"""
+This is used to check how much accuracy the reduced precisions lose (see
+`ai_settings.inference_precision`), compared to the FP32 model.
+
+It runs the FP32 model and the reduced one over the synthetic test image (the
+one used by the config previewer), the baseline images of the tests, and any
+folders given, and reports how many of the FP32 parts are still found.
+
+Usage:
+    uv run python scripts/precision_report.py --precision int8 \
+        --folder path/to/images
+
+"""
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".webp", ".bmp")
+TEST_DATA_FOLDER = Path("tests/00_test_data")
+TEST_DATA_PATTERN = "expected.*"  # Baselines, Not the Outputs of a Run
+
+
+@dataclass(slots=True)
+class PrecisionReport:
+    """
+    This is the accuracy (and speed) of a precision against FP32.
+
+    A part counts as found if the reduced model has a part of the same label
+    overlapping it by at least the IoU threshold.
+
+    """
+
+    precision: InferencePrecision
+    image_count: int = 0
+    reference_parts: int = 0
+    candidate_parts: int = 0
+    matched_parts: int = 0
+    reference_seconds: float = 0.0
+    candidate_seconds: float = 0.0
+    ious: list[float] = field(default_factory=list)
+    score_deltas: list[float] = field(default_factory=list)
+
+    @property
+    def recall(self) -> float:
+        """Share of the FP32 parts that were found."""
+        if self.reference_parts == 0:
+            return 1.0
+        return self.matched_parts / self.reference_parts
+
+    @property
+    def precision_rate(self) -> float:
+        """Share of the found parts that FP32 also found."""
+        if self.candidate_parts == 0:
+            return 1.0
+        return self.matched_parts / self.candidate_parts
+
+    @property
+    def mean_iou(self) -> float:
+        return float(np.mean(self.ious)) if self.ious else 1.0
+
+    @property
+    def mean_score_delta(self) -> float:
+        return float(np.mean(self.score_deltas)) if self.score_deltas else 0.0
+
+    @property
+    def speedup(self) -> float:
+        if self.candidate_seconds == 0:
+            return 1.0
+        return self.reference_seconds / self.candidate_seconds
+
+    def add_image(
+        self,
+        reference: RawDetections,
+        candidate: RawDetections,
+        iou_threshold: float,
+    ) -> None:
+        """
+        Matches the parts of one image, each FP32 part is paired with the
+        best overlapping unmatched part of the same label.
+
+        :param RawDetections reference: FP32 output
+        :param RawDetections candidate: Reduced precision output
+        :param float iou_threshold: Minimum IoU for a match
+        """
+        self.image_count += 1
+        self.reference_parts += len(reference.scores)
+        self.candidate_parts += len(candidate.scores)
+        if len(reference.scores) == 0 or len(candidate.scores) == 0:
+            return
+
+        overlaps = iou_matrix(reference.xyxy, candidate.xyxy)
+        overlaps[reference.classes[:, None] != candidate.classes[None, :]] = 0
+
+        for reference_index in np.argsort(-reference.scores):
+            candidate_index = int(overlaps[reference_index].argmax())
+            overlap = overlaps[reference_index, candidate_index]
+            if overlap < iou_threshold:
+                continue
+
+            overlaps[:, candidate_index] = 0  # Only Match Once
+            self.matched_parts += 1
+            self.ious.append(float(overlap))
+            self.score_deltas.append(
+                float(
+                    candidate.scores[candidate_index]
+                    - reference.scores[reference_index]
+                )
+            )
+
+    def as_text(self) -> str:
+        return "\n".join(
+            [
+                f"Precision: {self.precision.name} (against FP32)",
+                f"Images: {self.image_count}",
+                (
+                    f"Parts (FP32 / {self.precision.name}): "
+                    f"{self.reference_parts} / {self.candidate_parts}"
+                ),
+                f"Recall: {self.recall:.2%}",
+                f"Precision: {self.precision_rate:.2%}",
+                f"Mean IoU: {self.mean_iou:.3f}",
+                f"Mean Score Delta: {self.mean_score_delta:+.4f}",
+                f"Speed Up: {self.speedup:.2f}x",
+            ]
+        )
+
+
+def load_report_images(
+    folders: list[Path],
+    *,
+    include_test_data: bool = True,
+) -> list[Image]:
+    """
+    Loads the synthetic test image, the baseline images of the tests (see
+    `TEST_DATA_FOLDER`), and every image in the folders.
+
+    :param list[Path] folders: Folders of images to add
+    :param bool include_test_data: Whether to add the tests' baseline
+        images, defaults to True
+    :return list[Image]: Loaded images
+    """
+    paths: list[Path] = []
+    if include_test_data:
+        paths.extend(sorted(TEST_DATA_FOLDER.rglob(TEST_DATA_PATTERN)))
+    for folder in folders:
+        paths.extend(sorted(folder.rglob("*")))
+
+    images: list[Image] = [ImageGenerator().make_test_image()]
+    images.extend(
+        cv2.imread(str(path))  # type: ignore
+        for path in paths
+        if path.suffix.lower() in IMAGE_EXTENSIONS
+    )
+    return [image for image in images if image is not None]
+
+
+def make_backend(
+    backend: InferenceBackend,
+    weights_path: Path,
+    precision: InferencePrecision,
+) -> YoloBackend:
+    """Makes the backend at the given precision."""
+    if backend == InferenceBackend.ONNX:
+        return OnnxYoloBackend(weights_path, precision=precision)
+    return TorchYoloBackend(weights_path, precision=precision)
+
+
+def build_precision_report(
+    images: list[Image],
+    precision: InferencePrecision,
+    *,
+    backend: InferenceBackend = InferenceBackend.ONNX,
+    weights_path: Path = Path("tools/models/320n.pt"),
+    iou_threshold: float = 0.5,
+) -> PrecisionReport:
+    """
+    Runs the FP32 and the reduced precision model over the images and
+    compares them.
+
+    :param list[Image] images: Images to compare on
+    :param InferencePrecision precision: Precision to check
+    :param InferenceBackend backend: Backend to run, defaults to ONNX
+    :param Path weights_path: Weights of the model, defaults to the 320n
+    :param float iou_threshold: Minimum IoU for a match, defaults to 0.5
+    :return PrecisionReport: Accuracy and speed of the precision
+    """
+    reference_model = make_backend(
+        backend, weights_path, InferencePrecision.FP32
+    )
+    candidate_model = make_backend(backend, weights_path, precision)
+
+    report = PrecisionReport(precision)
+    for image in images:
+        start = time.perf_counter()
+        reference = reference_model.predict([image])[0]
+        report.reference_seconds += time.perf_counter() - start
+
+        start = time.perf_counter()
+        candidate = candidate_model.predict([image])[0]
+        report.candidate_seconds += time.perf_counter() - start
+
+        report.add_image(reference, candidate, iou_threshold)
+
+    return report
+
+
+def main() -> None:
+    """Prints the report for the command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Compares a reduced precision NudeNet model with FP32",
+    )
+    parser.add_argument(
+        "--precision",
+        choices=["fp16", "int8"],
+        default="int8",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=["onnx", "pytorch"],
+        default="onnx",
+    )
+    parser.add_argument(
+        "--weights",
+        type=Path,
+        default=Path("tools/models/320n.pt"),
+    )
+    parser.add_argument(
+        "--folder",
+        type=Path,
+        action="append",
+        default=[],
+        help="Folder of images to add to the test images",
+    )
+    parser.add_argument(
+        "--skip-test-data",
+        action="store_true",
+        help=f"Leaves out the baseline images in {TEST_DATA_FOLDER}",
+    )
+    args = parser.parse_args()
+
+    report = build_precision_report(
+        load_report_images(
+            args.folder, include_test_data=not args.skip_test_data
+        ),
+        getattr(InferencePrecision, args.precision.upper()),
+        backend=getattr(InferenceBackend, args.backend.upper()),
+        weights_path=args.weights,
+    )
+    print(report.as_text())  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -16,10 +16,14 @@ class FrameProcessor:
     """
 
     maximum_miss_frame: int
+    use_motion_prediction: bool = False
 
     frame_lag_counter: int = field(default=0, init=False)
 
     tracker: Tracker = field(init=False)
 
     def __post_init__(self):
-        self.tracker = Tracker(max_missed=self.maximum_miss_frame)
+        self.tracker = Tracker(
+            max_missed=self.maximum_miss_frame,
+            use_motion_prediction=self.use_motion_prediction,
+        )
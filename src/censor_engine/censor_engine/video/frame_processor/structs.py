@@ -1,6 +1,63 @@
 from dataclasses import dataclass, field
 
+import numpy as np
+
 from censor_engine.detected_part import Part
+from censor_engine.models.structs.boxes import (
+    assign_pairs,
+    iou_matrix,
+    xywh_to_xyxy,
+)
+
+
+@dataclass(slots=True)
+class MotionModel:
+    """
+    This is a constant velocity model of a tracked part's box, used to move
+    the part while it isn't detected (missed frames, or the frames between
+    keyframes) rather than leaving it where it was last seen.
+
+    The velocity is smoothed between detections, such that a single jittery
+    box doesn't throw the part off.
+
+    :param tuple[int, int, int, int] box: Last detected box (x, y, w, h)
+    :param float smoothing: Weight of the newest velocity, defaults to 0.5
+    """
+
+    box: tuple[int, int, int, int]
+    smoothing: float = 0.5
+
+    velocity: np.ndarray = field(
+        init=False, default_factory=lambda: np.zeros(4)
+    )
+    frames_since_seen: int = field(init=False, default=0)
+
+    def observe(self, box: tuple[int, int, int, int]) -> None:
+        """
+        Updates the model with a newly detected box, on the frame after the
+        last one (detected or predicted).
+
+        :param tuple[int, int, int, int] box: Detected box (x, y, w, h)
+        """
+        measured = np.subtract(box, self.box, dtype=np.float64) / (
+            self.frames_since_seen + 1
+        )
+        self.velocity = (
+            self.smoothing * measured + (1 - self.smoothing) * self.velocity
+        )
+        self.box = box
+        self.frames_since_seen = 0
+
+    def predict(self) -> tuple[int, int, int, int]:
+        """
+        Moves on a frame without a detection.
+
+        :return tuple[int, int, int, int]: Predicted box (x, y, w, h)
+        """
+        self.frames_since_seen += 1
+        box = np.add(self.box, self.velocity * self.frames_since_seen)
+        box[2:] = np.maximum(box[2:], 1)
+        return tuple(int(value) for value in np.round(box))  # type: ignore
 
 
 @dataclass(slots=True)
@@ -21,6 +78,7 @@ class TrackedPart:
 
     # Internal
     misses: int = 0
+    motion: MotionModel | None = None
 
     def __post_init__(self):
         self.box = self.part.relative_box
@@ -28,39 +86,167 @@ class TrackedPart:
         self.part_class = self.part.get_name()
 
 
+def _group_ids(values: list) -> np.ndarray:
+    """Turns labels (or group IDs) into integers that compare the same."""
+    lookup: dict = {}
+    return np.array(
+        [lookup.setdefault(value, len(lookup)) for value in values]
+    )
+
+
+def _approx_region_matrix(
+    tracked_boxes: np.ndarray,
+    approximate_percents: np.ndarray,
+    candidate_boxes: np.ndarray,
+) -> np.ndarray:
+    """
+    This is `PartArea.check_in_approx_region` for every tracked part against
+    every candidate at once, the candidate's corners have to be inside the
+    approximate regions around the tracked part's corners.
+
+    :param np.ndarray tracked_boxes: Boxes of the tracked parts (N, 4) XYWH
+    :param np.ndarray approximate_percents: Search region of each tracked
+        part (N,)
+    :param np.ndarray candidate_boxes: Boxes of the candidates (M, 4) XYWH
+    :return np.ndarray: Which candidates are in the region of which tracked
+        parts (N, M)
+    """
+    tracked_boxes = tracked_boxes.astype(np.int64)
+    candidate_boxes = candidate_boxes.astype(np.int64)
+
+    # Approximate Regions (Same Integer Maths as `ApproximateRegion`)
+    approximate_sizes = (
+        approximate_percents[:, None] * tracked_boxes[:, 2:]
+    ).astype(np.int64)
+    region_starts = approximate_sizes // 2
+
+    in_region = np.ones((len(tracked_boxes), len(candidate_boxes)), dtype=bool)
+    for tracked_corner, candidate_corner in (
+        (tracked_boxes[:, :2], candidate_boxes[:, :2]),  # Top Left
+        (
+            tracked_boxes[:, :2] + tracked_boxes[:, 2:],
+            candidate_boxes[:, :2] + candidate_boxes[:, 2:],
+        ),  # Bottom Right
+    ):
+        lower = tracked_corner - region_starts
+        upper = lower + approximate_sizes
+        in_region &= (
+            (candidate_corner[None, :, :] >= lower[:, None, :])
+            & (candidate_corner[None, :, :] <= upper[:, None, :])
+        ).all(axis=2)
+    return in_region
+
+
 @dataclass(slots=True)
 class Tracker:
+    """
+    This keeps track of the parts between frames, such that a part that's
+    missed for a few frames (up to `max_missed`) is still censored.
+
+    With `use_motion_prediction`, the parts that aren't detected are moved
+    along their motion (see `MotionModel`) rather than held in place, a part
+    moved out of the frame is dropped.
+
+    Every frame, the new parts are matched against the tracked parts in one
+    go. A pair has to be in the tracked part's approximate region and share
+    the class, merge group, or persistence group, the pairs are then
+    assigned one to one by their IoU.
+
+    """
+
     max_missed: int | None
+    use_motion_prediction: bool = False
 
     # Internal
     _next_track_id: int = 0
     _tracked_parts: list[TrackedPart] = field(default_factory=list)
 
-    # Tested Features
-    def __compare_area(
-        self, tracked_part: TrackedPart, candidate_part: Part
-    ) -> bool:
-        return tracked_part.part.part_area.check_in_approx_region(
-            candidate_part.part_area.region
+    def __match_matrix(
+        self,
+        candidate_parts: list[Part],
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Compares every tracked part with every candidate.
+
+        :param list[Part] candidate_parts: Parts of the new frame
+        :return tuple[np.ndarray, ...]: IoU, same area, same type, and same
+            merge group matrices, each of shape (tracked, candidates)
+        """
+        tracked_parts = [tracked.part for tracked in self._tracked_parts]
+        tracked_boxes = np.array(
+            [part.part_area.relative_box for part in tracked_parts]
+        ).reshape(-1, 4)
+        candidate_boxes = np.array(
+            [part.part_area.relative_box for part in candidate_parts]
+        ).reshape(-1, 4)
+
+        same_area = _approx_region_matrix(
+            tracked_boxes,
+            np.array(
+                [
+                    part.part_area.approximate_percent_region
+                    for part in tracked_parts
+                ]
+            ),
+            candidate_boxes,
         )
 
-    def __compare_merge_group(
-        self, tracked_part: TrackedPart, candidate_part: Part
-    ) -> bool:
-        return tracked_part.merge_group_id == candidate_part.merge_group_id
-
-    def __compare_persistence_group(
-        self, tracked_part: TrackedPart, candidate_part: Part
-    ) -> bool:
-        return (
-            tracked_part.part.persistence_group_id
-            == candidate_part.persistence_group_id
+        # Groups (as IDs Shared by the Tracked and New Parts)
+        all_parts = tracked_parts + candidate_parts
+        amount = len(tracked_parts)
+        same = []
+        for values in (
+            [tracked.part_class for tracked in self._tracked_parts]
+            + [part.get_name() for part in candidate_parts],
+            [part.merge_group_id for part in all_parts],
+            [part.persistence_group_id for part in all_parts],
+        ):
+            ids = _group_ids(values)
+            same.append(ids[:amount, None] == ids[None, amount:])
+        same_type, same_merge_group, same_persistence_group = same
+
+        ious = iou_matrix(
+            xywh_to_xyxy(tracked_boxes),
+            xywh_to_xyxy(candidate_boxes),
         )
+        valid = same_area & (
+            same_type | same_merge_group | same_persistence_group
+        )
+        return ious, valid, same_type, same_merge_group
+
+    def __move_part(self, tracked_part: TrackedPart) -> bool:
+        """
+        Moves a part that wasn't detected to its predicted box, does nothing
+        without motion prediction.
+
+        :param TrackedPart tracked_part: Part to move
+        :return bool: False if the part moved out of the frame
+        """
+        if tracked_part.motion is None:
+            return True
 
-    def __compare_part_class(
-        self, tracked_part: TrackedPart, candidate_part: Part
-    ) -> bool:
-        return tracked_part.part_class == candidate_part.get_name()
+        part = tracked_part.part
+        x, y, width, height = tracked_part.motion.predict()
+        image_height, image_width = part.image_shape[:2]
+        if (
+            x >= image_width
+            or y >= image_height
+            or x + width <= 0
+            or (y + height <= 0)
+        ):
+            return False
+
+        tracked_part.part = Part(
+            part_name=part.part_name,
+            part_id=part.part_id,
+            score=part.score,
+            relative_box=(x, y, width, height),
+            config=part.config,
+            file_uuid=part.file_uuid,
+            image_shape=part.image_shape,
+        )
+        tracked_part.box = tracked_part.part.relative_box
+        return True
 
     # Public Methods
     def update_tracker(self, list_of_parts: list[Part]) -> None:
@@ -68,88 +254,83 @@ class Tracker:
         if self.max_missed is None:
             return
 
-        # Temp Variables
-        updated_indices: list[int] = []
+        pairs: list[tuple[int, int]] = []
+        duplicates = np.zeros(len(self._tracked_parts), dtype=bool)
+        if self._tracked_parts and list_of_parts:
+            ious, valid, same_type, same_merge_group = self.__match_matrix(
+                list_of_parts
+            )
+            pairs = assign_pairs(ious, valid)
 
-        # Iteration
-        # # First Frame Handling
-        if self._next_track_id == 0:
-            for part in list_of_parts:
-                self._tracked_parts.append(
-                    TrackedPart(part=part, track_id=self._next_track_id)
-                )
-                self._next_track_id += 1
-            return
+            # Tracked Parts Matching an Already Matched Part are Duplicates
+            matched_candidates = np.zeros(len(list_of_parts), dtype=bool)
+            matched_candidates[[candidate for _, candidate in pairs]] = True
+            duplicates = (valid & matched_candidates[None, :]).any(axis=1)
 
-        # # Frames Onward
-        for part in list_of_parts:
-            is_part_found = False
-            addition_indices: list[int] = []
-            for index, tracked_part in enumerate(self._tracked_parts):
-                # Checks
-                same_area = self.__compare_area(tracked_part, part)
-                same_type = self.__compare_part_class(tracked_part, part)
-
-                same_merge_group = self.__compare_merge_group(
-                    tracked_part, part
-                )
-                same_persistence_group = self.__compare_persistence_group(
-                    tracked_part, part
-                )
-
-                # Confirmation
-                same_common = same_area
-                same_combined_part = (
-                    same_type or same_merge_group or same_persistence_group
-                )
-                same_part = same_common and same_combined_part
-
-                # Found Part
-                # NOTE: This should break but it needs to do cleanup for any
-                #       other parts
-                if same_part and is_part_found:
-                    addition_indices.append(index)
-                if same_part:
-                    self._tracked_parts[index] = TrackedPart(
+        # Update, Age, and Remove Expired Parts (in One Pass)
+        matches = dict(pairs)
+        updated_parts = []
+        for index, tracked_part in enumerate(self._tracked_parts):
+            if (candidate := matches.get(index)) is not None:
+                part = list_of_parts[candidate]
+                if tracked_part.motion is not None:
+                    tracked_part.motion.observe(part.relative_box)
+                updated_parts.append(
+                    TrackedPart(
                         part=part,
                         track_id=tracked_part.track_id,
-                        s_area=same_area,
-                        s_merge=same_merge_group,
-                        s_type=same_type,
+                        s_area=True,
+                        s_merge=bool(same_merge_group[index, candidate]),
+                        s_type=bool(same_type[index, candidate]),
+                        motion=tracked_part.motion,
                     )
-                    updated_indices.append(index)
-                    is_part_found = True
-
-            # Check if Part Not Found
-            if not is_part_found:
-                self._tracked_parts.append(
-                    TrackedPart(part=part, track_id=self._next_track_id)
                 )
-                # NOTE: Avoid Aging New Parts
-                updated_indices.append(self._next_track_id)
-                self._next_track_id += 1
-
-            # Remove Duplicates
-            for index in addition_indices:
-                self._tracked_parts = [
-                    tracked_part
-                    for index, tracked_part in enumerate(self._tracked_parts)
-                    if index not in addition_indices
-                ]
+            elif not duplicates[index]:
+                tracked_part.misses += 1
+                if tracked_part.misses <= self.max_missed and (
+                    self.__move_part(tracked_part)
+                ):
+                    updated_parts.append(tracked_part)
 
-        # Update Misses
-        for index, tracked_part in enumerate(self._tracked_parts):
-            if index in updated_indices:
+        # New Parts
+        matched = set(matches.values())
+        for candidate, part in enumerate(list_of_parts):
+            if candidate in matched:
                 continue
 
-            tracked_part.misses += 1
+            updated_parts.append(
+                TrackedPart(
+                    part=part,
+                    track_id=self._next_track_id,
+                    motion=(
+                        MotionModel(part.relative_box)
+                        if self.use_motion_prediction
+                        else None
+                    ),
+                )
+            )
+            self._next_track_id += 1
+
+        self._tracked_parts = updated_parts
+
+    def predict_frame(self) -> None:
+        """
+        Moves the tracked parts along their motion, for frames that aren't
+        detected (i.e., between keyframes). The parts aren't aged, since
+        they weren't missed.
+
+        """
+        if self.max_missed is None or not self.use_motion_prediction:
+            return
 
-        # Remove Expired Parts
         self._tracked_parts = [
             tracked_part
             for tracked_part in self._tracked_parts
-            if tracked_part.misses <= self.max_missed
+            if self.__move_part(tracked_part)
         ]
 
     def get_parts(self) -> list[Part]:
         return [tracked_part.part for tracked_part in self._tracked_parts]
+
+    def get_track_ids(self) -> list[int]:
+        return [tracked_part.track_id for tracked_part in self._tracked_parts]
@@ -24,6 +24,9 @@ def handle_exit(signum, frame) -> None:  # noqa: ANN001, ARG001
         "*** Stop requested — finishing current frame and muxing partial "
         "video. ***"
     )
+    # NOTE: Only the flag is set, the pipeline stops at the next frame and
+    # closes (so flushes) the video cache itself, flushing here could start
+    # a transaction inside the one being interrupted
     VideoProcessor.force_stop = True  # type: ignore
 
 
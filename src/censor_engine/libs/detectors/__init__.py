@@ -1,19 +1,102 @@
+from typing import TYPE_CHECKING
+
+from censor_engine.libs.registries import DetectorRegistry
 from censor_engine.models.lib_models.detectors import Detector
 
 from .box_based_detectors.nude_net import NudeNetDetector
 from .determination_tools import ImageGenreDeterminer
 
-"""
-This is used for enabling new models. You may notice it's different from the
-other catalogue files, that's due to the fact it doesn't need to use config
-files (yet, maybe, might be overkill)
-"""
+if TYPE_CHECKING:
+    from censor_engine.models.config import Config
 
+"""
+This is used for enabling new models. Detectors register themselves with the
+`DetectorRegistry` and are picked in the config (`ai_settings.detectors`),
+a detector is only used if it can find at least one of the enabled parts.
 
-enabled_detectors: list[Detector] = [
-    NudeNetDetector(),  # type: ignore # FIXME: at some point
-]
+The detectors don't load their models when they're made, only when they're
+first used (or warmed up), so importing this is cheap.
+"""
 
 enabled_determiners = [
     ImageGenreDeterminer(),
 ]
+
+_detector_instances: dict[str, Detector] = {}  # One per Detector, Keeps Models
+
+
+def get_detector_classes(names: list[str]) -> list[type[Detector]]:
+    """
+    Gets the registered detector classes by name.
+
+    :param list[str] names: Class names of the detectors
+    :raises ValueError: If a detector isn't registered
+    :return list[type[Detector]]: Detector classes, in the same order
+    """
+    registered = DetectorRegistry.get_all()
+    if missing := [name for name in names if name not in registered]:
+        msg = (
+            f"Unknown detector(s): {', '.join(missing)}, "
+            f"available: {', '.join(registered)}"
+        )
+        raise ValueError(msg)
+
+    return [registered[name] for name in names]
+
+
+def get_enabled_detectors(config: "Config") -> list[Detector]:
+    """
+    Gets the detectors chosen in the config, skipping the ones that can't
+    find any of the enabled parts (so their models are never loaded).
+
+    :param Config config: Config of the run
+    :return list[Detector]: Detectors to run
+    """
+    enabled_parts = set(config.censor_settings.enabled_parts)
+
+    detectors = []
+    for detector_class in get_detector_classes(config.ai_settings.detectors):
+        if not enabled_parts.intersection(detector_class.model_classifiers):
+            continue
+
+        name = detector_class.__name__
+        if name not in _detector_instances:
+            _detector_instances[name] = detector_class()
+        detectors.append(_detector_instances[name])
+
+    return detectors
+
+
+def warmup_detectors(config: "Config") -> None:
+    """
+    Loads the models of the enabled detectors. The models are otherwise
+    loaded on their first detection.
+
+    :param Config config: Config of the run
+    """
+    for detector in get_enabled_detectors(config):
+        detector.warmup()
+
+
+def configure_detectors(config: "Config") -> list[Detector]:
+    """
+    Applies the config (e.g., inference backend) to the enabled detectors.
+    Changing the AI settings unloads the models, so they're reloaded lazily.
+
+    :param Config config: Config of the run
+    :return list[Detector]: Enabled detectors
+    """
+    detectors = get_enabled_detectors(config)
+    for detector in detectors:
+        detector.configure(config)
+    return detectors
+
+
+__all__ = [
+    "NudeNetDetector",
+    "configure_detectors",
+    "enabled_determiners",
+    "get_detector_classes",
+    "get_enabled_detectors",
+    "warmup_detectors",
+]
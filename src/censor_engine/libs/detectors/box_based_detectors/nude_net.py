@@ -1,73 +1,171 @@
 import logging
+from collections.abc import Sequence
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-import torch
-from ultralytics import YOLO
+import numpy as np
 
+from censor_engine.libs.detectors.preprocessing import SharedPreprocessing
+from censor_engine.libs.registries import DetectorRegistry
+from censor_engine.models.enums import InferenceBackend, InferencePrecision
 from censor_engine.models.lib_models.detectors import (
     DetectedPartSchema,
     Detector,
 )
 from censor_engine.typing import Image
 
+from .yolo_backends import (
+    OnnxYoloBackend,
+    RawDetections,
+    TorchYoloBackend,
+    YoloBackend,
+)
+
+if TYPE_CHECKING:
+    from censor_engine.models.config import Config
+
 logging.getLogger("ultralytics").setLevel(logging.ERROR)
 
+SMALL_MODEL_PATH = Path("tools/models/320n.pt")
+BIG_MODEL_PATH = Path("tools/models/640m.pt")
+
 
 class NudeNetModel:
-    model: YOLO
-    device: int | str
+    """
+    This wraps the NudeNet YOLO model.
+
+    The model is only loaded on the first detection (or `warmup()`), since
+    loading it imports torch and ultralytics (or ONNX Runtime), reads the
+    weights, and probes for CUDA. Previews and fully cached runs never need
+    any of that.
+
+    """
+
+    use_bigger_model: bool
+    backend: InferenceBackend
+    threads: int
+    precision: InferencePrecision
     image_count: int
 
     cache_limit: int = 1000
 
-    def __init__(self, *, use_bigger_model: bool = False):
-        # Model Check
-        model_exists = Path("tools/models/640m.pt").exists()
-        used_model = (
-            "640m.pt" if use_bigger_model and model_exists else "320n.pt"
-        )
-        self.model = YOLO(f"tools/models/{used_model}")
-        print(f"NudeNet model: {used_model}")  # noqa: T201
+    _model: YoloBackend | None
 
-        # GPU Check
-        self.device = 0 if torch.cuda.is_available() else "cpu"
-        print(f"NudeNet using GPU?: {self.device != 'cpu'}")  # noqa: T201
+    def __init__(
+        self,
+        *,
+        use_bigger_model: bool = False,
+        backend: InferenceBackend = InferenceBackend.PYTORCH,
+        threads: int = 0,
+        precision: InferencePrecision = InferencePrecision.FP32,
+    ):
+        self.use_bigger_model = use_bigger_model
+        self.backend = backend
+        self.threads = threads
+        self.precision = precision
+        self._model = None
 
         # Cache Fixer
         self.image_count = 0
 
-    def detect(self, image_path: str):
-        if self.image_count % self.cache_limit == 0:
-            torch.cuda.empty_cache()
-        else:
-            self.image_count += 1
+    @property
+    def model(self) -> YoloBackend:
+        if self._model is None:
+            self.load()
+        return self._model  # type: ignore
 
-        with torch.no_grad():
-            results = self.model(
-                image_path, device=self.device, verbose=False
-            )[0]
-        boxes = results.boxes
+    def is_loaded(self) -> bool:
+        return self._model is not None
 
-        # Save Resources if Empty
-        if boxes is None or len(boxes) == 0:
-            return []
+    def configure(
+        self,
+        backend: InferenceBackend,
+        threads: int,
+        precision: InferencePrecision = InferencePrecision.FP32,
+    ) -> None:
+        """
+        Changes the inference backend, thread count, and precision, the model
+        is unloaded if they changed, so it's loaded again with the new
+        settings.
+
+        :param InferenceBackend backend: Runtime used for the model
+        :param int threads: Amount of CPU threads, 0 for the default
+        :param InferencePrecision precision: Precision of the model, defaults
+            to FP32
+        """
+        settings = (backend, threads, precision)
+        if settings == (self.backend, self.threads, self.precision):
+            return
 
-        # Move Data to CPU
-        xyxy = boxes.xyxy.cpu()
-        conf = boxes.conf.cpu()
-        cls = boxes.cls.cpu()
+        self.backend, self.threads, self.precision = settings
+        self._model = None
 
-        # Convert to Numpy
-        xyxy = xyxy.numpy()
-        conf = conf.numpy()
-        cls = cls.numpy().astype(int)
+    def load(self) -> None:
+        """
+        Loads the YOLO model with the chosen backend, does nothing if it's
+        already loaded.
 
-        names = results.names
+        """
+        if self._model is not None:
+            return
+
+        # Model Check
+        model_path = (
+            BIG_MODEL_PATH
+            if self.use_bigger_model and BIG_MODEL_PATH.exists()
+            else SMALL_MODEL_PATH
+        )
+        backend_class = (
+            OnnxYoloBackend
+            if self.backend == InferenceBackend.ONNX
+            else TorchYoloBackend
+        )
+        self._model = backend_class(
+            model_path,
+            self.threads,
+            self.precision,
+        )
+        print(  # noqa: T201
+            f"NudeNet model: {model_path.name} "
+            f"({self.backend.name.lower()}, {self.precision.name.lower()})"
+        )
+
+    def warmup(self) -> None:
+        """
+        Loads the model and runs it once on a blank image, such that the
+        first real detection doesn't pay for the setup. Used by long running
+        processes.
+
+        """
+        self.detect(np.zeros((320, 320, 3), dtype=np.uint8))
+
+    def __free_gpu_cache(self, image_amount: int) -> None:
+        """
+        Empties the CUDA cache every `cache_limit` images, long runs will
+        otherwise slowly fill the GPU memory.
+
+        :param int image_amount: Amount of images about to be processed
+        """
+        if not isinstance(self.model, TorchYoloBackend):
+            return
+
+        import torch  # noqa: PLC0415
+
+        self.image_count += image_amount
+        if self.image_count >= self.cache_limit:
+            torch.cuda.empty_cache()
+            self.image_count = 0
+
+    def __format_results(
+        self,
+        results: RawDetections,
+    ) -> list[dict[str, Any]]:
+        names = self.model.names
 
         # Build Output
         return [
             {
-                "class": names[c],
+                "class": names[int(c)],
                 "score": float(s),
                 "box": [
                     int(x1),
@@ -76,16 +174,63 @@ class NudeNetModel:
                     int(y2 - y1),  # height
                 ],
             }
-            for (x1, y1, x2, y2), s, c in zip(xyxy, conf, cls, strict=False)
+            for (x1, y1, x2, y2), s, c in zip(
+                results.xyxy, results.scores, results.classes, strict=False
+            )
         ]
 
+    def detect(self, image_path: str | Image) -> list[dict[str, Any]]:
+        return self.detect_batch([image_path], batch_size=1)[0]
+
+    def detect_batch(
+        self,
+        images: Sequence[str | Image],
+        batch_size: int,
+        preprocessed: SharedPreprocessing | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Runs the model over the images in groups of up to `batch_size` (of
+        the same letterboxed size), each group is a single model call. The
+        output keeps the order of the input.
+
+        :param Sequence[str | Image] images: Image paths or decoded images
+        :param int batch_size: Amount of images per model call
+        :param SharedPreprocessing | None preprocessed: Preprocessing shared
+            with the other detectors, defaults to None (done by the model)
+        :return list[list[dict[str, Any]]]: Found parts per image
+        """
+        batch_size = max(batch_size, 1)
+        if preprocessed is not None:
+            self.__free_gpu_cache(len(images))
+            return [
+                self.__format_results(result)
+                for result in self.model.predict_prepared(
+                    preprocessed.get(self.model.input_form), batch_size
+                )
+            ]
+
+        output: list[list[dict[str, Any]]] = []
+        for start in range(0, len(images), batch_size):
+            batch = images[start : start + batch_size]
+            self.__free_gpu_cache(len(batch))
+
+            results = self.model.predict(batch)
+            output.extend(self.__format_results(result) for result in results)
+
+        return output
+
 
+@DetectorRegistry.register()
 class NudeNetDetector(Detector):
     """
     This Detector is the code of CensorEngine, it is the NudeNet model.
 
     This handles the core labels of the engine.
 
+    In cascade mode (`ai_settings.cascade_models`), every image goes through
+    the small model (320n) and only the images it's unsure about go through
+    the big model (640m), whose output replaces the small model's.
+
     """
 
     model_name: str = "NudeNet"
@@ -109,11 +254,85 @@ class NudeNetDetector(Detector):
         "MALE_GENITALIA_EXPOSED",
         "MALE_BREAST_EXPOSED",
     )
-    model_object = NudeNetModel()
+    model_object = NudeNetModel()  # Lazy, loaded on first detection
+    cascade_model_object = NudeNetModel(use_bigger_model=True)
 
-    def detect_image(
+    # Cascade
+    cascade_band: tuple[float, float] | None = None
+    minimum_scores: dict[str, float] = {}  # noqa: RUF012
+    enabled_parts: frozenset[str] | None = None  # None for Every Part
+
+    def configure(self, config: "Config") -> None:
+        ai_settings = config.ai_settings
+        for model_object in (self.model_object, self.cascade_model_object):
+            model_object.configure(
+                ai_settings.inference_backend,
+                ai_settings.inference_threads,
+                ai_settings.inference_precision,
+            )
+
+        # Cascade
+        self.cascade_band = None
+        if ai_settings.cascade_models:
+            if BIG_MODEL_PATH.exists():
+                self.cascade_band = ai_settings.cascade_uncertainty_band
+            else:
+                print(  # noqa: T201
+                    f"Cascade disabled, {BIG_MODEL_PATH} is missing"
+                )
+
+        self.minimum_scores = {
+            name: part_settings.minimum_score
+            for name, part_settings in (
+                config.censor_settings.parts_settings.items()
+            )
+            if part_settings.minimum_score > 0
+        }
+        self.enabled_parts = frozenset(config.censor_settings.enabled_parts)
+
+    @property
+    def input_size(self) -> int | None:
+        return self.model_object.model.input_form.size
+
+    def warmup(self) -> None:
+        self.model_object.warmup()
+        if self.cascade_band:
+            self.cascade_model_object.warmup()
+
+    def _needs_bigger_model(self, found_parts: list[dict[str, Any]]) -> bool:
+        """
+        Checks if the small model was unsure about the image, either an
+        enabled part has a score inside the uncertainty band, or it would
+        only just be dropped by its `minimum_score` (by less than the band's
+        width). Parts scored far below their `minimum_score`, found in most
+        images, are dropped with confidence and don't escalate.
+
+        :param list[dict[str, Any]] found_parts: Output of the small model
+        :return bool: True if the image should go through the big model
+        """
+        if self.cascade_band is None:
+            return False
+
+        lower, upper = self.cascade_band
+        band_width = upper - lower
+        for found_part in found_parts:
+            label, score = found_part["class"], found_part["score"]
+            if self.enabled_parts is not None and (
+                label not in self.enabled_parts
+            ):
+                continue
+
+            minimum_score = self.minimum_scores.get(label, 0.0)
+            if (
+                lower <= score < upper
+                or minimum_score - band_width <= score < minimum_score
+            ):
+                return True
+        return False
+
+    def __convert_output(
         self,
-        file_images_or_path: str,
+        found_parts: list[dict[str, Any]],
     ) -> list[DetectedPartSchema]:
         return [
             DetectedPartSchema(
@@ -121,32 +340,45 @@ class NudeNetDetector(Detector):
                 score=found_part["score"],
                 relative_box=found_part["box"],
             )
-            for _, found_part in enumerate(
-                self.model_object.detect(file_images_or_path),
-            )
+            for found_part in found_parts
         ]
 
+    def detect_image(
+        self,
+        file_images_or_path: str | Image,
+    ) -> list[DetectedPartSchema]:
+        return self.detect_batch([file_images_or_path], batch_size=1)[0]  # type: ignore
+
     def detect_batch(
         self,
         file_images_or_paths: list[str] | list[Image],
         batch_size: int,
+        preprocessed: SharedPreprocessing | None = None,
     ) -> dict[int, list[DetectedPartSchema]]:
-        raise NotImplementedError("This needs work")  # noqa: EM101
         output = self.model_object.detect_batch(
             file_images_or_paths,
             batch_size,
+            preprocessed,
         )
 
-        dict_output = {}
-        for index, image in enumerate(output):
-            dict_output[index] = [
-                DetectedPartSchema(
-                    part_id=index,
-                    label=found_part["class"],
-                    score=found_part["score"],
-                    relative_box=found_part["box"],
-                )
-                for index, found_part in enumerate(image)
-            ]
+        # Cascade (Unsure Images Go Through the Big Model)
+        unsure_indices = [
+            index
+            for index, found_parts in enumerate(output)
+            if self._needs_bigger_model(found_parts)
+        ]
+        if unsure_indices:
+            cascade_output = self.cascade_model_object.detect_batch(
+                [file_images_or_paths[index] for index in unsure_indices],
+                batch_size,
+                preprocessed.subset(unsure_indices) if preprocessed else None,
+            )
+            for index, found_parts in zip(
+                unsure_indices, cascade_output, strict=True
+            ):
+                output[index] = found_parts
 
-        return dict_output
+        return {
+            index: self.__convert_output(found_parts)
+            for index, found_parts in enumerate(output)
+        }
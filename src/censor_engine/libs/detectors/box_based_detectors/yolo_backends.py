@@ -0,0 +1,414 @@
+import ast
+from abc import abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import cv2
+import numpy as np
+
+from censor_engine.libs.detectors.preprocessing import (
+    InputForm,
+    PreparedInput,
+    prepare_images,
+)
+from censor_engine.models.enums import InferencePrecision
+from censor_engine.models.structs.boxes import non_max_suppression
+from censor_engine.typing import Image
+
+if TYPE_CHECKING:
+    from ultralytics import YOLO
+
+"""
+These are the inference backends for the YOLO models (i.e., NudeNet).
+
+The PyTorch backend is ultralytics as is, the ONNX backend exports the model
+once (next to the weights) and runs it with ONNX Runtime, which is a lot
+faster on machines without a GPU.
+
+Both can run at a reduced precision (see `InferencePrecision`), which trades
+some accuracy for speed, see `scripts/precision_report.py`.
+
+Both take the same letterboxed tensor (`InputForm`), so the detection layer
+can prepare it once and share it between the detectors asking for it.
+
+"""
+
+DEFAULT_CONFIDENCE = 0.25  # Same as ultralytics
+DEFAULT_IOU = 0.7
+MAX_DETECTIONS = 300
+
+
+@dataclass(slots=True)
+class RawDetections:
+    """
+    This is the raw output of a backend for a single image.
+
+    :param np.ndarray xyxy: Boxes (x1, y1, x2, y2) in image coordinates
+    :param np.ndarray scores: Confidence of each box
+    :param np.ndarray classes: Class index of each box
+    """
+
+    xyxy: np.ndarray
+    scores: np.ndarray
+    classes: np.ndarray
+
+    @classmethod
+    def empty(cls) -> "RawDetections":
+        return cls(
+            np.zeros((0, 4), dtype=np.float32),
+            np.zeros((0,), dtype=np.float32),
+            np.zeros((0,), dtype=int),
+        )
+
+
+class YoloBackend:
+    """
+    This is the base for the YOLO inference backends.
+
+    """
+
+    weights_path: Path
+    names: dict[int, str]
+
+    def __init__(
+        self,
+        weights_path: Path,
+        threads: int = 0,
+        precision: InferencePrecision = InferencePrecision.FP32,
+    ):
+        self.weights_path = weights_path
+        self.threads = threads
+        self.precision = precision
+        self.names = {}
+
+    @property
+    @abstractmethod
+    def input_form(self) -> InputForm:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _predict_tensor(self, tensor: np.ndarray) -> list[RawDetections]:
+        """
+        Runs the model over a prepared tensor.
+
+        :param np.ndarray tensor: Float32 tensor of shape (N, 3, H, W)
+        :return list[RawDetections]: Boxes in letterboxed coordinates
+        """
+        raise NotImplementedError
+
+    def predict(self, images: Sequence[str | Image]) -> list[RawDetections]:
+        loaded_images: list[Image] = [
+            cv2.imread(image) if isinstance(image, str) else image  # type: ignore
+            for image in images
+        ]
+        return self.predict_prepared(
+            prepare_images(loaded_images, self.input_form)
+        )
+
+    def predict_prepared(
+        self,
+        prepared: PreparedInput,
+        batch_size: int | None = None,
+    ) -> list[RawDetections]:
+        """
+        Runs the model over images already in its `input_form`, the boxes
+        are mapped back onto the original images.
+
+        :param PreparedInput prepared: Letterboxed images and their tensors
+        :param int | None batch_size: Max amount of images per model call,
+            defaults to None (a call per size)
+        :return list[RawDetections]: Boxes in image coordinates, per image
+        """
+        output = [RawDetections.empty() for _ in range(len(prepared))]
+        for indices, tensor in prepared.batches(batch_size or len(prepared)):
+            for index, detections in zip(
+                indices, self._predict_tensor(tensor), strict=True
+            ):
+                height, width = prepared.shapes[index]
+                xyxy = prepared.letterboxed[index].map_xyxy_to_original(
+                    detections.xyxy
+                )
+                xyxy[:, [0, 2]] = xyxy[:, [0, 2]].clip(0, width)
+                xyxy[:, [1, 3]] = xyxy[:, [1, 3]].clip(0, height)
+                detections.xyxy = xyxy
+                output[index] = detections
+        return output
+
+
+class TorchYoloBackend(YoloBackend):
+    """
+    Runs the model through ultralytics on PyTorch, using the GPU if there is
+    one.
+
+    FP16 only applies on the GPU (ultralytics runs the CPU at FP32), INT8
+    isn't supported, use the ONNX backend for it.
+
+    The images are letterboxed before ultralytics gets them (as a tensor),
+    the same as its own preprocessing, so the tensor can be shared.
+
+    """
+
+    device: int | str
+    model: "YOLO"
+
+    def __init__(
+        self,
+        weights_path: Path,
+        threads: int = 0,
+        precision: InferencePrecision = InferencePrecision.FP32,
+    ):
+        if precision == InferencePrecision.INT8:
+            msg = "INT8 precision is only supported by the ONNX backend"
+            raise ValueError(msg)
+
+        super().__init__(weights_path, threads, precision)
+
+        import torch  # noqa: PLC0415 # Lazy, it's slow to import
+        from ultralytics import YOLO  # noqa: PLC0415
+
+        if threads > 0:
+            torch.set_num_threads(threads)
+
+        self.model = YOLO(str(weights_path))
+        self.names = self.model.names  # type: ignore
+
+        # GPU Check
+        self.device = 0 if torch.cuda.is_available() else "cpu"
+        print(f"NudeNet using GPU?: {self.device != 'cpu'}")  # noqa: T201
+
+    @property
+    def precision_arguments(self) -> dict[str, Any]:
+        # Only Passed When Needed (Newer Ultralytics Warns About `half`)
+        if self.precision == InferencePrecision.FP16:
+            return {"half": True}
+        return {}
+
+    @property
+    def input_form(self) -> InputForm:
+        size = self.model.overrides.get("imgsz", 640)
+        if isinstance(size, list | tuple):
+            size = size[0]
+        return InputForm(int(size), int(self.model.model.stride.max()))  # type: ignore
+
+    def _predict_tensor(self, tensor: np.ndarray) -> list[RawDetections]:
+        import torch  # noqa: PLC0415
+
+        with torch.no_grad():
+            results = self.model(
+                torch.from_numpy(tensor),
+                device=self.device,
+                verbose=False,
+                **self.precision_arguments,
+            )
+
+        output = []
+        for result in results:
+            boxes = result.boxes  # type: ignore
+            if boxes is None or len(boxes) == 0:
+                output.append(RawDetections.empty())
+                continue
+
+            output.append(
+                RawDetections(
+                    boxes.xyxy.cpu().numpy(),  # type: ignore
+                    boxes.conf.cpu().numpy(),  # type: ignore
+                    boxes.cls.cpu().numpy().astype(int),  # type: ignore
+                )
+            )
+        return output
+
+
+class OnnxYoloBackend(YoloBackend):
+    """
+    Runs an ONNX export of the model with ONNX Runtime on the CPU.
+
+    The export happens once and is saved next to the weights (e.g.,
+    `tools/models/320n.onnx`), it's only redone if the weights are newer.
+    The reduced precisions are converted from that export, FP16 halves the
+    weights (inputs and outputs stay FP32), INT8 is dynamically quantised.
+
+    """
+
+    input_size: int
+    stride: int
+
+    def __init__(
+        self,
+        weights_path: Path,
+        threads: int = 0,
+        precision: InferencePrecision = InferencePrecision.FP32,
+    ):
+        super().__init__(weights_path, threads, precision)
+
+        try:
+            import onnxruntime as ort  # type: ignore # noqa: PLC0415
+        except ImportError as error:
+            msg = (
+                "The ONNX backend needs onnxruntime, install it with "
+                "`pip install censor-engine[onnx]`"
+            )
+            raise ImportError(msg) from error
+
+        onnx_path = self.export_onnx(weights_path, precision)
+
+        # Session
+        options = ort.SessionOptions()
+        if threads > 0:
+            options.intra_op_num_threads = threads
+            options.inter_op_num_threads = 1
+        options.graph_optimization_level = (
+            ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        )
+        self.session = ort.InferenceSession(
+            str(onnx_path),
+            sess_options=options,
+            providers=["CPUExecutionProvider"],
+        )
+        self.input_name = self.session.get_inputs()[0].name
+
+        # Meta Data from the Export
+        metadata = self.session.get_modelmeta().custom_metadata_map
+        self.names = ast.literal_eval(metadata["names"])
+        self.input_size = int(ast.literal_eval(metadata["imgsz"])[0])
+        self.stride = int(metadata.get("stride", 32))
+
+    @staticmethod
+    def _is_up_to_date(path: Path, source_path: Path) -> bool:
+        return (
+            path.exists()
+            and path.stat().st_mtime >= source_path.stat().st_mtime
+        )
+
+    @classmethod
+    def export_onnx(
+        cls,
+        weights_path: Path,
+        precision: InferencePrecision = InferencePrecision.FP32,
+    ) -> Path:
+        """
+        Exports the PyTorch weights to ONNX (and converts it to the
+        precision), unless an export already exists that is newer than the
+        weights.
+
+        :param Path weights_path: Path to the `.pt` weights
+        :param InferencePrecision precision: Precision of the export,
+            defaults to FP32
+        :return Path: Path to the `.onnx` export
+        """
+        onnx_path = weights_path.with_suffix(".onnx")
+        if precision != InferencePrecision.FP32:
+            return cls._convert_onnx(
+                cls.export_onnx(weights_path),
+                precision,
+            )
+
+        if cls._is_up_to_date(onnx_path, weights_path):
+            return onnx_path
+
+        from ultralytics import YOLO  # noqa: PLC0415
+
+        print(f"Exporting {weights_path} to ONNX (only done once)")  # noqa: T201
+        model = YOLO(str(weights_path))
+        exported_path = model.export(
+            format="onnx",
+            imgsz=model.overrides.get("imgsz", 640),
+            dynamic=True,
+            simplify=False,
+            verbose=False,
+        )
+        return Path(exported_path)
+
+    @classmethod
+    def _convert_onnx(
+        cls,
+        onnx_path: Path,
+        precision: InferencePrecision,
+    ) -> Path:
+        """
+        Converts the FP32 export to FP16 or INT8, saved next to it (e.g.,
+        `320n.int8.onnx`).
+
+        :param Path onnx_path: Path to the FP32 export
+        :param InferencePrecision precision: Precision to convert to
+        :return Path: Path to the converted export
+        """
+        converted_path = onnx_path.with_suffix(
+            f".{precision.name.lower()}.onnx"
+        )
+        if cls._is_up_to_date(converted_path, onnx_path):
+            return converted_path
+
+        import onnx  # type: ignore # noqa: PLC0415
+
+        print(f"Converting {onnx_path} to {precision.name} (only done once)")  # noqa: T201
+        if precision == InferencePrecision.FP16:
+            from onnxruntime.transformers.float16 import (  # type: ignore # noqa: PLC0415
+                convert_float_to_float16,
+            )
+
+            model = convert_float_to_float16(
+                onnx.load(str(onnx_path)),
+                keep_io_types=True,
+            )
+            onnx.save(model, str(converted_path))
+        else:
+            from onnxruntime.quantization import (  # type: ignore # noqa: PLC0415
+                QuantType,
+                quantize_dynamic,
+            )
+
+            quantize_dynamic(
+                onnx_path,
+                converted_path,
+                weight_type=QuantType.QUInt8,
+            )
+
+        return converted_path
+
+    def _postprocess(self, prediction: np.ndarray) -> RawDetections:
+        """
+        Turns the raw model output of one image (4 + classes, anchors) into
+        boxes, the same as ultralytics' non max suppression.
+
+        :param np.ndarray prediction: Raw output for one image
+        :return RawDetections: Boxes in letterboxed coordinates
+        """
+        prediction = prediction.T  # (anchors, 4 + classes)
+        class_scores = prediction[:, 4:]
+        classes = class_scores.argmax(axis=1)
+        scores = class_scores[np.arange(len(classes)), classes]
+
+        keep = scores > DEFAULT_CONFIDENCE
+        if not keep.any():
+            return RawDetections.empty()
+
+        boxes, scores, classes = (
+            prediction[keep, :4],
+            scores[keep],
+            classes[keep],
+        )
+
+        # Centre XYWH to XYXY
+        xyxy = np.empty_like(boxes)
+        xyxy[:, :2] = boxes[:, :2] - boxes[:, 2:] / 2
+        xyxy[:, 2:] = boxes[:, :2] + boxes[:, 2:] / 2
+
+        indices = non_max_suppression(
+            xyxy,
+            scores,
+            DEFAULT_IOU,
+            classes=classes,
+            max_detections=MAX_DETECTIONS,
+        )
+
+        return RawDetections(xyxy[indices], scores[indices], classes[indices])
+
+    @property
+    def input_form(self) -> InputForm:
+        return InputForm(self.input_size, self.stride)
+
+    def _predict_tensor(self, tensor: np.ndarray) -> list[RawDetections]:
+        predictions: Any = self.session.run(None, {self.input_name: tensor})[0]
+        return [self._postprocess(prediction) for prediction in predictions]
@@ -0,0 +1,330 @@
+import threading
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+
+import cv2
+import numpy as np
+
+from censor_engine.typing import Image
+
+LETTERBOX_COLOUR = (114, 114, 114)
+
+
+@dataclass(slots=True)
+class LetterboxedImage:
+    """
+    This is an image that has been resized (keeping its aspect ratio) and
+    padded (to a square, or up to the stride), which is what the YOLO models
+    expect.
+
+    :param Image image: The square image
+    :param float ratio: Scale from the original to the resized image
+    :param tuple[int, int] padding: Left and top padding in pixels
+    """
+
+    image: Image
+    ratio: float
+    padding: tuple[int, int]
+
+    def map_xyxy_to_original(self, xyxy: np.ndarray) -> np.ndarray:
+        """
+        Maps boxes (x1, y1, x2, y2) from the letterboxed image back to the
+        original image.
+
+        :param np.ndarray xyxy: Boxes in letterboxed coordinates
+        :return np.ndarray: Boxes in original coordinates
+        """
+        padding_x, padding_y = self.padding
+        mapped = xyxy.astype(np.float32).copy()
+        mapped[:, [0, 2]] -= padding_x
+        mapped[:, [1, 3]] -= padding_y
+        return mapped / self.ratio
+
+
+def letterbox(
+    image: Image,
+    size: int,
+    stride: int | None = None,
+    *,
+    scale_up: bool = True,
+) -> LetterboxedImage:
+    """
+    Resizes the image to fit inside a `size` square and pads the rest, the
+    same as ultralytics' LetterBox with centred padding.
+
+    When a stride is given, the image is only padded up to the next multiple
+    of it rather than to a square (ultralytics' "auto" mode), which is less
+    work for the model.
+
+    :param Image image: BGR image
+    :param int size: Width and height of the output
+    :param int | None stride: Stride of the model, defaults to None (square)
+    :param bool scale_up: Enlarges images smaller than `size`, defaults to
+        True (False keeps them at their size, only padded up to the stride)
+    :return LetterboxedImage: Letterboxed image and how to map back from it
+    """
+    height, width = image.shape[:2]
+    ratio = min(size / height, size / width)
+    if not scale_up:
+        ratio = min(ratio, 1.0)
+    new_width, new_height = round(width * ratio), round(height * ratio)
+
+    if (new_width, new_height) != (width, height):
+        image = cv2.resize(
+            image,
+            (new_width, new_height),
+            interpolation=cv2.INTER_LINEAR,
+        )
+
+    padding_width, padding_height = size - new_width, size - new_height
+    if stride:
+        padding_width %= stride
+        padding_height %= stride
+    padding_width /= 2
+    padding_height /= 2
+    top, bottom = round(padding_height - 0.1), round(padding_height + 0.1)
+    left, right = round(padding_width - 0.1), round(padding_width + 0.1)
+
+    padded_image = cv2.copyMakeBorder(
+        image,
+        top,
+        bottom,
+        left,
+        right,
+        cv2.BORDER_CONSTANT,
+        value=LETTERBOX_COLOUR,
+    )
+    return LetterboxedImage(padded_image, ratio, (left, top))
+
+
+def to_model_tensor(images: list[Image]) -> np.ndarray:
+    """
+    Converts BGR images (of the same size) into a normalised RGB float
+    tensor in NCHW layout.
+
+    :param list[Image] images: BGR images
+    :return np.ndarray: Float32 tensor of shape (N, 3, H, W)
+    """
+    batch = np.stack(images)[..., ::-1]  # BGR to RGB
+    batch = batch.transpose(0, 3, 1, 2)  # NHWC to NCHW
+    return np.ascontiguousarray(batch, dtype=np.float32) / 255.0
+
+
+@dataclass(frozen=True, slots=True)
+class InputForm:
+    """
+    This is the input a model asks for, letterboxed RGB images at a given
+    size, as a float NCHW tensor. Detectors asking for the same form share
+    the preprocessing (see `SharedPreprocessing`).
+
+    :param int size: Width and height the images are letterboxed to
+    :param int stride: Stride of the model, same sized images are only
+        padded up to a multiple of it
+    """
+
+    size: int
+    stride: int
+
+    def scaled(self, factor: int) -> "InputForm":
+        """
+        Gets the form at a smaller input size, its size divided by the
+        factor (rounded down to the stride), e.g., for
+        `video_settings.adaptive_resolution`.
+
+        :param int factor: Factor to divide the size by
+        :return InputForm: Scaled form
+        """
+        if factor <= 1:
+            return self
+        size = self.size // factor // self.stride * self.stride
+        return InputForm(max(size, self.stride), self.stride)
+
+
+@dataclass(slots=True)
+class PreparedInput:
+    """
+    This is a batch of images in an `InputForm`, ready for the model. Images
+    letterboxed to the same size share a tensor (each is a separate model
+    call), rather than every image being padded up to the largest.
+
+    :param list[LetterboxedImage] letterboxed: Letterboxed images, used to
+        map the boxes back
+    :param list[tuple[int, int]] shapes: Height and width of the original
+        images
+    :param list[tuple[list[int], np.ndarray]] groups: Indices of the images
+        of each size, and their float32 tensor of shape (N, 3, H, W)
+    """
+
+    letterboxed: list[LetterboxedImage]
+    shapes: list[tuple[int, int]]
+    groups: list[tuple[list[int], np.ndarray]]
+
+    def __len__(self) -> int:
+        return len(self.letterboxed)
+
+    def batches(
+        self,
+        batch_size: int,
+    ) -> Iterator[tuple[list[int], np.ndarray]]:
+        """
+        Splits the groups into model calls of up to `batch_size` images, the
+        tensors are views rather than copies.
+
+        :param int batch_size: Max amount of images per model call
+        :return Iterator[tuple[list[int], np.ndarray]]: Indices of the images
+            and their tensor, per model call
+        """
+        batch_size = max(batch_size, 1)
+        for indices, tensor in self.groups:
+            for start in range(0, len(indices), batch_size):
+                yield (
+                    indices[start : start + batch_size],
+                    tensor[start : start + batch_size],
+                )
+
+    def subset(self, indices: Sequence[int]) -> "PreparedInput":
+        """
+        Gets the prepared input of some of the images, without preparing
+        them again.
+
+        :param Sequence[int] indices: Indices of the images to keep
+        :return PreparedInput: Prepared input of those images
+        """
+        positions = {index: position for position, index in enumerate(indices)}
+
+        groups = []
+        for group_indices, tensor in self.groups:
+            rows = [
+                row
+                for row, index in enumerate(group_indices)
+                if index in positions
+            ]
+            if rows:
+                groups.append(
+                    (
+                        [positions[group_indices[row]] for row in rows],
+                        tensor[rows],
+                    )
+                )
+
+        return PreparedInput(
+            [self.letterboxed[index] for index in indices],
+            [self.shapes[index] for index in indices],
+            groups,
+        )
+
+
+def prepare_images(
+    images: Sequence[Image],
+    form: InputForm,
+    scale_up: Sequence[bool] | None = None,
+) -> PreparedInput:
+    """
+    Letterboxes the images and converts them into the model's tensors.
+
+    Images are only padded up to the stride (like ultralytics' rect mode),
+    and grouped by their letterboxed size. Images that aren't scaled up
+    (e.g., crops) keep their own size, capped at the form's, so a small crop
+    costs the model a lot less than a full frame.
+
+    :param Sequence[Image] images: BGR images
+    :param InputForm form: Input the model expects
+    :param Sequence[bool] | None scale_up: Whether each image is enlarged to
+        the form's size, defaults to None (every image)
+    :return PreparedInput: Letterboxed images and their tensors
+    """
+    if scale_up is None:
+        scale_up = [True] * len(images)
+
+    letterboxed = [
+        letterbox(image, form.size, form.stride, scale_up=image_scale_up)
+        for image, image_scale_up in zip(images, scale_up, strict=True)
+    ]
+
+    # Group by Size
+    size_indices: dict[tuple[int, ...], list[int]] = {}
+    for index, item in enumerate(letterboxed):
+        size_indices.setdefault(item.image.shape, []).append(index)
+
+    return PreparedInput(
+        letterboxed,
+        [image.shape[:2] for image in images],
+        [
+            (
+                indices,
+                to_model_tensor(
+                    [letterboxed[index].image for index in indices]
+                ),
+            )
+            for indices in size_indices.values()
+        ],
+    )
+
+
+@dataclass(slots=True)
+class SharedPreprocessing:
+    """
+    This is the preprocessing of a group of images shared between the
+    detectors, each distinct `InputForm` is only prepared once, no matter
+    how many detectors ask for it.
+
+    It's safe to use from the detectors running at once, a detector waits
+    for another one already preparing the same form.
+
+    :param list[Image] images: BGR images, as given to the detectors
+    :param list[bool] | None scale_up: Whether each image is enlarged to the
+        models' input size, defaults to None (every image, crops shouldn't
+        be)
+    :param int input_factor: Factor the models' input size is divided by
+        (see `InputForm.scaled()`), defaults to 1
+    """
+
+    images: list[Image]
+    scale_up: list[bool] | None = None
+    input_factor: int = 1
+
+    _prepared: dict[InputForm, PreparedInput] = field(
+        init=False, default_factory=dict
+    )
+    _locks: dict[InputForm, threading.Lock] = field(
+        init=False, default_factory=dict
+    )
+    _lock: threading.Lock = field(init=False, default_factory=threading.Lock)
+
+    def get(self, form: InputForm) -> PreparedInput:
+        """
+        Gets the images in the form, preparing them on the first request.
+
+        :param InputForm form: Input the model expects
+        :return PreparedInput: Letterboxed images and their tensor
+        """
+        with self._lock:
+            form_lock = self._locks.setdefault(form, threading.Lock())
+
+        with form_lock:
+            if form not in self._prepared:
+                self._prepared[form] = prepare_images(
+                    self.images, form.scaled(self.input_factor), self.scale_up
+                )
+            return self._prepared[form]
+
+    def subset(self, indices: Sequence[int]) -> "SharedPreprocessing":
+        """
+        Gets the preprocessing of some of the images, keeping the forms that
+        are already prepared (e.g., for the images a cascade sends on).
+
+        :param Sequence[int] indices: Indices of the images to keep
+        :return SharedPreprocessing: Preprocessing of those images
+        """
+        shared = SharedPreprocessing(
+            [self.images[index] for index in indices],
+            None
+            if self.scale_up is None
+            else [self.scale_up[index] for index in indices],
+            self.input_factor,
+        )
+        with self._lock:
+            prepared = dict(self._prepared)
+        for form, prepared_input in prepared.items():
+            shared._prepared[form] = prepared_input.subset(indices)
+        return shared
@@ -1,67 +1,120 @@
-import hashlib
 import shutil
 from dataclasses import dataclass, field
 from pathlib import Path
 
 from .caching_schemas import AIOutputData, Meta
+from .fingerprint import (
+    Fingerprint,
+    check_fingerprint,
+    get_full_hash,
+    get_quick_key,
+    get_sampled_hash,
+    make_fingerprint,
+)
+from .image import ImageCacheStore
 from .video import VideoCache
 
 
 @dataclass(slots=True)
 class Cache:
+    """
+    This is the detection cache of a media file.
+
+    The cache is checked against the file's fingerprint (see
+    `fingerprint.py`), an unchanged file is verified by its size, modified
+    time, and inode, a copied or touched file by a sampled hash, so the file
+    isn't read whole before every run. With `full_hash`, the whole file is
+    hashed instead.
+
+    Videos get a folder each, images share the cache folder's
+    `ImageCacheStore`, keyed by their content (the sampled or full hash), so
+    a renamed or moved image still hits the cache.
+
+    """
+
     cache_path: Path
     base_dir: Path
     file_name: str
     is_video: bool
+    full_hash: bool = False
 
     _full_cache_path: Path = field(init=False)
-    _current_hash: str = field(init=False)
     _video_cache: VideoCache = field(init=False)
-    _image_cache: Path = field(init=False)
+    _image_store: ImageCacheStore = field(init=False)
+    _image_fingerprint: str = field(init=False)
+    _image_data: str | None = field(init=False, default=None)
 
     def __post_init__(self):
         file_path = Path(self.file_name)
-        self._current_hash = self.__get_hash(file_path)
         self._full_cache_path = self.cache_path / file_path.relative_to(
             self.base_dir
         )
 
-        self.start()
-
         if self.is_video:
+            self.start()
             self._video_cache = VideoCache(self._full_cache_path)
         else:
-            self._image_cache = self._full_cache_path / "ai_output.json"
-
-    def __get_hash(self, media_path: Path):
-        sha = hashlib.sha256()
-
-        buffer_size = 65536  # 64 KB chunks (fast + memory efficient)
+            self.__open_image_cache()
 
-        with media_path.open(mode="rb") as f:
-            while chunk := f.read(buffer_size):
-                sha.update(chunk)
+    def __open_image_cache(self) -> None:
+        """
+        Finds the image's detections in the store, an unchanged image by its
+        path and quick key, otherwise by its content.
 
-        return sha.hexdigest()
+        """
+        file_path = Path(self.file_name)
+        relative_path = file_path.relative_to(self.base_dir).as_posix()
+        quick_key = get_quick_key(file_path)
+        self._image_store = ImageCacheStore.get(self.cache_path)
+
+        if not self.full_hash and (
+            found := self._image_store.lookup_file(relative_path, quick_key)
+        ):
+            self._image_fingerprint, self._image_data = found
+            return
+
+        self._image_fingerprint = (
+            get_full_hash(file_path)
+            if self.full_hash
+            else get_sampled_hash(file_path, quick_key.size)
+        )
+        self._image_data = self._image_store.lookup_fingerprint(
+            self._image_fingerprint
+        )
+        self._image_store.set_file(
+            relative_path, quick_key, self._image_fingerprint
+        )
 
-    def __check_cache_data_exists(self):
-        if not self._full_cache_path.exists():
-            return False
+    def __write_meta(self, fingerprint: Fingerprint) -> None:
+        meta_file = self._full_cache_path / "meta.json"
+        meta_entry = Meta(fingerprint=fingerprint)
+        with meta_file.open("w") as f:
+            f.write(meta_entry.model_dump_json())
 
+    def __check_cache_data_exists(self) -> bool:
         # Check Media is the Same as Cached (Avoids Same Name Issues)
         meta_file = self._full_cache_path / "meta.json"
-        if meta_file.exists():
-            with meta_file.open() as f:
-                meta_data = f.read()
+        if not meta_file.exists():
+            return False
 
-            # Check Hash
-            meta_object = Meta.model_validate_json(meta_data)
-            found_media_hash = meta_object.hash_data
+        with meta_file.open() as f:
+            meta_object = Meta.model_validate_json(f.read())
+        if meta_object.fingerprint is None:
+            return False
 
-            if found_media_hash == self._current_hash:
-                return True
+        # Check Fingerprint
+        fingerprint = check_fingerprint(
+            Path(self.file_name),
+            meta_object.fingerprint,
+            full_hash=self.full_hash,
+        )
+        if fingerprint is None:
+            return False
 
-        return False
+        # Quick Key Changed (e.g., Copied), Skip the Hash Next Time
+        if fingerprint != meta_object.fingerprint:
+            self.__write_meta(fingerprint)
+        return True
 
     def __create_cache_folder(self):
         # Reset Folder if Exists
@@ -70,10 +123,9 @@ class Cache:
         self._full_cache_path.mkdir(parents=True)
 
         # Create Meta Data
-        meta_file = self._full_cache_path / "meta.json"
-        meta_entry = Meta(hash_data=self._current_hash)
-        with meta_file.open("w") as f:
-            f.write(meta_entry.model_dump_json())
+        self.__write_meta(
+            make_fingerprint(Path(self.file_name), full_hash=self.full_hash)
+        )
 
     def start(self):
         if not self.__check_cache_data_exists():
@@ -86,8 +138,10 @@ class Cache:
                 raise TypeError(msg)
             self._video_cache.set_frame_data(frame, output)
         else:
-            with self._image_cache.open("w") as f:
-                f.write(output.model_dump_json())
+            self._image_data = output.model_dump_json()
+            self._image_store.set_detections(
+                self._image_fingerprint, self._image_data
+            )
 
     def get_frame(self, frame: int | None) -> AIOutputData:
         if self.is_video:
@@ -95,8 +149,27 @@ class Cache:
                 msg = "Missing Frame Number!"
                 raise TypeError(msg)
             return self._video_cache.get_frame_data(frame)
-        with self._image_cache.open() as f:
-            return AIOutputData.model_validate_json(f.read())
+        if self._image_data is None:
+            msg = "Missing Image Data, this shouldn't happen!"
+            raise ValueError(msg)
+        return AIOutputData.model_validate_json(self._image_data)
+
+    def find_frame(self, frame: int | None) -> AIOutputData | None:
+        """
+        Finds the cached output of an image or frame, this is
+        `check_for_frame()` and `get_frame()` in one lookup.
+
+        :param int | None frame: Frame number, None for an image
+        :return AIOutputData | None: Cached output, None if missing
+        """
+        if self.is_video:
+            if frame is None:
+                msg = "Missing Frame Number!"
+                raise TypeError(msg)
+            return self._video_cache.find_frame_data(frame)
+        if self._image_data is None:
+            return None
+        return AIOutputData.model_validate_json(self._image_data)
 
     def check_for_frame(self, frame: int | None) -> bool:
         if self.is_video:
@@ -104,7 +177,7 @@ class Cache:
                 msg = "Missing Frame Number!"
                 raise TypeError(msg)
             return self._video_cache.frame_exists(frame)
-        return self._image_cache.exists()
+        return self._image_data is not None
 
     def close(self):
         if self.is_video:
@@ -1,20 +1,20 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
+from censor_engine.models.enums import InferenceBackend, InferencePrecision
 from censor_engine.models.lib_models.detectors import DetectedPartSchema
 
+from .fingerprint import Fingerprint
+
 """
 This holds the schemas for the caching mechanism
 
 Cache System
 
     cache/
-        [file_path_in_uncensored]/
+        images.db                       # Every image, see `image.py`
+        [video_path_in_uncensored]/
             meta.json
-            frames/
-                1.json # First frame or just image, for ease
-                2.json
-                3.json
-                ...
+            video_data.db
 
 The end goal is something that can be redundant and fast
 
@@ -22,12 +22,30 @@ The end goal is something that can be redundant and fast
 
 
 class Meta(BaseModel):
-    hash_data: str
+    fingerprint: Fingerprint | None = None  # None for Old Caches (Rebuilt)
 
 
 class CommonData(BaseModel): ...
 
 
+class InferenceSettings(BaseModel):
+    """
+    This is how the detectors were run, detections made with other settings
+    (e.g., an int8 model, or with the cascade) aren't mixed in.
+
+    """
+
+    inference_backend: InferenceBackend = InferenceBackend.PYTORCH
+    inference_precision: InferencePrecision = InferencePrecision.FP32
+    cascade_band: tuple[float, float] | None = None  # None if Not Cascading
+
+
 class AIOutputData(BaseModel):
-    model_name: str
+    model_name: str  # Enabled Detectors
     output_data: list[DetectedPartSchema]
+    downscale_factor: int = 1
+    tiled: bool = False
+    input_factor: int = 1  # Models' Input Size Divided by, see Adaptive
+    crop_redetected: bool = False  # Only Detected Around the Tracked Parts
+    scene_reused: bool = False  # Parts of an Earlier Frame, see Scene Gate
+    inference: InferenceSettings = Field(default_factory=InferenceSettings)
@@ -0,0 +1,142 @@
+import hashlib
+from pathlib import Path
+
+from pydantic import BaseModel
+
+"""
+This handles the fingerprints of the cached media files, which tell if a
+file changed since it was cached, in tiers of cost:
+
+    1.  Quick Key:      Size, modified time, and inode (a `stat()` call)
+    2.  Sampled Hash:   SHA-256 of the head, the tail, and evenly spaced
+                        blocks of the file (a few MB read at most)
+    3.  Full Hash:      SHA-256 of the whole file, only when asked for
+                        (`file_settings.cache_full_hash`)
+
+"""
+
+BLOCK_SIZE = 65536  # 64 KB
+SAMPLED_BLOCKS = 16  # Strided Blocks Between the Head and Tail
+
+
+class QuickKey(BaseModel):
+    size: int
+    modified_time: int  # Nanoseconds
+    inode: int
+
+
+class Fingerprint(BaseModel):
+    quick_key: QuickKey
+    sampled_hash: str
+    full_hash: str | None = None
+
+
+def get_quick_key(media_path: Path) -> QuickKey:
+    """
+    Gets the quick key of the file, just a `stat()` call.
+
+    :param Path media_path: Path of the file
+    :return QuickKey: Size, modified time, and inode
+    """
+    stat = media_path.stat()
+    return QuickKey(
+        size=stat.st_size,
+        modified_time=stat.st_mtime_ns,
+        inode=stat.st_ino,
+    )
+
+
+def get_sampled_hash(media_path: Path, size: int) -> str:
+    """
+    Hashes the head, the tail, and `SAMPLED_BLOCKS` evenly spaced blocks of
+    the file (and its size), small files are hashed whole.
+
+    :param Path media_path: Path of the file
+    :param int size: Size of the file in bytes
+    :return str: Hex digest
+    """
+    sha = hashlib.sha256(size.to_bytes(8, "little"))
+
+    if size <= BLOCK_SIZE * (SAMPLED_BLOCKS + 2):
+        return get_full_hash(media_path, sha)
+
+    stride = (size - BLOCK_SIZE) // (SAMPLED_BLOCKS + 1)
+    with media_path.open(mode="rb") as f:
+        for index in range(SAMPLED_BLOCKS + 2):
+            f.seek(min(index * stride, size - BLOCK_SIZE))
+            sha.update(f.read(BLOCK_SIZE))
+
+    return sha.hexdigest()
+
+
+def get_full_hash(
+    media_path: Path,
+    sha: "hashlib._Hash | None" = None,
+) -> str:
+    """
+    Hashes the whole file.
+
+    :param Path media_path: Path of the file
+    :param hashlib._Hash | None sha: Hash to continue, defaults to None (a new
+        SHA-256)
+    :return str: Hex digest
+    """
+    sha = sha or hashlib.sha256()
+    with media_path.open(mode="rb") as f:
+        while chunk := f.read(BLOCK_SIZE):
+            sha.update(chunk)
+
+    return sha.hexdigest()
+
+
+def make_fingerprint(media_path: Path, *, full_hash: bool) -> Fingerprint:
+    """
+    Fingerprints a file.
+
+    :param Path media_path: Path of the file
+    :param bool full_hash: Also hash the whole file
+    :return Fingerprint: Fingerprint of the file
+    """
+    quick_key = get_quick_key(media_path)
+    return Fingerprint(
+        quick_key=quick_key,
+        sampled_hash=get_sampled_hash(media_path, quick_key.size),
+        full_hash=get_full_hash(media_path) if full_hash else None,
+    )
+
+
+def check_fingerprint(
+    media_path: Path,
+    fingerprint: Fingerprint,
+    *,
+    full_hash: bool,
+) -> Fingerprint | None:
+    """
+    Checks if a file still matches its fingerprint, going through the tiers
+    only as far as needed: an unchanged quick key is trusted (unless
+    `full_hash`), otherwise the sampled hash (or the full hash) decides.
+
+    :param Path media_path: Path of the file
+    :param Fingerprint fingerprint: Fingerprint stored with the cache
+    :param bool full_hash: Check the whole file, the stored fingerprint needs
+        a full hash
+    :return Fingerprint | None: The file's fingerprint (with the new quick
+        key, e.g., after a copy or `touch`) if it matches, None otherwise
+    """
+    quick_key = get_quick_key(media_path)
+    if quick_key.size != fingerprint.quick_key.size:
+        return None
+
+    if full_hash:
+        if fingerprint.full_hash is None or (
+            get_full_hash(media_path) != fingerprint.full_hash
+        ):
+            return None
+    elif quick_key == fingerprint.quick_key:
+        return fingerprint
+    elif get_sampled_hash(media_path, quick_key.size) != (
+        fingerprint.sampled_hash
+    ):
+        return None
+
+    return fingerprint.model_copy(update={"quick_key": quick_key})
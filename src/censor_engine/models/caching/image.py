@@ -0,0 +1,146 @@
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import ClassVar
+
+from .fingerprint import QuickKey
+
+"""
+This is the detection cache of every image, a single SQLite database in the
+cache folder rather than a folder (with a `meta.json` and `ai_output.json`)
+per image.
+
+    detections:     Content fingerprint -> Detections
+    files:          Relative path -> Quick key, content fingerprint
+
+The detections are keyed by the image's content, so renamed, moved, or
+copied images still hit the cache, the files table just lets unchanged
+images skip hashing.
+
+"""
+
+DATABASE_NAME = "images.db"
+
+
+@dataclass(slots=True)
+class ImageCacheStore:
+    """
+    This is the image cache database of a cache folder. There's a single
+    store per folder for the whole process (see `get()`), shared between
+    the main thread and the detection service's thread.
+
+    :param Path cache_path: Cache folder
+    """
+
+    cache_path: Path
+
+    _connection: sqlite3.Connection = field(init=False)
+    _lock: threading.Lock = field(init=False, default_factory=threading.Lock)
+
+    _stores: ClassVar[dict[Path, "ImageCacheStore"]] = {}
+    _stores_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __post_init__(self):
+        self.cache_path.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(
+            str(self.cache_path / DATABASE_NAME),
+            isolation_level=None,
+            check_same_thread=False,  # Used by the detection service's thread
+        )  # autocommit
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute("""
+            CREATE TABLE IF NOT EXISTS detections (
+                fingerprint TEXT PRIMARY KEY,
+                data TEXT
+            );
+        """)
+        self._connection.execute("""
+            CREATE TABLE IF NOT EXISTS files (
+                path TEXT PRIMARY KEY,
+                size INTEGER,
+                modified_time INTEGER,
+                inode INTEGER,
+                fingerprint TEXT
+            );
+        """)
+
+    @classmethod
+    def get(cls, cache_path: Path) -> "ImageCacheStore":
+        """
+        Gets the store of a cache folder, it's opened on first use.
+
+        :param Path cache_path: Cache folder
+        :return ImageCacheStore: Store of the folder
+        """
+        key = cache_path.resolve()
+        with cls._stores_lock:
+            if (store := cls._stores.get(key)) is None:
+                store = cls._stores[key] = cls(cache_path)
+            return store
+
+    def lookup_file(
+        self,
+        relative_path: str,
+        quick_key: QuickKey,
+    ) -> tuple[str, str | None] | None:
+        """
+        Finds an unchanged image by its path (a single indexed read).
+
+        :param str relative_path: Path of the image in the base folder
+        :param QuickKey quick_key: Current quick key of the image
+        :return tuple[str, str | None] | None: Fingerprint and detections
+            (None if not detected yet), None if the image is unknown or
+            changed
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT f.fingerprint, d.data FROM files f "
+                "LEFT JOIN detections d ON d.fingerprint = f.fingerprint "
+                "WHERE f.path=? AND f.size=? AND f.modified_time=? "
+                "AND f.inode=?",
+                (
+                    relative_path,
+                    quick_key.size,
+                    quick_key.modified_time,
+                    quick_key.inode,
+                ),
+            ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def lookup_fingerprint(self, fingerprint: str) -> str | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT data FROM detections WHERE fingerprint=?",
+                (fingerprint,),
+            ).fetchone()
+        return row[0] if row else None
+
+    def set_file(
+        self,
+        relative_path: str,
+        quick_key: QuickKey,
+        fingerprint: str,
+    ) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO files"
+                "(path, size, modified_time, inode, fingerprint) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    relative_path,
+                    quick_key.size,
+                    quick_key.modified_time,
+                    quick_key.inode,
+                    fingerprint,
+                ),
+            )
+
+    def set_detections(self, fingerprint: str, data: str) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO detections(fingerprint, data) "
+                "VALUES (?, ?)",
+                (fingerprint, data),
+            )
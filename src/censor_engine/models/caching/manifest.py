@@ -0,0 +1,190 @@
+import hashlib
+import importlib.metadata
+import sqlite3
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .fingerprint import Fingerprint, check_fingerprint, make_fingerprint
+
+if TYPE_CHECKING:
+    from censor_engine.models.config import Config
+
+"""
+This is the rebuild manifest used by `file_settings.incremental_rebuild`, a
+SQLite database in the censored folder recording how each censored file was
+made:
+
+    files:      Relative input path -> Output path, input fingerprint,
+                config hash, engine version
+
+A file whose input still matches its fingerprint (see `fingerprint.py`),
+censored with the same config (the fields that change the output, see
+`UNHASHED_FIELDS`) and engine version, and whose output still exists, is up
+to date and is skipped by the pipelines.
+
+"""
+
+MANIFEST_NAME = ".censor_manifest.db"
+SOURCE_FOLDER = Path(__file__).resolve().parents[2]  # The Package
+
+UNHASHED_FIELDS: dict[str, set[str] | bool] = {
+    "dev_settings": True,
+    "file_settings": {
+        "detections_export_folder",
+        "cache_full_hash",
+        "incremental_rebuild",
+    },
+    "rendering_settings": {"batch_size"},
+    "ai_settings": {"inference_threads"},
+    "video_settings": {
+        "two_pass",
+        "detection_batch_size",
+        "detection_threads",
+    },
+}  # Only Change How Fast (or What Else) is Made, Not the Censored Files
+
+
+def get_source_hash() -> str:
+    """
+    Hashes the source files of the engine, in place of a version when it
+    isn't installed.
+
+    :return str: Hex digest
+    """
+    sha = hashlib.sha256()
+    for path in sorted(SOURCE_FOLDER.rglob("*.py")):
+        sha.update(path.relative_to(SOURCE_FOLDER).as_posix().encode())
+        sha.update(path.read_bytes())
+    return sha.hexdigest()
+
+
+def get_engine_version() -> str:
+    """
+    Gets the installed version of the engine.
+
+    :return str: Version, or the source hash when running from the source
+        tree (see `get_source_hash()`)
+    """
+    try:
+        return importlib.metadata.version("censor-engine")
+    except importlib.metadata.PackageNotFoundError:
+        return f"source-{get_source_hash()}"
+
+
+def get_config_hash(config: "Config") -> str:
+    """
+    Hashes the config fields of a run that change the censored files, a
+    change to any of them censors every file again.
+
+    :param Config config: Config of the run
+    :return str: Hex digest
+    """
+    return hashlib.sha256(
+        config.model_dump_json(exclude=UNHASHED_FIELDS).encode()
+    ).hexdigest()
+
+
+@dataclass(slots=True)
+class RebuildManifest:
+    """
+    This is the rebuild manifest of a censored folder.
+
+    :param Path censored_folder: Censored folder, holds the manifest
+    :param Config config: Config of the run
+    """
+
+    censored_folder: Path
+    config: "Config"
+
+    _connection: sqlite3.Connection = field(init=False)
+    _config_hash: str = field(init=False)
+    _engine_version: str = field(init=False)
+
+    def __post_init__(self):
+        self._config_hash = get_config_hash(self.config)
+        self._engine_version = get_engine_version()
+
+        self.censored_folder.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(
+            str(self.censored_folder / MANIFEST_NAME),
+            isolation_level=None,
+        )  # autocommit
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute("""
+            CREATE TABLE IF NOT EXISTS files (
+                path TEXT PRIMARY KEY,
+                output TEXT,
+                fingerprint TEXT,
+                config_hash TEXT,
+                engine_version TEXT
+            );
+        """)
+
+    def is_up_to_date(self, relative_path: str, file_path: Path) -> bool:
+        """
+        Checks if a file was censored from the same input, with the same
+        config and engine version, and its output still exists.
+
+        :param str relative_path: Path of the file in the uncensored folder
+        :param Path file_path: Path of the file
+        :return bool: True if the file can be skipped
+        """
+        row = self._connection.execute(
+            "SELECT output, fingerprint FROM files "
+            "WHERE path=? AND config_hash=? AND engine_version=?",
+            (relative_path, self._config_hash, self._engine_version),
+        ).fetchone()
+        if row is None or not (self.censored_folder / row[0]).exists():
+            return False
+
+        stored_fingerprint = Fingerprint.model_validate_json(row[1])
+        fingerprint = check_fingerprint(
+            file_path,
+            stored_fingerprint,
+            full_hash=self.config.file_settings.cache_full_hash,
+        )
+        if fingerprint is None:
+            return False
+
+        # Quick Key Changed (e.g., Copied), Skip the Hash Next Time
+        if fingerprint != stored_fingerprint:
+            self._connection.execute(
+                "UPDATE files SET fingerprint=? WHERE path=?",
+                (fingerprint.model_dump_json(), relative_path),
+            )
+        return True
+
+    def record(
+        self,
+        relative_path: str,
+        file_path: Path,
+        output_path: Path,
+    ) -> None:
+        """
+        Records a censored file, to be called once its output is written.
+
+        :param str relative_path: Path of the file in the uncensored folder
+        :param Path file_path: Path of the file
+        :param Path output_path: Path of the censored file
+        """
+        fingerprint = make_fingerprint(
+            file_path,
+            full_hash=self.config.file_settings.cache_full_hash,
+        )
+        self._connection.execute(
+            "INSERT OR REPLACE INTO files"
+            "(path, output, fingerprint, config_hash, engine_version) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (
+                relative_path,
+                output_path.relative_to(self.censored_folder).as_posix(),
+                fingerprint.model_dump_json(),
+                self._config_hash,
+                self._engine_version,
+            ),
+        )
+
+    def close(self) -> None:
+        self._connection.close()
@@ -1,68 +1,406 @@
+import atexit
+import json
 import sqlite3
+import threading
+import time
+import weakref
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any, ClassVar
 
+import numpy as np
 from pydantic import BaseModel
 
-from censor_engine.models.caching.caching_schemas import AIOutputData
+from censor_engine.models.caching.caching_schemas import (
+    AIOutputData,
+    InferenceSettings,
+)
+from censor_engine.models.lib_models.detectors import DetectedPartSchema
 
+"""
+This is the detection cache of a video, a SQLite database of its frames.
 
-@dataclass(slots=True)
+The parts of a frame are stored as packed binary records (see `PART_DTYPE`)
+rather than the JSON of its `AIOutputData`, with the labels as IDs:
+
+    names:      ID -> Label, or model (detectors and inference settings)
+    frames:     Frame -> Model ID, downscale and input factors, flags, parts
+                (BLOB)
+
+When opened, the whole video is read in a single query into NumPy arrays
+indexed by frame, so a cached re-render doesn't go back to SQLite, and the
+parts are built without pydantic's validation (see `_construct()`).
+
+"""
+
+SCHEMA_VERSION = 4  # Other Versions are Rebuilt
+FLUSH_FRAMES = 256  # Frames Buffered Before Writing
+FLUSH_SECONDS = 5.0  # Max Time a Frame Stays Buffered
+
+PART_DTYPE = np.dtype(
+    [
+        ("label", "<u2"),  # Names ID
+        ("score", "<f4"),
+        ("box", "<i4", (4,)),  # X, Y, Width, Height
+    ]
+)  # Packed, 22 Bytes a Part
+
+FLAG_TILED = 1
+FLAG_CROP_REDETECTED = 2
+FLAG_SCENE_REUSED = 4
+
+
+def _construct[T: BaseModel](model: type[T], values: dict[str, Any]) -> T:
+    """
+    Builds a model from values that are already valid, what
+    `model_construct()` does without going through the fields (which costs
+    more than the rest of a cached frame). The values must hold every field.
+
+    :param type[T] model: Model class
+    :param dict[str, Any] values: Value of every field
+    :return T: Model
+    """
+    instance = model.__new__(model)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__pydantic_fields_set__", set(values))
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
+
+
+@dataclass(slots=True, weakref_slot=True, eq=False)  # Hashed by Identity
 class VideoCache:
+    """
+    This is the detection cache of a video.
+
+    The frames are buffered and written in a single transaction every
+    `FLUSH_FRAMES` frames (or `FLUSH_SECONDS`), rather than a transaction
+    per frame, with the database in WAL mode. The buffer is flushed on
+    `close()` (also when the run is stopped, see `handle_exit`), and by
+    `flush_all()` at exit for caches left open, so a stopped video keeps its
+    detections.
+
+    Frames cached before it was opened are read from the preloaded arrays,
+    frames written since from the buffer (or the database once flushed).
+
+    """
+
     cache_path: Path
 
     _cache_path: Path = field(init=False)
     _connection: sqlite3.Connection = field(init=False)
+    _pending: dict[int, tuple[int, int, int, int, bytes]] = field(
+        init=False, default_factory=dict
+    )
+    _last_flush: float = field(init=False, default_factory=time.monotonic)
+    _lock: threading.RLock = field(init=False, default_factory=threading.RLock)
+
+    # Names
+    _names: list[str] = field(init=False, default_factory=list)
+    _name_ids: dict[str, int] = field(init=False, default_factory=dict)
+    _new_names: list[tuple[int, str]] = field(init=False, default_factory=list)
+    _models_read: dict[int, tuple[str, InferenceSettings]] = field(
+        init=False, default_factory=dict
+    )
+
+    # Preloaded Frames
+    _rows: np.ndarray = field(init=False)  # Row of Each Frame, -1 if Missing
+    _models: np.ndarray = field(init=False)
+    _factors: np.ndarray = field(init=False)
+    _input_factors: np.ndarray = field(init=False)
+    _flags: np.ndarray = field(init=False)
+    _offsets: np.ndarray = field(init=False)  # Parts of Row i: [i, i + 1)
+    _parts: np.ndarray = field(init=False)
+
+    # Open Caches, for Flushing when Stopped
+    _open_caches: ClassVar["weakref.WeakSet[VideoCache]"] = weakref.WeakSet()
 
     def __post_init__(self):
         self._cache_path = self.cache_path / "video_data.db"
 
         self.__ensure_db()
+        self.__preload()
+        VideoCache._open_caches.add(self)
 
     def __ensure_db(self):
-        """Create database schema if missing."""
-        first_time = not self._cache_path.exists()
+        """Create database schema if missing (or outdated)."""
         self._connection = sqlite3.connect(
             str(self._cache_path),
             isolation_level=None,
-        )  # autocommit
-        if first_time:
-            self._connection.execute("""
-                CREATE TABLE frames (
-                    frame INTEGER PRIMARY KEY,
-                    data TEXT
-                );
-            """)
+            check_same_thread=False,  # Used by the detection service's thread
+        )  # autocommit, transactions are opened by `flush()`
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+
+        version = self._connection.execute("PRAGMA user_version").fetchone()
+        if version[0] == SCHEMA_VERSION:
+            return
+
+        self._connection.execute("DROP TABLE IF EXISTS frames")
+        self._connection.execute("DROP TABLE IF EXISTS names")
+        self._connection.execute("""
+            CREATE TABLE names (
+                id INTEGER PRIMARY KEY,
+                name TEXT UNIQUE
+            );
+        """)
+        self._connection.execute("""
+            CREATE TABLE frames (
+                frame INTEGER PRIMARY KEY,
+                model INTEGER,
+                downscale_factor INTEGER,
+                input_factor INTEGER,
+                flags INTEGER,
+                parts BLOB
+            );
+        """)
+        self._connection.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+
+    def __preload(self) -> None:
+        """Reads every cached frame into the arrays, in a single query."""
+        for name_id, name in self._connection.execute(
+            "SELECT id, name FROM names ORDER BY id"
+        ):
+            self._name_ids[name] = name_id
+            self._names.append(name)
+
+        rows = self._connection.execute(
+            "SELECT frame, model, downscale_factor, input_factor, flags, "
+            "parts FROM frames"
+        ).fetchall()
+        count = len(rows)
+
+        frames = np.fromiter((row[0] for row in rows), np.int64, count)
+        self._rows = np.full(
+            int(frames.max()) + 1 if count else 0, -1, dtype=np.int64
+        )
+        self._rows[frames] = np.arange(count)
+        self._models = np.fromiter((row[1] for row in rows), np.int32, count)
+        self._factors = np.fromiter((row[2] for row in rows), np.int32, count)
+        self._input_factors = np.fromiter(
+            (row[3] for row in rows), np.int32, count
+        )
+        self._flags = np.fromiter((row[4] for row in rows), np.int32, count)
+
+        self._parts = np.frombuffer(
+            b"".join(row[5] for row in rows), dtype=PART_DTYPE
+        )
+        self._offsets = np.zeros(count + 1, dtype=np.int64)
+        np.cumsum(
+            np.fromiter(
+                (len(row[5]) // PART_DTYPE.itemsize for row in rows),
+                np.int64,
+                count,
+            ),
+            out=self._offsets[1:],
+        )
 
     # ---------------------
-    # FRAME GET/SET
+    # ENCODING
     # ---------------------
-    def set_frame_data(self, frame_number: int, model: BaseModel):
-        """Store Pydantic model output for a frame."""
-        data_json = model.model_dump_json()
-        self._connection.execute(
-            "INSERT INTO frames(frame, data) VALUES (?, ?) "
-            "ON CONFLICT(frame) DO UPDATE SET data=?",
-            (frame_number, data_json, data_json),
+    def __get_name_id(self, name: str) -> int:
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            name_id = self._name_ids[name] = len(self._names)
+            self._names.append(name)
+            self._new_names.append((name_id, name))
+        return name_id
+
+    def __encode(
+        self, output: AIOutputData
+    ) -> tuple[int, int, int, int, bytes]:
+        parts = np.empty(len(output.output_data), dtype=PART_DTYPE)
+        for index, part in enumerate(output.output_data):
+            parts[index] = (
+                self.__get_name_id(part.label),
+                part.score,
+                part.relative_box,
+            )
+
+        return (
+            self.__get_name_id(
+                output.model_dump_json(include={"model_name", "inference"})
+            ),
+            output.downscale_factor,
+            output.input_factor,
+            FLAG_TILED * output.tiled
+            | FLAG_CROP_REDETECTED * output.crop_redetected
+            | FLAG_SCENE_REUSED * output.scene_reused,
+            parts.tobytes(),
         )
 
-    def get_frame_data(self, frame_number: int) -> AIOutputData:
-        """Retrieve Pydantic output for a given frame."""
-        row = self._connection.execute(
-            "SELECT data FROM frames WHERE frame=?", (frame_number,)
-        ).fetchone()
-        if row:
-            return AIOutputData.model_validate_json(row[0])
-        msg = "Missing Frame Data, this shouldn't happen!"
-        raise ValueError(msg)
+    def __read_model(self, model: int) -> tuple[str, InferenceSettings]:
+        """Reads a model ID, once per model rather than once per frame."""
+        if (read_model := self._models_read.get(model)) is None:
+            data = json.loads(self._names[model])
+            read_model = self._models_read[model] = (
+                data["model_name"],
+                InferenceSettings.model_validate(data["inference"]),
+            )
+        return read_model
 
-    def frame_exists(self, frame_number: int) -> bool:
+    def __decode(
+        self,
+        model: int,
+        downscale_factor: int,
+        input_factor: int,
+        flags: int,
+        parts: np.ndarray,
+    ) -> AIOutputData:
+        names = self._names
+        model_name, inference = self.__read_model(model)
+        return _construct(
+            AIOutputData,
+            {
+                "model_name": model_name,
+                "output_data": [
+                    _construct(
+                        DetectedPartSchema,
+                        {
+                            "label": names[label],
+                            "score": score,
+                            "relative_box": tuple(box),
+                            "part_id": 0,
+                        },
+                    )
+                    for label, score, box in zip(
+                        parts["label"].tolist(),
+                        parts["score"].tolist(),
+                        parts["box"].tolist(),
+                        strict=True,
+                    )
+                ],
+                "downscale_factor": downscale_factor,
+                "input_factor": input_factor,
+                "tiled": bool(flags & FLAG_TILED),
+                "crop_redetected": bool(flags & FLAG_CROP_REDETECTED),
+                "scene_reused": bool(flags & FLAG_SCENE_REUSED),
+                "inference": inference,
+            },
+        )
+
+    def __is_preloaded(self, frame_number: int) -> bool:
         return (
-            self._connection.execute(
-                "SELECT 1 FROM frames WHERE frame=?", (frame_number,)
-            ).fetchone()
-            is not None
+            0 <= frame_number < len(self._rows)
+            and self._rows[frame_number] >= 0
         )
 
+    # ---------------------
+    # FRAME GET/SET
+    # ---------------------
+    def set_frame_data(self, frame_number: int, model: AIOutputData):
+        """Store the detection output for a frame."""
+        with self._lock:
+            self._pending[frame_number] = self.__encode(model)
+            if self.__is_preloaded(frame_number):
+                self._rows[frame_number] = -1  # Replaced
+
+            if (
+                len(self._pending) >= FLUSH_FRAMES
+                or time.monotonic() - self._last_flush >= FLUSH_SECONDS
+            ):
+                self.flush()
+
+    def find_frame_data(self, frame_number: int) -> AIOutputData | None:
+        """
+        Finds the detection output of a frame, this is `frame_exists()` and
+        `get_frame_data()` in one lookup.
+
+        :param int frame_number: Frame number
+        :return AIOutputData | None: Output of the frame, None if missing
+        """
+        with self._lock:
+            if self.__is_preloaded(frame_number):
+                row = int(self._rows[frame_number])
+                return self.__decode(
+                    int(self._models[row]),
+                    int(self._factors[row]),
+                    int(self._input_factors[row]),
+                    int(self._flags[row]),
+                    self._parts[self._offsets[row] : self._offsets[row + 1]],
+                )
+
+            encoded = self._pending.get(frame_number)
+            if encoded is None:  # Written Since Opened
+                encoded = self._connection.execute(
+                    "SELECT model, downscale_factor, input_factor, flags, "
+                    "parts FROM frames WHERE frame=?",
+                    (frame_number,),
+                ).fetchone()
+                if encoded is None:
+                    return None
+
+            model, downscale_factor, input_factor, flags, parts = encoded
+            return self.__decode(
+                model,
+                downscale_factor,
+                input_factor,
+                flags,
+                np.frombuffer(parts, dtype=PART_DTYPE),
+            )
+
+    def get_frame_data(self, frame_number: int) -> AIOutputData:
+        """Retrieve the detection output for a given frame."""
+        output = self.find_frame_data(frame_number)
+        if output is None:
+            msg = "Missing Frame Data, this shouldn't happen!"
+            raise ValueError(msg)
+        return output
+
+    def frame_exists(self, frame_number: int) -> bool:
+        with self._lock:
+            return (
+                self.__is_preloaded(frame_number)
+                or frame_number in self._pending
+                or self._connection.execute(
+                    "SELECT 1 FROM frames WHERE frame=?", (frame_number,)
+                ).fetchone()
+                is not None
+            )
+
+    def flush(self) -> None:
+        """Writes the buffered frames in a single transaction."""
+        with self._lock:
+            if self._pending:
+                self._connection.execute("BEGIN")
+                try:
+                    self._connection.executemany(
+                        "INSERT INTO names(id, name) VALUES (?, ?)",
+                        self._new_names,
+                    )
+                    self._connection.executemany(
+                        "INSERT INTO frames"
+                        "(frame, model, downscale_factor, input_factor, "
+                        "flags, parts) VALUES (?, ?, ?, ?, ?, ?) "
+                        "ON CONFLICT(frame) DO UPDATE SET "
+                        "model=excluded.model, "
+                        "downscale_factor=excluded.downscale_factor, "
+                        "input_factor=excluded.input_factor, "
+                        "flags=excluded.flags, parts=excluded.parts",
+                        (
+                            (frame, *encoded)
+                            for frame, encoded in self._pending.items()
+                        ),
+                    )
+                except BaseException:
+                    self._connection.execute("ROLLBACK")
+                    raise
+                self._connection.execute("COMMIT")
+                self._new_names.clear()
+                self._pending.clear()
+            self._last_flush = time.monotonic()
+
+    @classmethod
+    def flush_all(cls) -> None:
+        """Flushes every open video cache (e.g., at exit)."""
+        for video_cache in list(cls._open_caches):
+            video_cache.flush()
+
     def close(self):
-        self._connection.close()
+        with self._lock:
+            self.flush()
+            self._connection.close()
+            VideoCache._open_caches.discard(self)
+
+
+atexit.register(VideoCache.flush_all)  # Caches Left Open (e.g., on an Error)
@@ -5,9 +5,7 @@ import yaml
 from pydantic import BaseModel
 
 from censor_engine.libs.configs import get_config_path
-from censor_engine.libs.detectors.box_based_detectors.nude_net import (
-    NudeNetDetector,
-)
+from censor_engine.libs.detectors import get_detector_classes
 
 from .development import DevelopmentConfig
 from .file import FileConfig
@@ -63,9 +61,17 @@ class Config(BaseModel):
         )
         merge_settings = censor_settings.get("merge_settings", {})
 
-        # Handle "all" shortcut
+        # Handle "all" shortcut (Every Part of the Chosen Detectors)
         if isinstance(enabled_parts, str) and enabled_parts == "all":
-            enabled_parts = list(NudeNetDetector.model_classifiers)
+            enabled_parts = list(
+                dict.fromkeys(
+                    classifier
+                    for detector_class in get_detector_classes(
+                        AIConfig(**ai_settings).detectors
+                    )
+                    for classifier in detector_class.model_classifiers
+                )
+            )
         elif isinstance(enabled_parts, str):
             enabled_parts = [enabled_parts]
 
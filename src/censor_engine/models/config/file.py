@@ -1,6 +1,6 @@
 from pathlib import Path
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 
 class FileConfig(BaseModel):
@@ -15,8 +15,57 @@ class FileConfig(BaseModel):
     uncensored_folder: Path = Field(default=Path("uncensored"))
     censored_folder: Path = Field(default=Path("censored"))
 
+    detections_folder: Path | None = Field(
+        default=None,
+        description=(
+            "Folder of sidecar detection files (see docs/sidecar_format.md) "
+            "used in place of the detectors, laid out like the uncensored "
+            "folder (e.g., 'uncensored/a/b.mp4' reads "
+            "'[detections_folder]/a/b.mp4.jsonl'). None runs the detectors."
+        ),
+        examples=[None, "detections"],
+    )
+    detections_export_folder: Path | None = Field(
+        default=None,
+        description=(
+            "Folder the sidecar detection files of the censored files are "
+            "written to (laid out like 'detections_folder'), with the "
+            "found parts, the censored boxes, and the track IDs of video "
+            "parts. None doesn't write them. Can't be the "
+            "'detections_folder', as it would overwrite the files being read."
+        ),
+        examples=[None, "detections"],
+    )
+
+    cache_full_hash: bool = Field(
+        default=False,
+        description=(
+            "Checks the cache against a hash of the whole media file, rather "
+            "than its size, modified time, and inode (or a hash of samples "
+            "of it when those changed). Reads every file whole on every run."
+        ),
+        examples=[False, True],
+    )
+
+    incremental_rebuild: bool = Field(
+        default=False,
+        description=(
+            "Skips the files whose censored file is up to date, i.e., the "
+            "input, the config, and the engine version are the same as when "
+            "it was censored (recorded in '.censor_manifest.db' in the "
+            "censored folder). Only changed or new files are censored."
+        ),
+        examples=[False, True],
+    )
+
     # Optional validator for ensuring conversion from str to Path
-    @field_validator("uncensored_folder", "censored_folder", mode="before")
+    @field_validator(
+        "uncensored_folder",
+        "censored_folder",
+        "detections_folder",
+        "detections_export_folder",
+        mode="before",
+    )
     def ensure_path(cls, v):  # noqa: ANN001, N805
         """
         This ensures the paths are Path.
@@ -25,3 +74,19 @@ class FileConfig(BaseModel):
         if isinstance(v, str):
             return Path(v)
         return v
+
+    @model_validator(mode="after")
+    def validate_detection_folders(self) -> "FileConfig":
+        """Writing into the read sidecars would truncate them first."""
+        if (
+            self.detections_folder is not None
+            and self.detections_export_folder is not None
+            and self.detections_folder.resolve()
+            == self.detections_export_folder.resolve()
+        ):
+            msg = (
+                "detections_export_folder can't be the detections_folder, "
+                "the sidecars would be overwritten while being read"
+            )
+            raise ValueError(msg)
+        return self
@@ -1,6 +1,10 @@
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
-from censor_engine.models.enums import MergeMethod
+from censor_engine.models.enums import (
+    InferenceBackend,
+    InferencePrecision,
+    MergeMethod,
+)
 from censor_engine.models.structs.censors import Censor
 
 
@@ -8,11 +12,17 @@ class RenderingConfig(BaseModel):
     """
     This is used to handle the rendering settings of the code.
 
-    # TODO: batch_size
-
     """
 
-    batch_size: int = 4  # TODO: Multi-threading
+    batch_size: int = Field(
+        default=4,
+        ge=1,
+        description=(
+            "Amount of images (or video frames) sent through the detectors "
+            "in a single model call. Higher is faster but uses more memory."
+        ),
+        examples=[1, 4, 16],
+    )
     merge_method: MergeMethod = Field(default=MergeMethod.GROUPS)
 
     @field_validator("merge_method", mode="before")
@@ -31,11 +41,145 @@ class AIConfig(BaseModel):
     """
     This is used for the AI model, just stuff to config it.
 
-    # TODO: ai_model_downscale_factor
-
     """
 
-    ai_model_downscale_factor: int = 1
+    detectors: list[str] = Field(
+        default_factory=lambda: ["NudeNetDetector"],
+        description=(
+            "Detectors (by class name) used to find parts, detectors that "
+            "can't find any of the enabled parts are skipped and never "
+            "loaded."
+        ),
+        examples=[["NudeNetDetector"]],
+    )
+    ai_model_downscale_factor: int = Field(
+        default=1,
+        ge=1,
+        description=(
+            "Factor the image is shrunk by before being sent to the AI "
+            "model(s), the found parts are scaled back up to the full "
+            "resolution. Useful for large images and videos (e.g., 4K) where "
+            "resizing into the model is slow."
+        ),
+        examples=[1, 2, 4],
+    )
+    inference_backend: InferenceBackend = Field(
+        default=InferenceBackend.PYTORCH,
+        description=(
+            "Runtime used for the AI model(s). 'pytorch' uses ultralytics "
+            "(and the GPU if there is one), 'onnx' exports the model once "
+            "and runs it with ONNX Runtime, which is faster on the CPU."
+        ),
+        examples=["pytorch", "onnx"],
+    )
+    inference_threads: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "Amount of CPU threads the AI model(s) can use, 0 leaves it to "
+            "the runtime."
+        ),
+        examples=[0, 4, 8],
+    )
+    inference_precision: InferencePrecision = Field(
+        default=InferencePrecision.FP32,
+        description=(
+            "Precision the AI model(s) run at. 'fp16' and 'int8' are faster "
+            "but less accurate, 'int8' needs the 'onnx' backend and 'fp16' "
+            "only helps on the 'onnx' backend or a GPU. Check the accuracy "
+            "loss with the precision report tool before using them."
+        ),
+        examples=["fp32", "fp16", "int8"],
+    )
+    cascade_models: bool = Field(
+        default=False,
+        description=(
+            "Runs the small NudeNet model (320n) on everything and only runs "
+            "the big model (640m) on images (or frames) the small one is "
+            "unsure about, i.e., an enabled part scored inside the "
+            "uncertainty band, or just below its minimum_score (by less "
+            "than the band's width). Needs the 640m model."
+        ),
+    )
+    cascade_uncertainty_band: tuple[float, float] = Field(
+        default=(0.25, 0.5),
+        description=(
+            "Scores (lower inclusive, upper exclusive) the small model is "
+            "considered unsure at when cascading."
+        ),
+        examples=[(0.25, 0.5), (0.3, 0.6)],
+    )
+
+    tiled_detection: bool = Field(
+        default=False,
+        description=(
+            "Splits images larger than the tile size into overlapping tiles "
+            "which are detected separately (as well as the whole image), "
+            "such that small parts on very large images (e.g., 8K scans, "
+            "webtoon strips) aren't lost when shrunk to the model's size."
+        ),
+    )
+    tile_size: int = Field(
+        default=640,
+        ge=64,
+        description=(
+            "Width and height of the tiles in pixels, best matched to the "
+            "model's input size."
+        ),
+        examples=[320, 640],
+    )
+    tile_overlap: float = Field(
+        default=0.2,
+        ge=0.0,
+        lt=1.0,
+        description=(
+            "Share of a tile that overlaps its neighbours, parts cut by a "
+            "tile's edge are found whole in the next tile."
+        ),
+        examples=[0.1, 0.2, 0.3],
+    )
+
+    @field_validator("inference_backend", mode="before")
+    def validate_inference_backend(cls, v):  # noqa: ANN001, N805
+        """Convert string input to InferenceBackend enum if needed."""
+        if isinstance(v, str):
+            try:
+                return getattr(InferenceBackend, v.upper())
+            except AttributeError:
+                msg = f"Invalid InferenceBackend value: {v}"
+                raise ValueError(msg)  # noqa: B904
+        return v
+
+    @field_validator("inference_precision", mode="before")
+    def validate_inference_precision(cls, v):  # noqa: ANN001, N805
+        """Convert string input to InferencePrecision enum if needed."""
+        if isinstance(v, str):
+            try:
+                return getattr(InferencePrecision, v.upper())
+            except AttributeError:
+                msg = f"Invalid InferencePrecision value: {v}"
+                raise ValueError(msg)  # noqa: B904
+        return v
+
+    @field_validator("cascade_uncertainty_band")
+    def validate_cascade_uncertainty_band(cls, v):  # noqa: ANN001, N805
+        """Ensure the band is ordered and inside 0 to 1."""
+        lower, upper = v
+        if not 0.0 <= lower <= upper <= 1.0:
+            msg = f"Invalid cascade_uncertainty_band: {v}"
+            raise ValueError(msg)
+        return v
+
+    @model_validator(mode="after")
+    def validate_precision_backend(self) -> "AIConfig":
+        """INT8 only exists for the ONNX backend."""
+        if (
+            self.inference_precision == InferencePrecision.INT8
+            and self.inference_backend != InferenceBackend.ONNX
+        ):
+            msg = "inference_precision 'int8' needs inference_backend 'onnx'"
+            raise ValueError(msg)
+        return self
 
 
 class ReverseCensorConfig(BaseModel):
@@ -1,11 +1,12 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+
+from censor_engine.models.enums import KeyframeInterpolation
 
 
 class VideoConfig(BaseModel):
     """
     This config is used to handle the settings for the video pipeline.
 
-    # TODO: censoring_fps
     # TODO: output_fps
     # TODO: persistence_groups
 
@@ -17,14 +18,24 @@ class VideoConfig(BaseModel):
         default=-1,
         ge=-1,
         description=(
-            "NOT: IMPLEMENTED:"
-            "This is the rate that the engine will apply and hold censors "
-            "in length of frames. Useful for reducing processing times "
-            "however the output isn't as good, also 'intense' movement "
-            "can lead to parts being uncensored."
+            "This is the rate (per second) that the engine runs the "
+            "detectors at, the frames in between use the parts of the "
+            "surrounding detected frames (see 'keyframe_interpolation'). "
+            "Useful for reducing processing times however the output isn't "
+            "as good, also 'intense' movement can lead to parts being "
+            "uncensored."
         ),
         examples=[-1, 3, 5, 10, 15],
     )
+    keyframe_interpolation: KeyframeInterpolation = Field(
+        default=KeyframeInterpolation.LINEAR,
+        description=(
+            "How the parts are filled in between the detected frames when "
+            "using 'censoring_fps'. 'linear' moves the boxes between the "
+            "detected frames, 'hold' keeps the parts of the last one."
+        ),
+        examples=["linear", "hold"],
+    )
     output_fps: int = Field(
         default=-1,
         ge=-1,
@@ -36,18 +47,134 @@ class VideoConfig(BaseModel):
         examples=[-1, 3, 5, 10, 15],
     )
 
+    # Two Pass Settings
+    two_pass: bool = Field(
+        default=False,
+        description=(
+            "Detects the whole video first (filling the cache), then censors "
+            "it from the cache. The detection pass keeps no full resolution "
+            "frames and has no masks, styles, or encoder, so it can use "
+            "bigger batches. Changing the censor settings afterwards only "
+            "needs the render pass."
+        ),
+        examples=[False, True],
+    )
+    detection_batch_size: int = Field(
+        default=16,
+        ge=1,
+        description=(
+            "Amount of frames per model call in the detection pass of "
+            "'two_pass' (and the detect only mode)."
+        ),
+        examples=[8, 16, 32],
+    )
+    detection_threads: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "Amount of CPU threads the AI model(s) can use in the detection "
+            "pass of 'two_pass', 0 keeps 'ai_settings.inference_threads'."
+        ),
+        examples=[0, 4, 8],
+    )
+
     # Video Cleaning Settings
     # # Frame Stability Config
     frame_difference_threshold: float = Field(
-        default=0.05,
+        default=0.0,
         ge=0.0,
+        le=1.0,
+        description=(
+            "How different (percent but as a decimal) a frame has to be from "
+            "the last detected frame to be detected again, otherwise it "
+            "reuses that frame's parts. The frames are compared as small "
+            "greyscale thumbnails, which is much cheaper than the AI model. "
+            "'0.0' detects every frame."
+        ),
+        examples=[0.0, 0.02, 0.05],
+    )
+    forced_redetect_frames: int = Field(
+        default=15,
+        ge=1,
         description=(
-            "How much difference (percent but as a decimal) the difference in "
-            "mask area there has to be for the censor to update. This is used "
-            "to avoid issues where the AI model slightly changes causing "
-            "The image to jitter."
+            "How many frames in a row can reuse the parts of the last "
+            "detected frame (see 'frame_difference_threshold') before one is "
+            "detected regardless, which stops small changes from adding up."
         ),
-        examples=[0.0, 0.05, 0.10],
+        examples=[5, 15, 30],
+    )
+
+    # # Crop Re-Detection Config
+    crop_redetection: bool = Field(
+        default=False,
+        description=(
+            "Between full frame detections, only detects padded crops around "
+            "the parts found last, at their own size (up to the model's input "
+            "size) rather than enlarged. Much cheaper for high resolution "
+            "videos where the parts are small compared to the frame, however "
+            "new parts are only found on the full frame detections."
+        ),
+        examples=[False, True],
+    )
+    crop_full_frame_interval: int = Field(
+        default=10,
+        ge=1,
+        description=(
+            "How many detected frames there are per full frame detection "
+            "when using 'crop_redetection'."
+        ),
+        examples=[5, 10, 30],
+    )
+    crop_padding: float = Field(
+        default=0.5,
+        ge=0.0,
+        description=(
+            "How much (percent but as a decimal) of a part's size is added "
+            "to each side of its crop when using 'crop_redetection'."
+        ),
+        examples=[0.25, 0.5, 1.0],
+    )
+
+    # Adaptive Resolution Settings
+    adaptive_resolution: bool = Field(
+        default=False,
+        description=(
+            "Measures the parts found in the first frames of a video (and "
+            "every 'adaptive_recheck_frames' after) as the models see them, "
+            "then detects at the smallest model input size (the model's size "
+            "divided by a factor, up to 'adaptive_maximum_downscale_factor') "
+            "that keeps them above 'adaptive_minimum_part_size'. Close-ups "
+            "are detected at a small input size, wide shots at the full one."
+        ),
+        examples=[False, True],
+    )
+    adaptive_minimum_part_size: int = Field(
+        default=48,
+        ge=1,
+        description=(
+            "Smallest side (in pixels) the parts should keep at the model's "
+            "input when using 'adaptive_resolution'."
+        ),
+        examples=[32, 48, 64],
+    )
+    adaptive_maximum_downscale_factor: int = Field(
+        default=4,
+        ge=1,
+        description=(
+            "Highest factor 'adaptive_resolution' can divide the model's "
+            "input size by."
+        ),
+        examples=[2, 4, 8],
+    )
+    adaptive_recheck_frames: int = Field(
+        default=150,
+        ge=1,
+        description=(
+            "Detected frames between the part size checks of "
+            "'adaptive_resolution', a part found below the minimum size "
+            "also causes a check."
+        ),
+        examples=[60, 150, 300],
     )
 
     # Frame Part Persistence Config
@@ -62,6 +189,17 @@ class VideoConfig(BaseModel):
         ),
         examples=[0.0, 0.5, 1],
     )
+    part_motion_prediction: bool = Field(
+        default=False,
+        description=(
+            "Moves the held parts (see 'part_frame_hold_seconds') along "
+            "their last motion rather than holding them in place, which "
+            "keeps fast moving parts covered. With 'censoring_fps', the "
+            "frames between keyframes are predicted the same way rather than "
+            "interpolated, so they don't wait on the next keyframe."
+        ),
+        examples=[False, True],
+    )
     persistence_groups: list[list[str]] = Field(
         default_factory=list,
         description=(
@@ -71,3 +209,14 @@ class VideoConfig(BaseModel):
         ),
         # examples=[-1, 3, 5, 10, 15],
     )
+
+    @field_validator("keyframe_interpolation", mode="before")
+    def validate_keyframe_interpolation(cls, v):  # noqa: ANN001, N805
+        """Convert string input to KeyframeInterpolation enum if needed."""
+        if isinstance(v, str):
+            try:
+                return getattr(KeyframeInterpolation, v.upper())
+            except AttributeError:
+                msg = f"Invalid KeyframeInterpolation value: {v}"
+                raise ValueError(msg)  # noqa: B904
+        return v
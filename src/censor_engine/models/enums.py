@@ -34,3 +34,19 @@ class MergeMethod(IntEnum):
     PARTS = 3
     FULL = 4
     ALL = 5
+
+
+class InferenceBackend(IntEnum):
+    PYTORCH = 1
+    ONNX = 2
+
+
+class InferencePrecision(IntEnum):
+    FP32 = 1
+    FP16 = 2
+    INT8 = 3
+
+
+class KeyframeInterpolation(IntEnum):
+    LINEAR = 1
+    HOLD = 2
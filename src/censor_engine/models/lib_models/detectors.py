@@ -1,11 +1,17 @@
 from abc import abstractmethod
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, field_validator
 
 from censor_engine.typing import Image
 
+if TYPE_CHECKING:
+    from censor_engine.libs.detectors.preprocessing import (
+        SharedPreprocessing,
+    )
+    from censor_engine.models.config import Config
+
 
 class DetectedPartSchema(BaseModel):
     """
@@ -68,6 +74,11 @@ class Detector(AIModel):
     (maybe logging) and what it's producing (Trust me, it's better than having
     to find NudeNet's repo to find the classifiers).
 
+    Detectors built on letterboxed tensors (e.g., YOLO models) should get
+    them from the `preprocessed` argument of `detect_batch` (with their
+    `InputForm`), such that detectors asking for the same input share it
+    rather than each preparing every frame.
+
     :raises NotImplementedError: This is just to throw an error to ensure the
     model devs know they didn't properly implement the method under the
     correct name
@@ -76,10 +87,38 @@ class Detector(AIModel):
     model_name: str
     model_classifiers: tuple[str, ...]
 
+    def configure(self, config: "Config") -> None:
+        """
+        Applies the settings of the config (e.g., inference backend, thread
+        count) to the model. Detectors that don't support the settings can
+        ignore them.
+
+        :param Config config: Config of the run
+        """
+
+    @property
+    def input_size(self) -> int | None:
+        """
+        Width and height the detector letterboxes the images to, used by
+        `video_settings.adaptive_resolution` to measure the parts as the
+        model sees them. Only asked for after a detection.
+
+        :return int | None: Input size, None if the images aren't resized
+        """
+        return None
+
+    def warmup(self) -> None:
+        """
+        Loads the model ahead of the first detection. Models should be loaded
+        lazily, so this is only needed by long running processes that don't
+        want the first image to pay for it.
+
+        """
+
     @abstractmethod
     def detect_image(
         self,
-        file_images_or_path: str,
+        file_images_or_path: str | Image,
     ) -> list[DetectedPartSchema]:
         raise NotImplementedError
 
@@ -88,6 +127,7 @@ class Detector(AIModel):
         self,
         file_images_or_paths: list[str] | list[Image],
         batch_size: int,
+        preprocessed: "SharedPreprocessing | None" = None,
     ) -> dict[int, list[DetectedPartSchema]]:
         raise NotImplementedError
 
@@ -28,11 +28,12 @@ class Registry:
     def _auto_register(self) -> None:
         module = importlib.import_module(self.package)
         package_dir = Path(module.__file__).parent  # type: ignore
-        for _, module_name, is_package in pkgutil.iter_modules(
+        for _, module_name, is_package in pkgutil.walk_packages(
             [str(package_dir)],
+            prefix=f"{self.package}.",
         ):
             if not is_package:
-                importlib.import_module(f"{self.package}.{module_name}")
+                importlib.import_module(module_name)
         self._loaded = True
 
     def get_all(self) -> dict[str, type]:
@@ -0,0 +1,154 @@
+from collections.abc import Sequence
+
+import numpy as np
+from scipy.optimize import linear_sum_assignment  # type: ignore
+
+"""
+Box maths shared by the detectors and the video tracking, the boxes are
+arrays of (x1, y1, x2, y2) rows.
+
+"""
+
+
+def _intersections_and_areas(
+    boxes_a: np.ndarray,
+    boxes_b: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    boxes_a = np.asarray(boxes_a, dtype=np.float64).reshape(-1, 4)
+    boxes_b = np.asarray(boxes_b, dtype=np.float64).reshape(-1, 4)
+
+    top_left = np.maximum(boxes_a[:, None, :2], boxes_b[None, :, :2])
+    bot_right = np.minimum(boxes_a[:, None, 2:], boxes_b[None, :, 2:])
+    intersection = np.clip(bot_right - top_left, 0, None).prod(axis=2)
+
+    area_a = np.clip(boxes_a[:, 2:] - boxes_a[:, :2], 0, None).prod(axis=1)
+    area_b = np.clip(boxes_b[:, 2:] - boxes_b[:, :2], 0, None).prod(axis=1)
+    return intersection, area_a, area_b
+
+
+def iou_matrix(boxes_a: np.ndarray, boxes_b: np.ndarray) -> np.ndarray:
+    """
+    Works out the IoU (intersection over union) of every box in `boxes_a`
+    against every box in `boxes_b` in one go.
+
+    :param np.ndarray boxes_a: Boxes of shape (N, 4) in XYXY
+    :param np.ndarray boxes_b: Boxes of shape (M, 4) in XYXY
+    :return np.ndarray: IoU of shape (N, M)
+    """
+    intersection, area_a, area_b = _intersections_and_areas(boxes_a, boxes_b)
+    union = area_a[:, None] + area_b[None, :] - intersection
+
+    return np.divide(
+        intersection,
+        union,
+        out=np.zeros_like(intersection),
+        where=union > 0,
+    )
+
+
+def ios_matrix(boxes_a: np.ndarray, boxes_b: np.ndarray) -> np.ndarray:
+    """
+    Works out the IoS (intersection over the smaller box) of every box in
+    `boxes_a` against every box in `boxes_b`. Unlike IoU, a box cut in half
+    still fully overlaps the box it was cut from.
+
+    :param np.ndarray boxes_a: Boxes of shape (N, 4) in XYXY
+    :param np.ndarray boxes_b: Boxes of shape (M, 4) in XYXY
+    :return np.ndarray: IoS of shape (N, M)
+    """
+    intersection, area_a, area_b = _intersections_and_areas(boxes_a, boxes_b)
+    smaller = np.minimum(area_a[:, None], area_b[None, :])
+
+    return np.divide(
+        intersection,
+        smaller,
+        out=np.zeros_like(intersection),
+        where=smaller > 0,
+    )
+
+
+def non_max_suppression(
+    boxes: np.ndarray,
+    scores: np.ndarray,
+    iou_threshold: float,
+    classes: np.ndarray | None = None,
+    max_detections: int | None = None,
+) -> np.ndarray:
+    """
+    Greedy NMS, the highest scoring box is kept and every box overlapping it
+    by more than the threshold is dropped, repeated until none are left.
+
+    If classes are given, boxes only suppress boxes of the same class.
+
+    :param np.ndarray boxes: Boxes of shape (N, 4) in XYXY
+    :param np.ndarray scores: Scores of shape (N,)
+    :param float iou_threshold: IoU above which boxes are suppressed
+    :param np.ndarray | None classes: Class of each box, defaults to None
+        (class agnostic)
+    :param int | None max_detections: Max boxes to keep, defaults to None
+    :return np.ndarray: Indices of the kept boxes, highest score first
+    """
+    boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+    order = np.argsort(-np.asarray(scores), kind="stable")
+    if classes is not None:
+        classes = np.asarray(classes)
+
+    kept: list[int] = []
+    while order.size > 0:
+        index = int(order[0])
+        kept.append(index)
+        if max_detections is not None and len(kept) >= max_detections:
+            break
+
+        rest = order[1:]
+        overlaps = iou_matrix(boxes[index], boxes[rest])[0]
+        suppressed = overlaps > iou_threshold
+        if classes is not None:
+            suppressed &= classes[rest] == classes[index]
+        order = rest[~suppressed]
+
+    return np.array(kept, dtype=int)
+
+
+def xywh_to_xyxy(
+    boxes: np.ndarray | Sequence[tuple[int, int, int, int]],
+) -> np.ndarray:
+    """
+    Converts (x, y, width, height) boxes, like the parts' `relative_box`,
+    into XYXY.
+
+    :param np.ndarray | Sequence boxes: Boxes of shape (N, 4) in XYWH
+    :return np.ndarray: Boxes of shape (N, 4) in XYXY
+    """
+    xyxy = np.array(boxes, dtype=np.float64).reshape(-1, 4)
+    xyxy[:, 2:] += xyxy[:, :2]
+    return xyxy
+
+
+def assign_pairs(
+    scores: np.ndarray,
+    valid: np.ndarray | None = None,
+) -> list[tuple[int, int]]:
+    """
+    Pairs the rows with the columns one to one, with the highest total score
+    (the optimal assignment, see `linear_sum_assignment()`). Pairs that
+    aren't valid are never returned, valid pairs are expected to score above
+    0.
+
+    :param np.ndarray scores: Scores of shape (N, M), e.g., IoU
+    :param np.ndarray | None valid: Which pairs are allowed, of shape (N, M),
+        defaults to None (every pair)
+    :return list[tuple[int, int]]: Row and column of each pair
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    if valid is None:
+        valid = np.ones(scores.shape, dtype=bool)
+
+    rows, columns = linear_sum_assignment(
+        np.where(valid, scores, 0.0), maximize=True
+    )
+    return [
+        (int(row), int(column))
+        for row, column in zip(rows, columns, strict=True)
+        if valid[row, column]
+    ]
@@ -9,6 +9,7 @@ from .utils import ToolDownloader
 
 PATH_TEST_DATA = Path(".test_data")
 PATH_SHORTCUT_UNCENSORED = Path()
+SIDECAR_SUFFIX = ".jsonl"  # Added to the Media File's Name
 
 
 @dataclass(slots=True)
@@ -212,6 +213,29 @@ class PathManager:
 
         return str(final_path)
 
+    def get_sidecar_path(self, file_path: str, sidecar_folder: Path) -> Path:
+        """
+        This is used to get the sidecar detection file of a media file, the
+        sidecar folder is laid out like the uncensored folder.
+
+        :param str file_path: Path of the media file
+        :param Path sidecar_folder: Folder of the sidecar files
+        :return Path: Path of the sidecar file
+        """
+        file_path_object = Path(file_path)
+        try:
+            relative = file_path_object.relative_to(
+                self.get_uncensored_folder()
+            )
+        except ValueError:
+            relative = Path(file_path_object.name)
+
+        return (
+            self.base_directory
+            / sidecar_folder
+            / relative.with_name(f"{relative.name}{SIDECAR_SUFFIX}")
+        )
+
     def get_relative_path(self, file_path: str) -> str:
         """
         This is used to get the relative path of the file.
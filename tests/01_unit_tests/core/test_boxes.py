@@ -0,0 +1,18 @@
+import numpy as np
+
+from censor_engine.models.structs.boxes import assign_pairs
+
+
+def test_pairs_have_the_highest_total_score() -> None:
+    scores = np.array([[0.9, 0.8], [0.85, 0.0]])
+
+    # Greedy would pair (0, 0) and leave row 1 unpaired
+    assert sorted(assign_pairs(scores, scores > 0)) == [(0, 1), (1, 0)]
+
+
+def test_invalid_pairs_are_left_out() -> None:
+    scores = np.array([[0.9, 0.2, 0.1], [0.3, 0.7, 0.4]])
+    valid = np.array([[True, False, True], [False, False, False]])
+
+    assert assign_pairs(scores, valid) == [(0, 0)]
+    assert assign_pairs(np.zeros((0, 3))) == []
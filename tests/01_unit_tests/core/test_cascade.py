@@ -0,0 +1,132 @@
+from typing import Any
+
+import numpy as np
+import pytest
+
+from censor_engine.libs.detectors.box_based_detectors.nude_net import (
+    NudeNetDetector,
+)
+
+
+class FakeModel:
+    def __init__(self, score: float):
+        self.score = score
+        self.calls = 0
+
+    def detect_batch(
+        self,
+        images: list[Any],
+        batch_size: int,  # noqa: ARG002
+        preprocessed: Any = None,  # noqa: ANN401, ARG002
+    ) -> list[list[dict[str, Any]]]:
+        self.calls += len(images)
+        return [
+            [
+                {
+                    "class": "FEMALE_BREAST_EXPOSED",
+                    "score": self.score,
+                    "box": [0, 0, 10, 10],
+                }
+            ]
+            for _ in images
+        ]
+
+
+@pytest.fixture
+def detector(monkeypatch: pytest.MonkeyPatch) -> NudeNetDetector:
+    detector = NudeNetDetector()
+    detector.cascade_band = (0.25, 0.5)
+    detector.minimum_scores = {}
+    monkeypatch.setattr(detector, "cascade_model_object", FakeModel(0.9))
+    return detector
+
+
+def test_confident_parts_stay_on_small_model(
+    detector: NudeNetDetector,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(detector, "model_object", FakeModel(0.7))
+
+    output = detector.detect_batch([np.zeros((8, 8, 3))], batch_size=1)
+
+    assert output[0][0].score == 0.7  # noqa: PLR2004
+    assert detector.cascade_model_object.calls == 0  # type: ignore
+
+
+def test_unsure_parts_escalate(
+    detector: NudeNetDetector,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(detector, "model_object", FakeModel(0.3))
+
+    output = detector.detect_batch([np.zeros((8, 8, 3))] * 2, batch_size=2)
+
+    assert [parts[0].score for parts in output.values()] == [0.9, 0.9]
+    assert detector.cascade_model_object.calls == 2  # type: ignore # noqa: PLR2004
+
+
+def test_minimum_score_escalates(
+    detector: NudeNetDetector,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(detector, "model_object", FakeModel(0.6))
+    detector.minimum_scores = {"FEMALE_BREAST_EXPOSED": 0.65}
+
+    output = detector.detect_batch([np.zeros((8, 8, 3))], batch_size=1)
+
+    assert output[0][0].score == 0.9  # noqa: PLR2004
+
+
+def test_cascade_off_never_escalates(
+    detector: NudeNetDetector,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(detector, "model_object", FakeModel(0.3))
+    detector.cascade_band = None
+
+    output = detector.detect_batch([np.zeros((8, 8, 3))], batch_size=1)
+
+    assert output[0][0].score == 0.3  # noqa: PLR2004
+
+
+def test_parts_far_below_minimum_score_stay_on_small_model(
+    detector: NudeNetDetector,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(detector, "model_object", FakeModel(0.1))
+    detector.minimum_scores = {"FEMALE_BREAST_EXPOSED": 0.65}
+
+    detector.detect_batch([np.zeros((8, 8, 3))], batch_size=1)
+
+    assert detector.cascade_model_object.calls == 0  # type: ignore
+
+
+def test_disabled_parts_never_escalate(
+    detector: NudeNetDetector,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(detector, "model_object", FakeModel(0.3))
+    detector.enabled_parts = frozenset({"FACE_FEMALE"})
+
+    detector.detect_batch([np.zeros((8, 8, 3))], batch_size=1)
+
+    assert detector.cascade_model_object.calls == 0  # type: ignore
+
+
+def test_escalation_rate(detector: NudeNetDetector) -> None:
+    # Confident parts with low scored noise, as found in most frames
+    typical_frame = [
+        {"class": "FEMALE_BREAST_EXPOSED", "score": 0.8, "box": [0] * 4},
+        {"class": "FEMALE_BREAST_EXPOSED", "score": 0.12, "box": [0] * 4},
+        {"class": "FEET_COVERED", "score": 0.3, "box": [0] * 4},
+    ]
+    unsure_frame = [
+        {"class": "FEMALE_BREAST_EXPOSED", "score": 0.35, "box": [0] * 4},
+    ]
+    detector.minimum_scores = {"FEMALE_BREAST_EXPOSED": 0.6}
+    detector.enabled_parts = frozenset({"FEMALE_BREAST_EXPOSED"})
+
+    frames = [typical_frame] * 95 + [unsure_frame] * 5
+    escalated = sum(detector._needs_bigger_model(frame) for frame in frames)  # noqa: SLF001
+
+    assert escalated == 5  # Only the unsure 5%  # noqa: PLR2004
@@ -0,0 +1,47 @@
+from pathlib import Path
+import cv2
+import numpy as np
+
+from censor_engine import CensorEngine
+from censor_engine.models.caching import Cache
+from censor_engine.models.lib_models.detectors import DetectedPartSchema
+from tests.utils import FakeDetectors
+
+
+def test_detect_only_fills_the_cache(
+    fake_detectors: FakeDetectors,
+    tmp_path: Path,
+) -> None:
+    fake_detectors.get_parts = lambda _: [
+        DetectedPartSchema(
+            label="FACE_FEMALE",
+            score=0.9,
+            relative_box=(1, 1, 4, 4),
+        )
+    ]
+
+    uncensored_folder = tmp_path / "uncensored"
+    uncensored_folder.mkdir()
+    for index in range(3):
+        cv2.imwrite(
+            str(uncensored_folder / f"image_{index}.png"),
+            np.full((16, 16, 3), index, dtype=np.uint8),
+        )
+
+    CensorEngine(
+        base_folder=tmp_path,
+        uncensored_folder="uncensored",
+        censored_folder="censored",
+        censor_mode="detect",
+        config_data={},
+    ).start()
+
+    assert len(fake_detectors.detected) == 3  # noqa: PLR2004
+    assert not (tmp_path / "censored").exists()
+    for index in range(3):
+        assert Cache(
+            tmp_path / ".cache",
+            tmp_path,
+            str(uncensored_folder / f"image_{index}.png"),
+            is_video=False,
+        ).check_for_frame(None)
@@ -0,0 +1,44 @@
+import numpy as np
+
+from censor_engine.censor_engine.detection.mapping import (
+    downscale_image,
+    map_parts_to_image,
+)
+from censor_engine.models.lib_models.detectors import DetectedPartSchema
+
+
+def make_part(box: tuple[int, int, int, int]) -> DetectedPartSchema:
+    return DetectedPartSchema(
+        label="FEMALE_BREAST_EXPOSED",
+        score=0.5,
+        relative_box=box,
+    )
+
+
+def test_downscale_image() -> None:
+    image = np.zeros((2160, 3840, 3), dtype=np.uint8)
+
+    assert downscale_image(image, 1) is image
+    assert downscale_image(image, 4).shape == (540, 960, 3)
+
+
+def test_map_parts_to_full_resolution() -> None:
+    parts = [make_part((10, 20, 30, 40))]
+
+    mapped = map_parts_to_image(parts, (4.0, 4.0), (2160, 3840, 3))
+
+    assert mapped[0].relative_box == (40, 80, 120, 160)
+    assert parts[0].relative_box == (10, 20, 30, 40)  # Original untouched
+
+
+def test_map_parts_with_offset_is_clamped() -> None:
+    parts = [make_part((90, 90, 20, 20))]
+
+    mapped = map_parts_to_image(
+        parts,
+        (1.0, 1.0),
+        (200, 200, 3),
+        offset=(100, 100),
+    )
+
+    assert mapped[0].relative_box == (190, 190, 10, 10)
@@ -0,0 +1,84 @@
+import threading
+from typing import Any
+
+import numpy as np
+import pytest
+
+from censor_engine.censor_engine.detection import (
+    DetectionRequest,
+    DetectionService,
+)
+from censor_engine.censor_engine.detection import service as service_module
+
+
+def fake_detect_parts(
+    requests: list[DetectionRequest],
+    config: Any,  # noqa: ANN401, ARG001
+    executor: Any = None,  # noqa: ANN401, ARG001
+    video_state: Any = None,  # noqa: ANN401, ARG001
+    detector_setup: Any = None,  # noqa: ANN401, ARG001
+) -> list[Any]:
+    return [
+        (request.frame, threading.current_thread().name)
+        for request in requests
+    ]
+
+
+@pytest.fixture
+def detection_service(
+    monkeypatch: pytest.MonkeyPatch,
+) -> DetectionService:
+    monkeypatch.setattr(service_module, "detect_parts", fake_detect_parts)
+    return DetectionService()
+
+
+def make_requests(*frames: int) -> list[DetectionRequest]:
+    return [
+        DetectionRequest(np.zeros((4, 4, 3)), frame=frame) for frame in frames
+    ]
+
+
+def test_service_starts_lazily(detection_service: DetectionService) -> None:
+    assert not detection_service.is_running()
+
+    detection_service.detect(make_requests(0), None)  # type: ignore
+
+    assert detection_service.is_running()
+    detection_service.close()
+    assert not detection_service.is_running()
+
+
+def test_futures_resolve_in_order_on_one_thread(
+    detection_service: DetectionService,
+) -> None:
+    futures = [
+        detection_service.submit(make_requests(frame, frame + 1), None)  # type: ignore
+        for frame in range(0, 10, 2)
+    ]
+
+    results = [future.result() for future in futures]
+    detection_service.close()
+
+    assert [frame for result in results for frame, _ in result] == list(
+        range(10)
+    )
+    assert {name for result in results for _, name in result} == {
+        "censor_engine_detection"
+    }
+
+
+def test_errors_reach_the_caller(
+    detection_service: DetectionService,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def broken_detect_parts(*_: Any) -> None:  # noqa: ANN401
+        msg = "Broken model"
+        raise RuntimeError(msg)
+
+    monkeypatch.setattr(service_module, "detect_parts", broken_detect_parts)
+
+    future = detection_service.submit(make_requests(0), None)  # type: ignore
+
+    with pytest.raises(RuntimeError, match="Broken model"):
+        future.result()
+    detection_service.close()
@@ -0,0 +1,53 @@
+from censor_engine.censor_engine.detection.tiling import (
+    merge_duplicate_parts,
+    tile_regions,
+)
+from censor_engine.models.lib_models.detectors import DetectedPartSchema
+
+
+def make_part(
+    box: tuple[int, int, int, int],
+    score: float = 0.5,
+    label: str = "FEMALE_BREAST_EXPOSED",
+) -> DetectedPartSchema:
+    return DetectedPartSchema(label=label, score=score, relative_box=box)
+
+
+def test_small_image_is_one_tile() -> None:
+    assert tile_regions((300, 400, 3), 640, 0.2) == [(0, 0, 400, 300)]
+
+
+def test_tiles_cover_the_image() -> None:
+    tiles = tile_regions((1000, 3000, 3), 640, 0.2)
+
+    assert {tile[2:] for tile in tiles} == {(640, 640)}
+    assert max(x + width for x, _, width, _ in tiles) == 3000  # noqa: PLR2004
+    assert max(y + height for _, y, _, height in tiles) == 1000  # noqa: PLR2004
+
+    # Neighbours Overlap
+    xs = sorted({x for x, _, _, _ in tiles})
+    assert all(b - a < 640 for a, b in zip(xs, xs[1:], strict=False))  # noqa: PLR2004
+
+
+def test_cut_parts_are_merged() -> None:
+    parts = [
+        make_part((500, 100, 140, 100), score=0.6),  # Cut by a tile's edge
+        make_part((500, 100, 200, 100), score=0.8),  # Whole, next tile
+        make_part((500, 100, 200, 100), score=0.9, label="FACE_FEMALE"),
+    ]
+
+    merged = merge_duplicate_parts(parts)
+
+    assert len(merged) == 2  # noqa: PLR2004
+    assert merged[0].label == "FACE_FEMALE"
+    assert merged[1].score == 0.8  # noqa: PLR2004
+    assert merged[1].relative_box == (500, 100, 200, 100)
+
+
+def test_separate_parts_are_kept() -> None:
+    parts = [
+        make_part((0, 0, 100, 100)),
+        make_part((90, 0, 100, 100)),
+    ]
+
+    assert len(merge_duplicate_parts(parts)) == 2  # noqa: PLR2004
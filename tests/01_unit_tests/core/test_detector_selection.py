@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from censor_engine.censor_engine.detection import (
+    DetectionRequest,
+    detect_parts,
+)
+from censor_engine.libs.detectors import (
+    NudeNetDetector,
+    get_enabled_detectors,
+)
+from censor_engine.models.config import Config
+
+
+def make_config(enabled_parts: list[str] | str, **ai_settings) -> Config:  # noqa: ANN003
+    return Config.from_dictionary(
+        {
+            "ai_settings": ai_settings,
+            "censor_settings": {"enabled_parts": enabled_parts},
+        }
+    )
+
+
+def test_detector_with_enabled_parts_is_used() -> None:
+    detectors = get_enabled_detectors(make_config(["FACE_FEMALE"]))
+
+    assert [type(detector) for detector in detectors] == [NudeNetDetector]
+
+
+def test_detectors_are_reused() -> None:
+    config = make_config("all")
+
+    assert get_enabled_detectors(config)[0] is get_enabled_detectors(config)[0]
+
+
+def test_detector_without_enabled_parts_is_skipped() -> None:
+    config = make_config(["NOT_A_NUDE_NET_PART"])
+
+    assert get_enabled_detectors(config) == []
+    assert detect_parts(
+        [DetectionRequest(np.zeros((8, 8, 3), dtype=np.uint8))],
+        config,
+    ) == [[]]
+
+
+def test_unknown_detector_is_an_error() -> None:
+    with pytest.raises(ValueError, match="Unknown detector"):
+        get_enabled_detectors(
+            make_config(["FACE_FEMALE"], detectors=["MissingDetector"])
+        )
@@ -0,0 +1,106 @@
+import os
+import shutil
+from pathlib import Path
+
+import numpy as np
+
+from censor_engine.models.caching import Cache
+from censor_engine.models.caching.caching_schemas import AIOutputData
+from censor_engine.models.caching.fingerprint import (
+    BLOCK_SIZE,
+    SAMPLED_BLOCKS,
+    check_fingerprint,
+    make_fingerprint,
+)
+
+LARGE_SIZE = BLOCK_SIZE * (SAMPLED_BLOCKS + 2) * 4
+
+
+def make_file(path: Path, size: int = LARGE_SIZE) -> Path:
+    path.write_bytes(np.random.default_rng(0).bytes(size))
+    return path
+
+
+def flip_byte(path: Path, position: int) -> None:
+    data = bytearray(path.read_bytes())
+    data[position] ^= 0xFF
+    path.write_bytes(bytes(data))
+
+
+def test_unchanged_file_matches(tmp_path: Path) -> None:
+    media_path = make_file(tmp_path / "video.mp4")
+    fingerprint = make_fingerprint(media_path, full_hash=False)
+
+    assert check_fingerprint(media_path, fingerprint, full_hash=False) == (
+        fingerprint
+    )
+
+
+def test_copied_file_matches_by_sampled_hash(tmp_path: Path) -> None:
+    media_path = make_file(tmp_path / "video.mp4")
+    fingerprint = make_fingerprint(media_path, full_hash=False)
+
+    copy_path = tmp_path / "copy.mp4"
+    shutil.copyfile(media_path, copy_path)
+    os.utime(copy_path, ns=(0, 0))
+    checked = check_fingerprint(copy_path, fingerprint, full_hash=False)
+
+    assert checked is not None
+    assert checked.quick_key.modified_time == 0
+    assert checked.sampled_hash == fingerprint.sampled_hash
+
+
+def test_changed_file_doesnt_match(tmp_path: Path) -> None:
+    media_path = make_file(tmp_path / "video.mp4")
+    fingerprint = make_fingerprint(media_path, full_hash=True)
+
+    # The Head is Always Sampled
+    flip_byte(media_path, 10)
+    assert check_fingerprint(media_path, fingerprint, full_hash=False) is None
+
+
+def test_full_hash_checks_the_whole_file(tmp_path: Path) -> None:
+    media_path = make_file(tmp_path / "video.mp4")
+    fingerprint = make_fingerprint(media_path, full_hash=True)
+
+    # Between the Sampled Blocks
+    flip_byte(media_path, BLOCK_SIZE + 10)
+    os.utime(media_path, ns=(0, 0))
+    assert check_fingerprint(media_path, fingerprint, full_hash=False)
+    assert check_fingerprint(media_path, fingerprint, full_hash=True) is None
+
+
+def test_cache_survives_a_touch(tmp_path: Path) -> None:
+    media_path = make_file(tmp_path / "image.jpg", size=1000)
+    cache_folder = tmp_path / ".cache"
+
+    cache = Cache(cache_folder, tmp_path, str(media_path), is_video=False)
+    cache.save_frame(None, AIOutputData(model_name="test", output_data=[]))
+
+    os.utime(media_path, ns=(0, 0))
+    assert Cache(
+        cache_folder, tmp_path, str(media_path), is_video=False
+    ).check_for_frame(None)
+
+    flip_byte(media_path, 10)
+    assert not Cache(
+        cache_folder, tmp_path, str(media_path), is_video=False
+    ).check_for_frame(None)
+
+
+def test_moved_image_hits_the_cache(tmp_path: Path) -> None:
+    media_path = make_file(tmp_path / "image.jpg", size=1000)
+    cache_folder = tmp_path / ".cache"
+
+    cache = Cache(cache_folder, tmp_path, str(media_path), is_video=False)
+    cache.save_frame(None, AIOutputData(model_name="test", output_data=[]))
+
+    (tmp_path / "moved").mkdir()
+    moved_path = media_path.rename(tmp_path / "moved" / "renamed.jpg")
+    moved_cache = Cache(
+        cache_folder, tmp_path, str(moved_path), is_video=False
+    )
+
+    assert moved_cache.check_for_frame(None)
+    assert moved_cache.get_frame(None).model_name == "test"
+    assert not (cache_folder / "image.jpg").exists()  # No Folder per Image
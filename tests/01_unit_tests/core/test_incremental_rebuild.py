@@ -0,0 +1,128 @@
+from pathlib import Path
+from typing import Any
+
+import cv2
+import numpy as np
+import pytest
+
+from censor_engine import CensorEngine
+from censor_engine.models.caching import manifest as manifest_module
+from censor_engine.models.caching.manifest import (
+    MANIFEST_NAME,
+    RebuildManifest,
+    get_config_hash,
+    get_engine_version,
+)
+from censor_engine.models.config import Config
+from tests.utils import FakeDetectors
+
+
+def run_engine(
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+    config_data: dict[str, Any],
+) -> int:
+    CensorEngine(
+        base_folder=tmp_path,
+        uncensored_folder="uncensored",
+        censored_folder="censored",
+        censor_mode="image",
+        config_data=config_data,
+    ).start()
+    return capsys.readouterr().out.count("Censored: ")
+
+
+@pytest.mark.usefixtures("fake_detectors")
+def test_up_to_date_files_are_skipped(
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    uncensored_folder = tmp_path / "uncensored"
+    uncensored_folder.mkdir()
+    for index in range(3):
+        cv2.imwrite(
+            str(uncensored_folder / f"image_{index}.png"),
+            np.full((16, 16, 3), index, dtype=np.uint8),
+        )
+    config_data = {"file_settings": {"incremental_rebuild": True}}
+
+    assert run_engine(tmp_path, capsys, config_data) == 3  # noqa: PLR2004
+    assert (tmp_path / "censored" / MANIFEST_NAME).exists()
+
+    # Nothing Changed
+    assert run_engine(tmp_path, capsys, config_data) == 0
+
+    # Changed Input, Missing Output
+    cv2.imwrite(
+        str(uncensored_folder / "image_1.png"),
+        np.full((16, 16, 3), 200, dtype=np.uint8),
+    )
+    (tmp_path / "censored" / "image_2.png").unlink()
+    assert run_engine(tmp_path, capsys, config_data) == 2  # noqa: PLR2004
+
+    # Changed Config
+    config_data["video_settings"] = {"censoring_fps": 10}
+    assert run_engine(tmp_path, capsys, config_data) == 3  # noqa: PLR2004
+
+
+def test_manifest_is_closed_on_error(
+    monkeypatch: pytest.MonkeyPatch,
+    fake_detectors: FakeDetectors,
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    fake_detectors.error = RuntimeError("Detection Failed")
+
+    closed: list[RebuildManifest] = []
+    close = RebuildManifest.close
+
+    def recording_close(manifest: RebuildManifest) -> None:
+        closed.append(manifest)
+        close(manifest)
+
+    monkeypatch.setattr(RebuildManifest, "close", recording_close)
+
+    (tmp_path / "uncensored").mkdir()
+    cv2.imwrite(
+        str(tmp_path / "uncensored" / "image.png"),
+        np.zeros((16, 16, 3), dtype=np.uint8),
+    )
+
+    with pytest.raises(RuntimeError, match="Detection Failed"):
+        run_engine(
+            tmp_path, capsys, {"file_settings": {"incremental_rebuild": True}}
+        )
+
+    assert len(closed) == 1
+
+
+def test_config_hash_only_covers_the_output() -> None:
+    config_hash = get_config_hash(Config.from_dictionary({}))
+
+    assert config_hash == get_config_hash(
+        Config.from_dictionary(
+            {
+                "render_settings": {"batch_size": 7},
+                "ai_settings": {"inference_threads": 3},
+                "file_settings": {"detections_export_folder": "exported"},
+                "video_settings": {"detection_threads": 2},
+            }
+        )
+    )
+    assert config_hash != get_config_hash(
+        Config.from_dictionary({"video_settings": {"censoring_fps": 10}})
+    )
+
+
+def test_source_tree_engine_version(monkeypatch: pytest.MonkeyPatch) -> None:
+    def missing_version(name: str) -> str:
+        raise manifest_module.importlib.metadata.PackageNotFoundError(name)
+
+    monkeypatch.setattr(
+        manifest_module.importlib.metadata, "version", missing_version
+    )
+
+    version = get_engine_version()
+
+    assert version.startswith("source-")
+    assert version == get_engine_version()
@@ -0,0 +1,33 @@
+import subprocess
+import sys
+from pathlib import Path
+
+from censor_engine.libs.detectors.box_based_detectors.nude_net import (
+    NudeNetModel,
+)
+
+
+def test_import_does_not_load_torch(tmp_path: Path) -> None:
+    script = tmp_path / "import_check.py"
+    script.write_text(
+        "import sys\n"
+        "import censor_engine\n"
+        "print('torch' in sys.modules, 'ultralytics' in sys.modules)\n"
+    )
+
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, str(script)],
+        check=True,
+        capture_output=True,
+        text=True,
+        cwd=Path.cwd(),
+        env={"PYTHONPATH": str(Path("src").resolve())},
+    )
+
+    assert output.stdout.strip().splitlines()[-1] == "False False"
+
+
+def test_model_is_not_loaded_on_creation() -> None:
+    model = NudeNetModel(use_bigger_model=True)
+
+    assert not model.is_loaded()
@@ -0,0 +1,157 @@
+import threading
+from typing import Any
+
+import numpy as np
+import pytest
+
+from censor_engine.censor_engine.detection.base import run_detectors
+from censor_engine.libs.detectors import preprocessing
+from censor_engine.libs.detectors.preprocessing import (
+    InputForm,
+    SharedPreprocessing,
+    prepare_images,
+)
+from censor_engine.models.lib_models.detectors import DetectedPartSchema
+
+
+class FormDetector:
+    def __init__(self, form: InputForm):
+        self.form = form
+        self.tensor_shapes: list[tuple[int, ...]] = []
+
+    def detect_batch(
+        self,
+        images: list[Any],
+        batch_size: int,  # noqa: ARG002
+        preprocessed: SharedPreprocessing | None = None,
+    ) -> dict[int, list[DetectedPartSchema]]:
+        prepared = preprocessed.get(self.form)  # type: ignore
+        self.tensor_shapes.extend(tensor.shape for _, tensor in prepared.groups)
+        return {index: [] for index in range(len(images))}
+
+
+@pytest.fixture
+def prepare_calls(monkeypatch: pytest.MonkeyPatch) -> list[InputForm]:
+    calls: list[InputForm] = []
+
+    def counting_prepare_images(
+        images: Any,  # noqa: ANN401
+        form: InputForm,
+        scale_up: Any = None,  # noqa: ANN401
+    ) -> Any:  # noqa: ANN401
+        calls.append(form)
+        return prepare_images(images, form, scale_up)
+
+    monkeypatch.setattr(
+        preprocessing, "prepare_images", counting_prepare_images
+    )
+    return calls
+
+
+def make_images(amount: int) -> list[np.ndarray]:
+    return [np.zeros((100, 200, 3), dtype=np.uint8) for _ in range(amount)]
+
+
+def test_same_form_is_prepared_once(prepare_calls: list[InputForm]) -> None:
+    form = InputForm(320, 32)
+    detectors = [FormDetector(form), FormDetector(form)]
+
+    run_detectors(detectors, make_images(2), batch_size=2)  # type: ignore
+
+    assert prepare_calls == [form]
+    assert detectors[0].tensor_shapes == [(2, 3, 160, 320)]
+    assert detectors[1].tensor_shapes == detectors[0].tensor_shapes
+
+
+def test_distinct_forms_are_prepared_separately(
+    prepare_calls: list[InputForm],
+) -> None:
+    detectors = [
+        FormDetector(InputForm(320, 32)),
+        FormDetector(InputForm(640, 32)),
+    ]
+
+    run_detectors(detectors, make_images(1), batch_size=1)  # type: ignore
+
+    assert sorted(prepare_calls, key=lambda form: form.size) == [
+        InputForm(320, 32),
+        InputForm(640, 32),
+    ]
+
+
+def test_concurrent_requests_prepare_once(
+    prepare_calls: list[InputForm],
+) -> None:
+    shared = SharedPreprocessing(make_images(4))
+    form = InputForm(320, 32)
+
+    threads = [
+        threading.Thread(target=shared.get, args=(form,)) for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert prepare_calls == [form]
+
+
+def test_subset_keeps_prepared_forms(prepare_calls: list[InputForm]) -> None:
+    images = make_images(3)
+    images[1] = np.full((100, 200, 3), 255, dtype=np.uint8)
+    shared = SharedPreprocessing(images)
+    form = InputForm(320, 32)
+    prepared = shared.get(form)
+
+    subset = shared.subset([1])
+
+    ((indices, tensor),) = subset.get(form).groups
+    assert indices == [0]
+    assert np.array_equal(tensor, prepared.groups[0][1][[1]])
+    assert prepare_calls == [form]
+
+
+def test_mixed_shapes_are_grouped_by_size() -> None:
+    images = [
+        np.zeros((100, 200, 3), dtype=np.uint8),
+        np.zeros((200, 100, 3), dtype=np.uint8),
+        np.zeros((100, 200, 3), dtype=np.uint8),
+    ]
+
+    prepared = prepare_images(images, InputForm(320, 32))
+
+    assert [
+        (indices, tensor.shape) for indices, tensor in prepared.groups
+    ] == [([0, 2], (2, 3, 160, 320)), ([1], (1, 3, 320, 160))]
+    assert prepared.shapes == [(100, 200), (200, 100), (100, 200)]
+    assert [
+        (indices, tensor.shape) for indices, tensor in prepared.batches(1)
+    ] == [
+        ([0], (1, 3, 160, 320)),
+        ([2], (1, 3, 160, 320)),
+        ([1], (1, 3, 320, 160)),
+    ]
+
+
+def test_small_images_keep_their_size_without_scaling_up() -> None:
+    images = [
+        np.zeros((50, 90, 3), dtype=np.uint8),
+        np.zeros((1000, 2000, 3), dtype=np.uint8),
+    ]
+
+    prepared = prepare_images(images, InputForm(320, 32), [False, False])
+
+    assert [tensor.shape for _, tensor in prepared.groups] == [
+        (1, 3, 64, 96),
+        (1, 3, 160, 320),  # Capped at the form's size
+    ]
+
+
+def test_input_factor_shrinks_the_input() -> None:
+    shared = SharedPreprocessing(make_images(1), input_factor=3)
+
+    (_, tensor), = shared.get(InputForm(320, 32)).groups
+
+    assert InputForm(320, 32).scaled(3) == InputForm(96, 32)
+    assert InputForm(320, 32).scaled(20) == InputForm(32, 32)
+    assert tensor.shape == (1, 3, 64, 96)
@@ -0,0 +1,195 @@
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+
+from censor_engine import CensorEngine
+from censor_engine.censor_engine.detection.sidecar import (
+    SidecarReader,
+    SidecarRecord,
+    read_sidecar_parts,
+)
+from censor_engine.models.config.file import FileConfig
+from censor_engine.models.lib_models.detectors import DetectedPartSchema
+from tests.utils import FakeDetectors
+
+
+def make_record(frame: int | None, x: int) -> str:
+    record = SidecarRecord(
+        frame=frame,
+        parts=[
+            DetectedPartSchema(
+                label="FACE_FEMALE",
+                score=0.9,
+                relative_box=(x, 0, 10, 10),
+            )
+        ],
+    )
+    return record.model_dump_json() + "\n"
+
+
+def test_reader_streams_frames_in_order(tmp_path: Path) -> None:
+    sidecar_path = tmp_path / "video.mp4.jsonl"
+    sidecar_path.write_text(
+        make_record(0, 0) + "\n" + make_record(2, 20) + make_record(5, 50)
+    )
+
+    reader = SidecarReader(sidecar_path)
+    boxes = [
+        [part.relative_box[0] for part in reader.get_parts(frame)]
+        for frame in range(7)
+    ]
+    reader.close()
+
+    assert boxes == [[0], [], [20], [], [], [50], []]
+
+
+def test_image_uses_first_record(tmp_path: Path) -> None:
+    sidecar_path = tmp_path / "image.jpg.jsonl"
+    sidecar_path.write_text(make_record(None, 7))
+
+    (part,) = read_sidecar_parts(sidecar_path)
+
+    assert part.relative_box == (7, 0, 10, 10)
+
+
+def test_missing_sidecar(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        SidecarReader(tmp_path / "missing.jpg.jsonl")
+
+
+def test_engine_reads_sidecar_instead_of_detecting(
+    fake_detectors: FakeDetectors,
+    tmp_path: Path,
+) -> None:
+    (tmp_path / "uncensored").mkdir()
+    image = np.random.default_rng(0).integers(
+        0, 256, (32, 32, 3), dtype=np.uint8
+    )
+    cv2.imwrite(str(tmp_path / "uncensored" / "image.png"), image)
+    (tmp_path / "detections").mkdir()
+    (tmp_path / "detections" / "image.png.jsonl").write_text(
+        make_record(None, 4)
+    )
+
+    CensorEngine(
+        base_folder=tmp_path,
+        uncensored_folder="uncensored",
+        censored_folder="censored",
+        censor_mode="image",
+        config_data={
+            "file_settings": {"detections_folder": "detections"},
+            "censor_settings": {
+                "enabled_parts": ["FACE_FEMALE"],
+                "default_part_settings": {"censors": ["Blur"]},
+            },
+        },
+    ).start()
+
+    output = cv2.imread(str(tmp_path / "censored" / "image.png"))
+    assert (output[5, 9] != image[5, 9]).any()  # Inside the Sidecar's Box
+    assert (output[28:, 28:] == image[28:, 28:]).all()
+    assert fake_detectors.configured == []
+    assert fake_detectors.calls == 0
+
+
+@pytest.mark.usefixtures("fake_detectors")
+def test_engine_exports_sidecar(tmp_path: Path) -> None:
+    (tmp_path / "uncensored").mkdir()
+    cv2.imwrite(
+        str(tmp_path / "uncensored" / "image.png"),
+        np.zeros((64, 64, 3), dtype=np.uint8),
+    )
+    (tmp_path / "detections").mkdir()
+    (tmp_path / "detections" / "image.png.jsonl").write_text(
+        make_record(None, 20)
+    )
+
+    CensorEngine(
+        base_folder=tmp_path,
+        uncensored_folder="uncensored",
+        censored_folder="censored",
+        censor_mode="image",
+        config_data={
+            "file_settings": {
+                "detections_folder": "detections",
+                "detections_export_folder": "exported",
+            },
+            "censor_settings": {
+                "enabled_parts": ["FACE_FEMALE"],
+                "default_part_settings": {"censors": ["Blur"], "margin": 1.0},
+            },
+        },
+    ).start()
+
+    exported_path = tmp_path / "exported" / "image.png.jsonl"
+    (record,) = [
+        SidecarRecord.model_validate_json(line)
+        for line in exported_path.read_text().splitlines()
+    ]
+    assert record.frame is None
+    assert read_sidecar_parts(exported_path)[0].relative_box == (20, 0, 10, 10)
+    (censored_part,) = record.censored_parts
+    assert censored_part.relative_box == (15, -5, 20, 20)
+    assert censored_part.track_id is None
+
+
+def test_sidecar_parts_get_the_detector_ids(
+    fake_detectors: FakeDetectors,
+    tmp_path: Path,
+) -> None:
+    def make_parts() -> list[DetectedPartSchema]:  # Bottom Part First
+        return [
+            DetectedPartSchema(
+                label="FACE_FEMALE", score=0.9, relative_box=(x, y, 8, 8)
+            )
+            for x, y in ((4, 40), (30, 2))
+        ]
+
+    fake_detectors.get_parts = lambda _: make_parts()
+    (tmp_path / "uncensored").mkdir()
+    cv2.imwrite(
+        str(tmp_path / "uncensored" / "image.png"),
+        np.zeros((64, 64, 3), dtype=np.uint8),
+    )
+    (tmp_path / "detections").mkdir()
+    (tmp_path / "detections" / "image.png.jsonl").write_text(
+        SidecarRecord(frame=None, parts=make_parts()).model_dump_json()
+    )
+
+    def export_parts(file_settings: dict[str, str]) -> list[tuple]:
+        CensorEngine(
+            base_folder=tmp_path,
+            uncensored_folder="uncensored",
+            censored_folder="censored",
+            censor_mode="image",
+            config_data={"file_settings": file_settings},
+        ).start()
+        return [
+            (part.part_id, part.relative_box)
+            for part in read_sidecar_parts(
+                tmp_path / file_settings["detections_export_folder"]
+                / "image.png.jsonl"
+            )
+        ]
+
+    detector_parts = export_parts({"detections_export_folder": "detector"})
+    sidecar_parts = export_parts(
+        {
+            "detections_folder": "detections",
+            "detections_export_folder": "sidecar",
+        }
+    )
+
+    assert fake_detectors.calls == 1
+    assert sidecar_parts == detector_parts
+    assert sidecar_parts == [(1, (30, 2, 8, 8)), (2, (4, 40, 8, 8))]
+
+
+def test_export_folder_cannot_be_the_detections_folder() -> None:
+    with pytest.raises(ValueError, match="detections_export_folder"):
+        FileConfig(
+            detections_folder="detections",  # type: ignore
+            detections_export_folder="./detections",  # type: ignore
+        )
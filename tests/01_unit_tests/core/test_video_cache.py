@@ -0,0 +1,133 @@
+import signal
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from censor_engine.censor_engine.video.video_processors import (
+    VideoProcessor,
+    handle_exit,
+)
+from censor_engine.models.caching.caching_schemas import (
+    AIOutputData,
+    InferenceSettings,
+)
+from censor_engine.models.caching.video import FLUSH_FRAMES, VideoCache
+from censor_engine.models.enums import InferencePrecision
+from censor_engine.models.lib_models.detectors import DetectedPartSchema
+
+
+def count_stored_frames(cache_path: Path) -> int:
+    connection = sqlite3.connect(str(cache_path / "video_data.db"))
+    try:
+        return connection.execute("SELECT COUNT(*) FROM frames").fetchone()[0]
+    finally:
+        connection.close()
+
+
+def make_output(frame: int) -> AIOutputData:
+    return AIOutputData(model_name=f"frame_{frame}", output_data=[])
+
+
+def test_frames_are_buffered(tmp_path: Path) -> None:
+    video_cache = VideoCache(tmp_path)
+    video_cache.set_frame_data(0, make_output(0))
+
+    assert count_stored_frames(tmp_path) == 0
+    assert video_cache.frame_exists(0)
+    assert video_cache.get_frame_data(0).model_name == "frame_0"
+
+    video_cache.close()
+    assert count_stored_frames(tmp_path) == 1
+
+
+def test_frames_are_written_in_batches(tmp_path: Path) -> None:
+    video_cache = VideoCache(tmp_path)
+    for frame in range(FLUSH_FRAMES + 1):
+        video_cache.set_frame_data(frame, make_output(frame))
+
+    assert count_stored_frames(tmp_path) == FLUSH_FRAMES
+    video_cache.close()
+
+    reopened_cache = VideoCache(tmp_path)
+    assert reopened_cache.get_frame_data(FLUSH_FRAMES).model_name == (
+        f"frame_{FLUSH_FRAMES}"
+    )
+    reopened_cache.close()
+
+
+def test_flush_all_keeps_open_caches(tmp_path: Path) -> None:
+    video_cache = VideoCache(tmp_path)
+    video_cache.set_frame_data(3, make_output(3))
+
+    VideoCache.flush_all()  # As Done at Exit
+
+    assert count_stored_frames(tmp_path) == 1
+    video_cache.close()
+
+
+def test_stop_signal_does_not_flush(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    monkeypatch.setattr(VideoProcessor, "force_stop", False)
+    video_cache = VideoCache(tmp_path)
+    video_cache.set_frame_data(3, make_output(3))
+
+    # Stopped in the middle of a flush
+    with video_cache._lock:  # noqa: SLF001
+        video_cache._connection.execute("BEGIN")  # noqa: SLF001
+        handle_exit(signal.SIGINT, None)
+        video_cache._connection.execute("COMMIT")  # noqa: SLF001
+
+    assert VideoProcessor.force_stop
+    assert count_stored_frames(tmp_path) == 0
+    video_cache.close()
+    assert count_stored_frames(tmp_path) == 1
+
+
+def test_parts_round_trip(tmp_path: Path) -> None:
+    output = AIOutputData(
+        model_name="nude_net",
+        output_data=[
+            DetectedPartSchema(
+                label="FACE_FEMALE", score=0.75, relative_box=(1, 2, 30, 40)
+            ),
+            DetectedPartSchema(
+                label="FEET_EXPOSED", score=0.5, relative_box=(5, 6, 7, 8)
+            ),
+        ],
+        downscale_factor=2,
+        input_factor=3,
+        crop_redetected=True,
+        scene_reused=True,
+        inference=InferenceSettings(
+            inference_precision=InferencePrecision.FP16,
+            cascade_band=(0.25, 0.5),
+        ),
+    )
+    video_cache = VideoCache(tmp_path)
+    video_cache.set_frame_data(10, output)
+    assert video_cache.get_frame_data(10) == output
+    video_cache.close()
+
+    reopened_cache = VideoCache(tmp_path)  # Preloaded
+    assert reopened_cache.find_frame_data(9) is None
+    assert reopened_cache.find_frame_data(11) is None
+    assert reopened_cache.get_frame_data(10) == output
+
+    reopened_cache.set_frame_data(10, make_output(10))  # Replaced
+    assert reopened_cache.get_frame_data(10).model_name == "frame_10"
+    reopened_cache.close()
+
+
+def test_old_cache_is_rebuilt(tmp_path: Path) -> None:
+    connection = sqlite3.connect(str(tmp_path / "video_data.db"))
+    connection.execute("CREATE TABLE frames (frame INTEGER, data TEXT)")
+    connection.execute("INSERT INTO frames VALUES (0, '{}')")
+    connection.commit()
+    connection.close()
+
+    video_cache = VideoCache(tmp_path)
+    assert not video_cache.frame_exists(0)
+    video_cache.close()
@@ -0,0 +1,172 @@
+from censor_engine.censor_engine.detection.adaptive_resolution import (
+    SAMPLE_FRAMES,
+    AdaptiveResolution,
+)
+from censor_engine.censor_engine.detection.base import (
+    _cache_matches,
+    _get_detection_setup,
+)
+from censor_engine.models.caching.caching_schemas import AIOutputData
+from censor_engine.models.config import Config
+from censor_engine.models.lib_models.detectors import DetectedPartSchema
+
+
+def make_parts(size: int) -> list[DetectedPartSchema]:
+    return [
+        DetectedPartSchema(
+            label="FACE_FEMALE",
+            score=0.9,
+            relative_box=(0, 0, size, size),
+        )
+    ]
+
+
+def make_planner() -> AdaptiveResolution:
+    return AdaptiveResolution(
+        maximum_factor=4,
+        minimum_part_size=50,
+        recheck_interval=10,
+    )
+
+
+def test_close_up_lowers_the_resolution() -> None:
+    planner = make_planner()
+
+    planner.observe([make_parts(160)] * (SAMPLE_FRAMES - 1), 1, 1.0)
+    assert planner.factor == 1  # Still sampling
+
+    planner.observe([make_parts(160)], 1, 1.0)
+    assert planner.factor == 3  # noqa: PLR2004
+
+
+def test_factor_is_capped() -> None:
+    planner = make_planner()
+
+    planner.observe([make_parts(1000)] * SAMPLE_FRAMES, 1, 1.0)
+
+    assert planner.factor == 4  # noqa: PLR2004
+
+
+def test_no_parts_keep_the_base_factor() -> None:
+    planner = make_planner()
+
+    planner.observe([[]] * SAMPLE_FRAMES, 1, 1.0)
+
+    assert planner.factor == 1
+
+
+def test_small_part_triggers_a_recheck() -> None:
+    planner = make_planner()
+    planner.observe([make_parts(200)] * SAMPLE_FRAMES, 1, 1.0)
+    assert planner.factor == 4  # noqa: PLR2004
+
+    # Wide shot, 120 / 4 = 30 px is below the minimum
+    planner.observe([make_parts(120)], 4, 1.0)
+    assert planner.factor == 1
+
+    planner.observe([make_parts(120)] * SAMPLE_FRAMES, 1, 1.0)
+    assert planner.factor == 2  # noqa: PLR2004
+
+
+def test_periodic_recheck() -> None:
+    planner = make_planner()
+    planner.observe([make_parts(200)] * SAMPLE_FRAMES, 1, 1.0)
+
+    planner.observe([make_parts(200)] * 9, 4, 1.0)
+    assert planner.factor == 4  # noqa: PLR2004
+    planner.observe([make_parts(200)], 4, 1.0)
+    assert planner.factor == 1
+
+
+
+def test_batch_is_one_sample() -> None:
+    planner = make_planner()
+
+    # Sampled whole, the extra frames don't count towards the recheck
+    planner.observe([make_parts(160)] * (SAMPLE_FRAMES + 5), 1, 1.0)
+    assert planner.factor == 3  # noqa: PLR2004
+
+    planner.observe([make_parts(160)] * 9, 3, 1.0)
+    assert planner.factor == 3  # noqa: PLR2004
+
+
+def test_batch_is_judged_at_its_factor() -> None:
+    planner = make_planner()
+    planner.observe([make_parts(200)] * SAMPLE_FRAMES, 1, 1.0)
+
+    # Detected at 2 before the factor moved, 120 / 2 = 60 px is fine
+    planner.observe([make_parts(120)], 2, 1.0)
+    assert planner.factor == 4  # noqa: PLR2004
+
+    # Sampling ignores batches not at the full input size
+    planner.observe([make_parts(120)], 4, 1.0)
+    planner.observe([make_parts(1000)] * SAMPLE_FRAMES, 4, 1.0)
+    assert planner.factor == 1
+
+
+def test_parts_are_measured_at_the_model_input() -> None:
+    planner = make_planner()
+
+    # 4K frame into a 640 input, 960 px parts are 160 px to the model
+    planner.observe([make_parts(960)] * SAMPLE_FRAMES, 1, 640 / 3840)
+    assert planner.factor == 3  # noqa: PLR2004
+
+    # 160 / 3 = 53 px is fine, 900 px parts (150 / 3 = 50 px) as well
+    planner.observe([make_parts(900)], 3, 640 / 3840)
+    assert planner.factor == 3  # noqa: PLR2004
+    planner.observe([make_parts(800)], 3, 640 / 3840)
+    assert planner.factor == 1
+
+
+def test_cache_entries_of_adaptive_runs() -> None:
+    adaptive_config = Config.from_dictionary(
+        {"video_settings": {"adaptive_resolution": True}}
+    )
+    fixed_config = Config.from_dictionary({})
+    model_name, _ = _get_detection_setup(fixed_config)
+
+    adaptive_entry = AIOutputData(
+        model_name=model_name,
+        output_data=[],
+        input_factor=3,
+    )
+    full_entry = AIOutputData(model_name=model_name, output_data=[])
+    downscaled_entry = AIOutputData(
+        model_name=model_name, output_data=[], downscale_factor=2
+    )
+
+    assert _cache_matches(adaptive_entry, adaptive_config)
+    assert _cache_matches(full_entry, adaptive_config)
+    assert not _cache_matches(adaptive_entry, fixed_config)
+    assert _cache_matches(full_entry, fixed_config)
+    assert not _cache_matches(
+        adaptive_entry.model_copy(update={"input_factor": 5}), adaptive_config
+    )
+    assert not _cache_matches(downscaled_entry, adaptive_config)
+
+
+def test_cache_entries_of_other_inference_settings() -> None:
+    config = Config.from_dictionary(
+        {"censor_settings": {"enabled_parts": ["FACE_FEMALE"]}}
+    )
+    model_name, inference = _get_detection_setup(config)
+    entry = AIOutputData(
+        model_name=model_name, output_data=[], inference=inference
+    )
+
+    assert model_name == "NudeNet"
+    assert _cache_matches(entry, config)
+    for ai_settings in (
+        {"inference_precision": "int8", "inference_backend": "onnx"},
+        {"cascade_models": True},
+    ):
+        other_config = Config.from_dictionary(
+            {
+                "censor_settings": {"enabled_parts": ["FACE_FEMALE"]},
+                "ai_settings": ai_settings,
+            }
+        )
+        assert not _cache_matches(entry, other_config)
+    assert not _cache_matches(
+        entry.model_copy(update={"model_name": "nude_net"}), config
+    )
@@ -0,0 +1,177 @@
+from typing import Any
+
+import numpy as np
+import pytest
+
+from censor_engine.censor_engine.detection import base as base_module
+from censor_engine.censor_engine.detection.base import (
+    DetectionRequest,
+    _cache_matches,
+    detect_images,
+    detect_parts,
+)
+from censor_engine.censor_engine.detection.crops import (
+    CropRedetector,
+    crop_regions,
+)
+from censor_engine.censor_engine.detection.video_state import (
+    VideoDetectionState,
+)
+from censor_engine.libs.detectors.preprocessing import (
+    InputForm,
+    SharedPreprocessing,
+)
+from censor_engine.models.caching.caching_schemas import AIOutputData
+from censor_engine.models.config import Config
+from censor_engine.models.lib_models.detectors import DetectedPartSchema
+from tests.utils import FakeDetectors
+
+
+def make_part(box: tuple[int, int, int, int]) -> DetectedPartSchema:
+    return DetectedPartSchema(label="FACE_FEMALE", score=0.9, relative_box=box)
+
+
+def test_crops_are_padded_and_clipped() -> None:
+    regions = crop_regions([(10, 20, 40, 20)], (100, 200, 3), 0.5)
+
+    assert regions == [(0, 10, 70, 40)]
+
+
+def test_overlapping_crops_are_joined() -> None:
+    regions = crop_regions(
+        [(10, 10, 20, 20), (35, 10, 20, 20), (150, 150, 10, 10)],
+        (200, 200, 3),
+        0.25,
+    )
+
+    assert regions == [(5, 5, 55, 30), (148, 148, 14, 14)]
+
+
+def test_full_frames_are_detected_periodically() -> None:
+    redetector = CropRedetector(full_frame_interval=3, padding=0.0)
+    frame = np.zeros((100, 100, 3), dtype=np.uint8)
+
+    # Nothing Tracked Yet
+    assert redetector.plan([frame, frame]) == [None, None]
+
+    redetector.update([make_part((10, 10, 20, 20))])
+    assert redetector.plan([frame] * 4) == [
+        [(10, 10, 20, 20)],
+        [(10, 10, 20, 20)],
+        None,
+        [(10, 10, 20, 20)],
+    ]
+
+    redetector.update([])
+    assert redetector.plan([frame]) == [None]
+
+
+def test_crop_parts_are_mapped_to_the_frame(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sizes: list[tuple[int, ...]] = []
+    scale_ups: list[bool] = []
+
+    def fake_run_detectors(
+        detectors: Any,  # noqa: ANN401, ARG001
+        images: list[np.ndarray],
+        batch_size: int,  # noqa: ARG001
+        executor: Any = None,  # noqa: ANN401, ARG001
+        *,
+        scale_up: list[bool] | None = None,
+        input_factor: int = 1,  # noqa: ARG001
+    ) -> list[list[DetectedPartSchema]]:
+        scale_ups.extend(scale_up or [])
+        sizes.extend(image.shape[:2] for image in images)
+        return [[make_part((5, 5, 10, 10))] for _ in images]
+
+    monkeypatch.setattr(base_module, "run_detectors", fake_run_detectors)
+    frames = [np.zeros((400, 400, 3), dtype=np.uint8)] * 2
+
+    found_parts = detect_images(
+        [],
+        frames,
+        Config.from_dictionary({}),
+        crops=[None, [(100, 200, 50, 40), (300, 10, 20, 20)]],
+    )
+
+    assert sizes == [(400, 400), (40, 50), (20, 20)]  # One batch
+    assert scale_ups == [True, False, False]  # Crops keep their size
+    assert [part.relative_box for part in found_parts[0]] == [(5, 5, 10, 10)]
+    assert sorted(part.relative_box for part in found_parts[1]) == [
+        (105, 205, 10, 10),
+        (305, 15, 10, 10),
+    ]
+
+
+def test_crop_entries_need_crop_redetection(
+    fake_detectors: FakeDetectors,
+) -> None:
+    saved: list[AIOutputData] = []
+
+    class RecordingCache:
+        def find_frame(self, frame: int | None) -> None:  # noqa: ARG002
+            return None
+
+        def save_frame(self, frame: int | None, output: AIOutputData) -> None:  # noqa: ARG002
+            saved.append(output)
+
+    fake_detectors.get_parts = lambda _: [make_part((5, 5, 10, 10))]
+    crop_config = Config.from_dictionary(
+        {"video_settings": {"crop_redetection": True}}
+    )
+    cache = RecordingCache()
+    video_state = VideoDetectionState.from_config(crop_config)
+    for frame in range(2):  # Crops are Planned from the Previous Batch
+        detect_parts(
+            [
+                DetectionRequest(
+                    np.zeros((100, 100, 3), dtype=np.uint8),
+                    cache,  # type: ignore
+                    frame,
+                )
+            ],
+            crop_config,
+            video_state=video_state,
+        )
+
+    assert [output.crop_redetected for output in saved] == [False, True]
+    assert _cache_matches(saved[1], crop_config)
+    assert not _cache_matches(saved[1], Config.from_dictionary({}))
+    assert _cache_matches(saved[0], Config.from_dictionary({}))
+
+
+class PixelCountingDetector:
+    def __init__(self) -> None:
+        self.pixels = 0
+
+    def detect_batch(
+        self,
+        images: list[Any],
+        batch_size: int,  # noqa: ARG002
+        preprocessed: SharedPreprocessing | None = None,
+    ) -> dict[int, list[DetectedPartSchema]]:
+        prepared = preprocessed.get(InputForm(320, 32))  # type: ignore
+        self.pixels += sum(tensor.size for _, tensor in prepared.groups)
+        return {index: [] for index in range(len(images))}
+
+
+def test_crops_cost_less_than_the_full_frame() -> None:
+    frame = np.zeros((2160, 3840, 3), dtype=np.uint8)  # 4K
+    config = Config.from_dictionary({})
+    full_frame_detector, crop_detector = (
+        PixelCountingDetector(),
+        PixelCountingDetector(),
+    )
+
+    detect_images([full_frame_detector], [frame], config)  # type: ignore
+    detect_images(
+        [crop_detector],  # type: ignore
+        [frame],
+        config,
+        crops=[
+            [(100, 100, 120, 90), (1500, 900, 100, 120), (3000, 1600, 90, 90)]
+        ],
+    )
+
+    assert 0 < crop_detector.pixels < full_frame_detector.pixels
@@ -0,0 +1,158 @@
+from typing import Any
+
+import numpy as np
+import pytest
+
+from censor_engine.censor_engine.detection.keyframes import (
+    interpolate_parts,
+    keyframe_interval,
+    match_parts,
+)
+from censor_engine.censor_engine.mixin_pipeline_video import (
+    MixinVideoPipeline,
+    PendingFrameBatch,
+    VideoContext,
+)
+from censor_engine.models.config import Config
+from censor_engine.models.enums import KeyframeInterpolation
+from censor_engine.models.lib_models.detectors import DetectedPartSchema
+
+
+def make_part(
+    box: tuple[int, int, int, int],
+    label: str = "FEMALE_BREAST_EXPOSED",
+    score: float = 0.5,
+) -> DetectedPartSchema:
+    return DetectedPartSchema(label=label, score=score, relative_box=box)
+
+
+@pytest.mark.parametrize(
+    ("source_fps", "censoring_fps", "expected"),
+    [
+        (60.0, -1, 1),
+        (60.0, 0, 1),
+        (30.0, 60, 1),
+        (60.0, 15, 4),
+        (29.97, 10, 3),
+    ],
+)
+def test_keyframe_interval(
+    source_fps: float,
+    censoring_fps: int,
+    expected: int,
+) -> None:
+    assert keyframe_interval(source_fps, censoring_fps) == expected
+
+
+def test_parts_match_by_label_and_overlap() -> None:
+    start = [
+        make_part((0, 0, 10, 10)),
+        make_part((100, 100, 10, 10), label="FACE_FEMALE"),
+    ]
+    end = [
+        make_part((102, 102, 10, 10), label="FACE_FEMALE"),
+        make_part((2, 2, 10, 10)),
+        make_part((2, 2, 10, 10), label="FACE_FEMALE"),
+    ]
+
+    assert sorted(match_parts(start, end)) == [(0, 1), (1, 0)]
+
+
+def test_linear_interpolation_moves_boxes() -> None:
+    start = [make_part((0, 0, 10, 10), score=0.4)]
+    end = [make_part((4, 8, 10, 10), score=0.8)]
+
+    parts = interpolate_parts(start, end, 0.25)
+
+    assert [part.relative_box for part in parts] == [(1, 2, 10, 10)]
+    assert parts[0].score == pytest.approx(0.5)
+
+
+def test_unpaired_parts_are_held_until_halfway() -> None:
+    start = [make_part((0, 0, 10, 10))]
+    end = [make_part((500, 500, 10, 10))]
+
+    assert [p.relative_box for p in interpolate_parts(start, end, 0.4)] == [
+        (0, 0, 10, 10)
+    ]
+    assert [p.relative_box for p in interpolate_parts(start, end, 0.6)] == [
+        (500, 500, 10, 10)
+    ]
+
+
+def test_hold_keeps_start_parts() -> None:
+    start = [make_part((0, 0, 10, 10))]
+    end = [make_part((4, 4, 10, 10))]
+
+    parts = interpolate_parts(start, end, 0.9, KeyframeInterpolation.HOLD)
+
+    assert [part.relative_box for part in parts] == [(0, 0, 10, 10)]
+
+
+def test_config_accepts_interpolation_names() -> None:
+    config = Config.from_dictionary(
+        {"video_settings": {"keyframe_interpolation": "hold"}}
+    )
+
+    assert (
+        config.video_settings.keyframe_interpolation
+        == KeyframeInterpolation.HOLD
+    )
+
+
+def test_frames_between_keyframes_are_interpolated_in_order(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    rendered: list[tuple[int, list[tuple[int, int, int, int]]]] = []
+
+    def fake_render_frame(
+        context: Any,  # noqa: ANN401, ARG001
+        frame: Any,  # noqa: ANN401, ARG001
+        frame_counter: int,
+        detection_output: list[DetectedPartSchema],
+    ) -> None:
+        rendered.append(
+            (frame_counter, [part.relative_box for part in detection_output])
+        )
+
+    pipeline = MixinVideoPipeline()
+    monkeypatch.setattr(pipeline, "_render_frame", fake_render_frame)
+
+    test_output = [
+        [make_part((frame_counter * 2, 0, 10, 10))]
+        for frame_counter in range(7)
+    ]
+    context = VideoContext(
+        file_path="video.mp4",
+        main_files_path="",
+        config=Config.from_dictionary({}),
+        debug_level=None,  # type: ignore
+        flags={},
+        path_manager=None,  # type: ignore
+        cache=None,  # type: ignore
+        video_processor=None,  # type: ignore
+        frame_processor=None,  # type: ignore
+        use_persistence=False,
+        detection_service=None,  # type: ignore
+        test_detection_output=test_output,
+        keyframe_interval=4,
+    )
+
+    frames = [
+        (frame_counter, np.zeros((4, 4, 3))) for frame_counter in range(7)
+    ]
+    for start in range(0, 7, 3):
+        pipeline._render_frame_batch(  # noqa: SLF001
+            context, PendingFrameBatch(frames[start : start + 3])
+        )
+    pipeline._render_lookahead(context)  # noqa: SLF001
+
+    assert rendered == [
+        (0, [(0, 0, 10, 10)]),
+        (1, [(2, 0, 10, 10)]),
+        (2, [(4, 0, 10, 10)]),
+        (3, [(6, 0, 10, 10)]),
+        (4, [(8, 0, 10, 10)]),
+        (5, [(8, 0, 10, 10)]),
+        (6, [(8, 0, 10, 10)]),
+    ]
@@ -0,0 +1,142 @@
+import numpy as np
+import pytest
+
+from censor_engine.censor_engine.detection import (
+    DetectionRequest,
+    detect_parts,
+)
+from censor_engine.censor_engine.detection.base import (
+    _cache_matches,
+    _get_detection_setup,
+)
+from censor_engine.censor_engine.detection.scene_gate import (
+    PREVIOUS_PARTS,
+    SceneGate,
+    frame_difference,
+    make_thumbnail,
+)
+from censor_engine.censor_engine.detection.video_state import (
+    VideoDetectionState,
+)
+from censor_engine.models.caching.caching_schemas import AIOutputData
+from censor_engine.models.config import Config
+from censor_engine.models.lib_models.detectors import DetectedPartSchema
+from tests.utils import FakeDetectors
+
+
+def make_frame(value: int) -> np.ndarray:
+    return np.full((90, 160, 3), value, dtype=np.uint8)
+
+
+def test_thumbnail_difference() -> None:
+    thumbnail = make_thumbnail(make_frame(0))
+
+    assert thumbnail.shape == (36, 64)
+    assert frame_difference(thumbnail, thumbnail) == 0.0
+    assert frame_difference(
+        thumbnail, make_thumbnail(make_frame(255))
+    ) == pytest.approx(1.0)
+
+
+def test_gate_compares_against_last_detected_frame() -> None:
+    gate = SceneGate(threshold=0.05, redetect_interval=10)
+
+    # Each frame is a small change, but they add up
+    sources = gate.plan([make_frame(value) for value in (0, 5, 10, 15)])
+
+    assert sources == [0, 0, 0, 3]
+    assert gate.plan([make_frame(18)]) == [PREVIOUS_PARTS]
+
+
+def test_gate_forces_a_detection() -> None:
+    gate = SceneGate(threshold=0.05, redetect_interval=2)
+
+    assert gate.plan([make_frame(0)] * 6) == [0, 0, 0, 3, 3, 3]
+
+
+def get_frame_parts(image: np.ndarray) -> list[DetectedPartSchema]:
+    return [
+        DetectedPartSchema(
+            label="FACE_FEMALE",
+            score=0.9,
+            relative_box=(int(image[0, 0, 0]), 0, 10, 10),
+        )
+    ]
+
+
+def get_detected_values(fake_detectors: FakeDetectors) -> list[int]:
+    return [int(image[0, 0, 0]) for image in fake_detectors.detected]
+
+
+def test_unchanged_frames_reuse_parts(fake_detectors: FakeDetectors) -> None:
+    fake_detectors.get_parts = get_frame_parts
+    config = Config.from_dictionary({})
+    gate = SceneGate(threshold=0.05, redetect_interval=10)
+
+    first = detect_parts(
+        [DetectionRequest(make_frame(value)) for value in (0, 1, 100)],
+        config,
+        video_state=VideoDetectionState(gate),
+    )
+    second = detect_parts(
+        [DetectionRequest(make_frame(101))],
+        config,
+        video_state=VideoDetectionState(gate),
+    )
+
+    assert get_detected_values(fake_detectors) == [0, 100]
+    assert [parts[0].relative_box[0] for parts in first + second] == [
+        0,
+        0,
+        100,
+        100,
+    ]
+    assert first[0][0] is not first[1][0]
+
+
+class RecordingCache:
+    def __init__(self) -> None:
+        self.saved: dict[int | None, AIOutputData] = {}
+
+    def find_frame(self, frame: int | None) -> None:  # noqa: ARG002
+        return None
+
+    def save_frame(self, frame: int | None, output: AIOutputData) -> None:
+        self.saved[frame] = output
+
+
+def test_reused_parts_are_cached_flagged(
+    fake_detectors: FakeDetectors,
+) -> None:
+    fake_detectors.get_parts = get_frame_parts
+    cache = RecordingCache()
+    detect_parts(
+        [
+            DetectionRequest(make_frame(value), cache, frame)  # type: ignore
+            for frame, value in enumerate((0, 1, 100))
+        ],
+        Config.from_dictionary({}),
+        video_state=VideoDetectionState(SceneGate(0.05, 10)),
+    )
+
+    assert get_detected_values(fake_detectors) == [0, 100]
+    assert {
+        frame: output.scene_reused for frame, output in cache.saved.items()
+    } == {0: False, 1: True, 2: False}
+    assert cache.saved[1].output_data == cache.saved[0].output_data
+
+
+def test_reused_entries_need_the_gate() -> None:
+    reused_entry = AIOutputData(
+        model_name=_get_detection_setup(Config.from_dictionary({}))[0],
+        output_data=[],
+        scene_reused=True,
+    )
+
+    assert _cache_matches(
+        reused_entry,
+        Config.from_dictionary(
+            {"video_settings": {"frame_difference_threshold": 0.05}}
+        ),
+    )
+    assert not _cache_matches(reused_entry, Config.from_dictionary({}))
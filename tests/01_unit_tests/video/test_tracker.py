@@ -0,0 +1,149 @@
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from censor_engine.censor_engine.video.frame_processor.structs import (
+    MotionModel,
+    Tracker,
+    _approx_region_matrix,
+)
+from censor_engine.detected_part import Part
+from censor_engine.models.config import Config
+from censor_engine.models.structs.part_areas import PartArea
+
+CONFIG = Config.from_dictionary({"censor_settings": {"enabled_parts": "all"}})
+
+
+def make_part(
+    box: tuple[int, int, int, int],
+    name: str = "FACE_FEMALE",
+) -> Part:
+    return Part(
+        part_name=name,
+        part_id=1,
+        score=0.9,
+        relative_box=box,
+        config=CONFIG,
+        file_uuid=uuid4(),
+        image_shape=(400, 400, 3),
+    )
+
+
+def test_approx_region_matrix_matches_part_area() -> None:
+    rng = np.random.default_rng(0)
+    tracked = rng.integers(0, 100, (30, 4)) + [0, 0, 1, 1]
+    candidates = np.clip(
+        np.repeat(tracked, 3, axis=0) + rng.integers(-15, 15, (90, 4)),
+        [0, 0, 1, 1],
+        None,
+    )
+    percents = rng.uniform(0.1, 1.0, 30)
+
+    expected = np.array(
+        [
+            [
+                PartArea(
+                    tuple(box), percent, (400, 400)
+                ).check_in_approx_region(
+                    PartArea(tuple(candidate), 0.5, (400, 400)).region
+                )
+                for candidate in candidates
+            ]
+            for box, percent in zip(tracked, percents, strict=True)
+        ]
+    )
+
+    assert expected.any()
+    assert np.array_equal(
+        _approx_region_matrix(tracked, percents, candidates), expected
+    )
+
+
+def test_parts_keep_their_track_ids() -> None:
+    tracker = Tracker(max_missed=2)
+    tracker.update_tracker(
+        [make_part((10, 10, 50, 50)), make_part((200, 200, 50, 50))]
+    )
+
+    tracker.update_tracker(
+        [make_part((202, 201, 50, 50)), make_part((11, 10, 50, 50))]
+    )
+
+    assert sorted(
+        (tracked.track_id, tracked.box)
+        for tracked in tracker._tracked_parts  # noqa: SLF001
+    ) == [(0, (11, 10, 50, 50)), (1, (202, 201, 50, 50))]
+
+
+def test_assignment_is_one_to_one() -> None:
+    tracker = Tracker(max_missed=2)
+    tracker.update_tracker([make_part((10, 10, 50, 50))])
+
+    tracker.update_tracker(
+        [make_part((10, 10, 50, 50)), make_part((12, 12, 50, 50))]
+    )
+
+    assert sorted(
+        tracked.track_id
+        for tracked in tracker._tracked_parts  # noqa: SLF001
+    ) == [0, 1]
+
+
+@pytest.mark.parametrize(("frames", "expected"), [(2, 1), (3, 0)])
+def test_missed_parts_expire(frames: int, expected: int) -> None:
+    tracker = Tracker(max_missed=2)
+    tracker.update_tracker([make_part((10, 10, 50, 50))])
+
+    for _ in range(frames):
+        tracker.update_tracker([])
+
+    assert len(tracker.get_parts()) == expected
+
+
+def test_motion_model_predicts_constant_velocity() -> None:
+    motion = MotionModel((0, 0, 20, 20), smoothing=1.0)
+    motion.predict()
+    motion.observe((10, 4, 20, 20))  # 2 frames later
+
+    assert motion.predict() == (15, 6, 20, 20)
+    assert motion.predict() == (20, 8, 20, 20)
+
+
+def test_missed_parts_follow_their_motion() -> None:
+    tracker = Tracker(max_missed=3, use_motion_prediction=True)
+    for x in (10, 20, 30):
+        tracker.update_tracker([make_part((x, 10, 50, 50))])
+
+    tracker.update_tracker([])
+
+    assert [part.relative_box for part in tracker.get_parts()] == [
+        (38, 10, 50, 50)
+    ]
+    assert tracker._tracked_parts[0].misses == 1  # noqa: SLF001
+
+
+def test_predicted_frames_do_not_age_parts() -> None:
+    tracker = Tracker(max_missed=1, use_motion_prediction=True)
+    for x in (10, 20):
+        tracker.update_tracker([make_part((x, 10, 50, 50))])
+
+    for _ in range(3):
+        tracker.predict_frame()
+    tracker.update_tracker([make_part((52, 10, 50, 50))])
+
+    assert [
+        (tracked.track_id, tracked.misses)
+        for tracked in tracker._tracked_parts  # noqa: SLF001
+    ] == [(0, 0)]
+
+
+def test_parts_moving_out_of_frame_are_dropped() -> None:
+    tracker = Tracker(max_missed=100, use_motion_prediction=True)
+    for x in (330, 340):
+        tracker.update_tracker([make_part((x, 10, 50, 50))])
+
+    for _ in range(15):
+        tracker.predict_frame()
+
+    assert tracker.get_parts() == []
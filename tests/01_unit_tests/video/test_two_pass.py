@@ -0,0 +1,139 @@
+import numpy as np
+
+from censor_engine.censor_engine.detection import (
+    DetectionRequest,
+    detect_parts,
+)
+from censor_engine.censor_engine.detection.base import DetectorSetup
+from censor_engine.censor_engine.detection.video_state import (
+    VideoDetectionState,
+)
+from censor_engine.censor_engine.mixin_pipeline_video import (
+    make_detection_pass_config,
+)
+from censor_engine.models.caching.caching_schemas import AIOutputData
+from censor_engine.models.config import Config
+from censor_engine.models.lib_models.detectors import DetectedPartSchema
+from tests.utils import FakeDetectors
+
+
+def test_detection_pass_config() -> None:
+    config = Config.from_dictionary(
+        {
+            "render_settings": {"batch_size": 2},
+            "ai_settings": {"inference_threads": 2},
+            "video_settings": {
+                "detection_batch_size": 32,
+                "detection_threads": 8,
+            },
+        }
+    )
+
+    detection_config = make_detection_pass_config(config)
+
+    assert detection_config.rendering_settings.batch_size == 32  # noqa: PLR2004
+    assert detection_config.ai_settings.inference_threads == 8  # noqa: PLR2004
+    assert config.rendering_settings.batch_size == 2  # noqa: PLR2004
+    assert config.ai_settings.inference_threads == 2  # noqa: PLR2004
+
+
+def test_predownscaled_request_maps_to_original_shape(
+    fake_detectors: FakeDetectors,
+) -> None:
+    fake_detectors.get_parts = lambda _: [
+        DetectedPartSchema(
+            label="FACE_FEMALE",
+            score=0.9,
+            relative_box=(10, 10, 20, 20),
+        )
+    ]
+
+    small_frame = np.zeros((50, 80, 3), dtype=np.uint8)
+    (parts,) = detect_parts(
+        [DetectionRequest(small_frame, original_shape=(100, 160, 3))],
+        Config.from_dictionary({}),
+    )
+
+    assert [image.shape for image in fake_detectors.detected] == [
+        small_frame.shape
+    ]
+    assert parts[0].relative_box == (20, 20, 40, 40)
+
+
+class MemoryCache:
+    def __init__(self) -> None:
+        self.frames: dict[int | None, AIOutputData] = {}
+
+    def find_frame(self, frame: int | None) -> AIOutputData | None:
+        return self.frames.get(frame)
+
+    def save_frame(self, frame: int | None, output: AIOutputData) -> None:
+        self.frames[frame] = output
+
+
+def test_detectors_are_configured_once_per_config(
+    fake_detectors: FakeDetectors,
+) -> None:
+    config = Config.from_dictionary({})
+    detection_config = make_detection_pass_config(config)
+    cache = MemoryCache()
+    detector_setup = DetectorSetup()
+
+    def detect(frames: range, batch_config: Config) -> None:
+        detect_parts(
+            [
+                DetectionRequest(
+                    np.zeros((8, 8, 3), dtype=np.uint8),
+                    cache,  # type: ignore
+                    frame,
+                )
+                for frame in frames
+            ],
+            batch_config,
+            detector_setup=detector_setup,
+        )
+
+    # Detection Pass
+    detect(range(2), detection_config)
+    detect(range(2, 4), detection_config)
+    assert fake_detectors.configured == [detection_config]
+
+    # Render Pass, All Cached
+    detect(range(4), config)
+    assert fake_detectors.configured == [detection_config]
+
+
+def test_render_pass_uses_the_gated_detection_pass(
+    fake_detectors: FakeDetectors,
+) -> None:
+    config = Config.from_dictionary(
+        {"video_settings": {"frame_difference_threshold": 0.05}}
+    )
+    detection_config = make_detection_pass_config(config)
+    cache = MemoryCache()
+
+    def detect(batch_config: Config) -> None:
+        video_state = VideoDetectionState.from_config(batch_config)
+        for start in range(0, 40, 8):
+            detect_parts(
+                [
+                    DetectionRequest(
+                        np.zeros((8, 8, 3), dtype=np.uint8),
+                        cache,  # type: ignore
+                        frame,
+                    )
+                    for frame in range(start, start + 8)
+                ],
+                batch_config,
+                video_state=video_state,
+            )
+
+    # Detection Pass, Static Frames Reuse the Parts
+    detect(detection_config)
+    assert len(fake_detectors.detected) < 40  # noqa: PLR2004
+    assert len(cache.frames) == 40  # noqa: PLR2004
+
+    # Render Pass, All Cached
+    detect_calls = fake_detectors.calls
+    detect(config)
+    assert fake_detectors.calls == detect_calls
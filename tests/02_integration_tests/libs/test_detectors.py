@@ -0,0 +1,126 @@
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+
+from censor_engine.censor_engine.tools.precision_report import (
+    build_precision_report,
+    load_report_images,
+)
+from censor_engine.libs.detectors.box_based_detectors.yolo_backends import (
+    OnnxYoloBackend,
+    TorchYoloBackend,
+)
+from censor_engine.libs.detectors.preprocessing import (
+    letterbox,
+    to_model_tensor,
+)
+from censor_engine.models.enums import InferencePrecision
+from censor_engine.models.structs.boxes import iou_matrix
+
+WEIGHTS_PATH = Path("tools/models/320n.pt")
+REPORT_IMAGES = 6  # Enough to Compare, the Full Set is Slow
+
+pytest.importorskip("onnxruntime")
+pytestmark = pytest.mark.skipif(
+    not WEIGHTS_PATH.exists(),
+    reason="NudeNet weights are missing",
+)
+
+
+@pytest.fixture(scope="module")
+def backends() -> tuple[TorchYoloBackend, OnnxYoloBackend]:
+    return TorchYoloBackend(WEIGHTS_PATH), OnnxYoloBackend(WEIGHTS_PATH)
+
+
+@pytest.fixture(scope="module")
+def report_images() -> list[np.ndarray]:
+    images = load_report_images([])
+    assert len(images) > 1  # Synthetic Image and the Test Data
+    return images[:REPORT_IMAGES]
+
+
+def test_onnx_raw_output_matches_pytorch(
+    backends,  # noqa: ANN001
+    dummy_input_image_data,  # noqa: ANN001
+) -> None:
+    import torch  # noqa: PLC0415
+
+    torch_backend, onnx_backend = backends
+    image = cv2.imread(str(dummy_input_image_data.path))
+    tensor = to_model_tensor(
+        [letterbox(image, onnx_backend.input_size, onnx_backend.stride).image]
+    )
+
+    onnx_output = onnx_backend.session.run(
+        None,
+        {onnx_backend.input_name: tensor},
+    )[0]
+    with torch.no_grad():
+        torch_output = torch_backend.model.model(  # type: ignore
+            torch.from_numpy(tensor),
+        )[0].numpy()
+
+    np.testing.assert_allclose(onnx_output, torch_output, atol=1e-3)
+
+
+def test_onnx_detections_match_pytorch(
+    backends,  # noqa: ANN001
+    dummy_input_image_data,  # noqa: ANN001
+) -> None:
+    torch_backend, onnx_backend = backends
+    image = cv2.imread(str(dummy_input_image_data.path))
+
+    torch_output = torch_backend.predict([image])[0]
+    onnx_output = onnx_backend.predict([image])[0]
+
+    assert len(onnx_output.scores) == len(torch_output.scores)
+    if len(torch_output.scores) == 0:
+        return
+
+    # Every PyTorch Box Needs an ONNX Box (Same Label, Score, and Place)
+    overlaps = iou_matrix(torch_output.xyxy, onnx_output.xyxy)
+    same_label = torch_output.classes[:, None] == onnx_output.classes[None, :]
+    same_score = (
+        np.abs(torch_output.scores[:, None] - onnx_output.scores[None, :])
+        < 1e-2  # noqa: PLR2004
+    )
+    matched = ((overlaps > 0.9) & same_label & same_score).any(axis=1)  # noqa: PLR2004
+
+    assert matched.mean() > 0.9  # noqa: PLR2004
+
+
+def test_fp32_precision_report_has_no_delta(
+    report_images: list[np.ndarray],
+) -> None:
+    report = build_precision_report(
+        report_images,
+        InferencePrecision.FP32,
+        weights_path=WEIGHTS_PATH,
+    )
+
+    assert report.image_count > 1
+    assert report.recall == 1.0
+    assert report.mean_score_delta == 0.0
+
+
+@pytest.mark.parametrize(
+    "precision",
+    [InferencePrecision.FP16, InferencePrecision.INT8],
+)
+def test_reduced_precision_report(
+    report_images: list[np.ndarray],
+    precision: InferencePrecision,
+) -> None:
+    report = build_precision_report(
+        report_images,
+        precision,
+        weights_path=WEIGHTS_PATH,
+    )
+
+    assert report.image_count > 1
+    assert report.reference_parts > 0
+    assert 0.0 <= report.recall <= 1.0
+    assert 0.0 <= report.mean_iou <= 1.0
+    assert "Recall" in report.as_text()
@@ -3,10 +3,11 @@ from collections.abc import Generator
 import cv2
 import pytest
 
+from censor_engine.censor_engine.detection import base as base_module
 from censor_engine.censor_engine.tools.config_previewer.example_image import (
     ImageGenerator,
 )
-from tests.utils import ImageFixtureData
+from tests.utils import FakeDetectors, ImageFixtureData
 
 
 @pytest.fixture
@@ -22,3 +23,13 @@ def dummy_input_image_data(tmp_path) -> Generator[ImageFixtureData]:  # noqa: AN
         generator=image_generator,
         parts=image_generator.parts,
     )  # type: ignore
+
+
+@pytest.fixture
+def fake_detectors(monkeypatch: pytest.MonkeyPatch) -> FakeDetectors:  # noqa: D103
+    detectors = FakeDetectors()
+    monkeypatch.setattr(
+        base_module, "configure_detectors", detectors.configure_detectors
+    )
+    monkeypatch.setattr(base_module, "detect_images", detectors.detect_images)
+    return detectors
@@ -1,6 +1,7 @@
 import inspect
 import re
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
@@ -180,6 +181,37 @@ class ImageFixtureData:
             raise ValueError(msg)
 
 
+@dataclass
+class FakeDetectors:
+    """
+    Stands in for the detectors (see the `fake_detectors` fixture), counting
+    the detection calls and returning `get_parts(image)` for every image.
+    """
+
+    get_parts: Callable[[np.ndarray], list[DetectedPartSchema]] = lambda _: []
+    error: Exception | None = None  # Raised by the Detection Calls
+    calls: int = 0
+    detected: list[np.ndarray] = field(default_factory=list)
+    configured: list[Any] = field(default_factory=list)
+
+    def configure_detectors(self, config: Any) -> list[Any]:  # noqa: ANN401
+        self.configured.append(config)
+        return []
+
+    def detect_images(
+        self,
+        _detectors: Any,  # noqa: ANN401
+        images: list[np.ndarray],
+        *_: Any,  # noqa: ANN401
+        **__: Any,  # noqa: ANN401
+    ) -> list[list[DetectedPartSchema]]:
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        self.detected.extend(images)
+        return [self.get_parts(image) for image in images]
+
+
 def run_image_test(
     dummy_image_data: ImageFixtureData,
     *,